@@ -12,9 +12,14 @@ import numpy as np
 
 from src.primitives.sphere import Sphere
 from src.datatypes.pose import Pose
+from src.scene_object import InstrumentedSceneObject
 from src.utils.hierarchy_profiler import HierarchyProfiler, create_profiling_report
 
 
+class ProfiledSphere(InstrumentedSceneObject, Sphere):
+    """Sphere that records cache statistics (plain scene objects don't)"""
+
+
 def create_test_hierarchy(depth: int, branching: int, name_prefix: str = ""):
     """
     Create a balanced tree hierarchy for testing.
@@ -34,7 +39,7 @@ def create_test_hierarchy(depth: int, branching: int, name_prefix: str = ""):
         )
 
         name = f"{name_prefix}L{level}" if not parent_name else f"{parent_name}_C"
-        node = Sphere(pose=pose, radius=0.5, subdivision=0, name=name)  # subdivision=0 for speed
+        node = ProfiledSphere(pose=pose, radius=0.5, subdivision=0, name=name)  # subdivision=0 for speed
 
         if level < depth:
             for i in range(branching):
@@ -1,7 +1,8 @@
+from . import array_field
 from . import transform
 from . import pose
 from . import scaling
 from . import quaternion
 from . import material
 
-__all__ = ['transform', 'pose', 'scaling', 'quaternion', 'material']
+__all__ = ['array_field', 'transform', 'pose', 'scaling', 'quaternion', 'material']
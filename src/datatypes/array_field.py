@@ -0,0 +1,45 @@
+"""
+Pydantic field type for fixed-size numpy column vectors.
+
+Models validate these fields with their own fast before-validators; the
+annotation only restores what numpydantic's NDArray provided on top of that:
+nested-list JSON dumps and a JSON schema.
+"""
+
+import numpy as np
+from typing import Annotated
+from pydantic import PlainSerializer, WithJsonSchema
+
+
+def _array_to_list(v: np.ndarray) -> list:
+    return v.tolist()
+
+
+def column_array(rows: int):
+    """
+    Annotated ndarray type for a rows x 1 column vector field.
+
+    Args:
+        rows: Number of rows of the column vector
+
+    Returns:
+        Annotated type that dumps to nested lists in JSON mode and describes
+        itself as a rows x 1 number array in the JSON schema
+    """
+    schema = {
+        'type': 'array',
+        'items': {'type': 'array', 'items': {'type': 'number'}, 'minItems': 1, 'maxItems': 1},
+        'minItems': rows,
+        'maxItems': rows,
+    }
+    return Annotated[
+        np.ndarray,
+        PlainSerializer(_array_to_list, return_type=list, when_used='json'),
+        WithJsonSchema(schema),
+    ]
+
+
+# Column vector of a 3D position, rotation vector or scale
+Column3 = column_array(3)
+# Column vector of quaternion components [w, x, y, z]
+Column4 = column_array(4)
@@ -197,7 +197,8 @@ class Material(BaseModel):
         Returns:
             New Material instance with the same properties
         """
-        return Material(
+        # The source is already validated, so skip re-running the validators
+        return Material.model_construct(
             ambient=self.ambient.copy(),
             diffuse=self.diffuse.copy(),
             specular=self.specular.copy(),
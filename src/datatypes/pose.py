@@ -1,36 +1,65 @@
 import numpy as np
 from pydantic import BaseModel, field_validator
 from numpydantic import NDArray
-from typing import Annotated, Optional
+from typing import Optional
+
+from src.datatypes.array_field import Column3
+
+_COLUMN_SHAPE = (3, 1)
+# Bound format of the PoseQuat repr template, so the format string is parsed once
+_POSE_QUAT_REPR_FORMAT = "PoseQuat(t=[{:.3f}, {:.3f}, {:.3f}], q={!r})".format
+
 
 class Pose(BaseModel):
-    translation: Annotated[NDArray, 3]
-    rotation: Annotated[NDArray, 3]
+    # Plain ndarray fields: the shape check below is all the validation needed,
+    # and numpydantic's interface lookup dominated construction time. Column3
+    # keeps JSON dumps and the schema working.
+    translation: Column3
+    rotation: Column3
+
+    class Config:
+        arbitrary_types_allowed = True
 
-    @field_validator('translation', 'rotation')
+    @field_validator('translation', 'rotation', mode='before')
     @classmethod
     def check_3d_arrays(cls, v):
-        if not isinstance(v, np.ndarray) or v.shape != (3, 1):
+        if v.__class__ is np.ndarray and v.shape == _COLUMN_SHAPE:
+            return v
+        if not isinstance(v, np.ndarray):
+            try:
+                v = np.asarray(v)
+            except ValueError:
+                raise ValueError("Each element muss be a three dimensional numpy array!")
+        if v.shape == (3,):
+            # Flat vectors are stored as the column vectors the transforms expect
+            v = v.reshape(3, 1)
+        elif v.shape != (3, 1):
             raise ValueError("Each element muss be a three dimensional numpy array!")
         return v
 
     def get_translation(self) -> NDArray:
         return self.translation
 
-    def get_translation_as_homogeneous(self) -> NDArray:
-        translation = self.get_translation()
-        return np.array([[translation[0, 0]], [translation[1, 0]], [translation[2, 0]], [1.0]])
+    def get_translation_as_homogeneous(self, out: Optional[np.ndarray] = None) -> NDArray:
+        homogeneous = np.empty((4, 1)) if out is None else out
+        homogeneous[:3] = self.translation
+        homogeneous[3] = 1.0
+        return homogeneous
 
     def get_rotation(self) -> NDArray:
         return self.rotation
 
     def set_translation(self, translation: NDArray) -> None:
-        if translation.shape != (3, 1):
+        if translation.shape == (3,):
+            translation = translation.reshape(3, 1)
+        elif translation.shape != (3, 1):
             raise ValueError("Translation must be a three dimensional numpy array!")
         self.translation = translation
 
     def set_rotation(self, rotation: NDArray) -> None:
-        if rotation.shape != (3, 1):
+        if rotation.shape == (3,):
+            rotation = rotation.reshape(3, 1)
+        elif rotation.shape != (3, 1):
             raise ValueError("Rotation must be a three dimensional numpy array!")
         self.rotation = rotation
 
@@ -40,6 +69,15 @@ class Pose(BaseModel):
     def r(self) -> NDArray:
         return self.get_rotation()
 
+    def is_identity(self) -> bool:
+        """
+        Check whether this pose neither translates nor rotates.
+
+        Returns:
+            True if translation and rotation are both zero
+        """
+        return not (self.translation.any() or self.rotation.any())
+
     def to_pose_quat(self) -> 'PoseQuat':
         """
         Convert this axis-angle pose to a quaternion-based pose.
@@ -66,16 +104,22 @@ class PoseQuat(BaseModel):
         translation: 3x1 position vector
         quaternion: Quaternion representing rotation
     """
-    translation: Annotated[NDArray, 3]
+    translation: Column3
     quaternion: 'Quaternion'
 
     class Config:
         arbitrary_types_allowed = True
 
-    @field_validator('translation')
+    @field_validator('translation', mode='before')
     @classmethod
     def check_translation(cls, v):
-        if not isinstance(v, np.ndarray) or v.shape != (3, 1):
+        if not isinstance(v, np.ndarray):
+            # Nested lists, e.g. from model_validate_json
+            try:
+                v = np.asarray(v, dtype=float)
+            except (TypeError, ValueError):
+                raise ValueError("Translation must be a 3x1 numpy array!")
+        if v.shape != _COLUMN_SHAPE:
             raise ValueError("Translation must be a 3x1 numpy array!")
         return v
 
@@ -146,10 +190,20 @@ class PoseQuat(BaseModel):
         """Get translation vector"""
         return self.translation
 
-    def get_translation_as_homogeneous(self) -> NDArray:
-        """Get translation as homogeneous 4x1 vector"""
-        translation = self.get_translation()
-        return np.array([[translation[0, 0]], [translation[1, 0]], [translation[2, 0]], [1.0]])
+    def get_translation_as_homogeneous(self, out: Optional[np.ndarray] = None) -> NDArray:
+        """
+        Get translation as homogeneous 4x1 vector.
+
+        Args:
+            out: Optional preallocated 4x1 array to write the result into
+
+        Returns:
+            4x1 homogeneous translation (``out`` if it was given)
+        """
+        homogeneous = np.empty((4, 1)) if out is None else out
+        homogeneous[:3] = self.translation
+        homogeneous[3] = 1.0
+        return homogeneous
 
     def get_quaternion(self) -> 'Quaternion':
         """Get rotation quaternion"""
@@ -190,13 +244,11 @@ class PoseQuat(BaseModel):
         Returns:
             4x4 homogeneous transformation matrix
         """
-        # Get rotation matrix from quaternion
-        R = self.quaternion.to_rotation_matrix()
-
-        # Build 4x4 transformation matrix
-        T = np.eye(4)
-        T[0:3, 0:3] = R
+        # Write the rotation straight into the upper-left block of one allocation
+        T = np.empty((4, 4))
+        self.quaternion.to_rotation_matrix(out=T[0:3, 0:3])
         T[0:3, 3:4] = self.translation
+        T[3] = (0.0, 0.0, 0.0, 1.0)
 
         return T
 
@@ -228,5 +280,4 @@ class PoseQuat(BaseModel):
         return PoseQuat(translation=interp_translation, quaternion=interp_quat)
 
     def __repr__(self) -> str:
-        t = self.translation.flatten()
-        return f"PoseQuat(t=[{t[0]:.3f}, {t[1]:.3f}, {t[2]:.3f}], q={self.quaternion})"
\ No newline at end of file
+        return _POSE_QUAT_REPR_FORMAT(*self.translation.ravel().tolist(), self.quaternion)
\ No newline at end of file
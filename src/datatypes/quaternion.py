@@ -13,9 +13,49 @@ where w is the scalar part and (x, y, z) is the vector part.
 
 import numpy as np
 import math
+from functools import lru_cache
 from typing import Tuple, Optional
 from pydantic import BaseModel, field_validator
-from numpydantic import NDArray, Shape
+
+from src.datatypes.array_field import Column4
+from src.datatypes.transform import col3
+
+
+# Components of the identity rotation; copied into each identity quaternion
+_IDENTITY_DATA = np.array([[1.0], [0.0], [0.0], [0.0]])
+_IDENTITY_DATA.flags.writeable = False
+
+# Bound format of the repr template, so the format string is parsed once
+_REPR_FORMAT = "Quaternion(w={:.4f}, x={:.4f}, y={:.4f}, z={:.4f})".format
+
+
+@lru_cache(maxsize=1024)
+def _axis_angle_data(x: float, y: float, z: float, angle: float) -> Optional[np.ndarray]:
+    """
+    Compute the quaternion components of an axis-angle rotation.
+
+    Cached because the same few axes and angles recur (animation keys, test
+    fixtures); callers copy the read-only result.
+
+    Args:
+        x: Axis x component
+        y: Axis y component
+        z: Axis z component
+        angle: Rotation angle in radians
+
+    Returns:
+        Read-only 4x1 [w, x, y, z] array, or None if the axis has zero length
+    """
+    axis_norm = math.sqrt(x*x + y*y + z*z)
+    if axis_norm < 1e-10:
+        return None
+
+    half_angle = angle / 2.0
+    scale = math.sin(half_angle) / axis_norm
+
+    data = np.array((math.cos(half_angle), x * scale, y * scale, z * scale)).reshape(4, 1)
+    data.flags.writeable = False
+    return data
 
 
 class Quaternion(BaseModel):
@@ -29,14 +69,22 @@ class Quaternion(BaseModel):
     Unit quaternions (||q|| = 1) represent rotations.
     """
 
-    data: NDArray[Shape["4, 1"], float]
+    # Plain ndarray field checked by validate_shape; numpydantic's interface
+    # lookup cost several times more than the quaternion math itself.
+    # Column4 keeps JSON dumps and the schema working.
+    data: Column4
 
     class Config:
         arbitrary_types_allowed = True
 
-    @field_validator('data')
+    @field_validator('data', mode='before')
+    @classmethod
     def validate_shape(cls, v):
-        """Ensure quaternion is 4x1"""
+        """Ensure quaternion is a 4x1 float array"""
+        if not isinstance(v, np.ndarray):
+            v = np.asarray(v)
+        if v.dtype.kind != 'f':
+            raise ValueError(f"Quaternion must hold floats, got {v.dtype}")
         if v.shape != (4, 1):
             raise ValueError(f"Quaternion must be 4x1, got {v.shape}")
         return v
@@ -52,7 +100,7 @@ class Quaternion(BaseModel):
             z: k component
         """
         if 'data' not in kwargs:
-            data = np.array([[w], [x], [y], [z]], dtype=float)
+            data = np.array((w, x, y, z), dtype=float).reshape(4, 1)
             super().__init__(data=data)
         else:
             super().__init__(**kwargs)
@@ -67,7 +115,8 @@ class Quaternion(BaseModel):
     @classmethod
     def identity(cls) -> 'Quaternion':
         """Create identity quaternion (no rotation)"""
-        return cls(w=1.0, x=0.0, y=0.0, z=0.0)
+        # The constant is known to be valid, so skip the field validation
+        return cls.model_construct(data=_IDENTITY_DATA.copy())
 
     @classmethod
     def from_axis_angle(cls, axis: np.ndarray, angle: float) -> 'Quaternion':
@@ -81,23 +130,41 @@ class Quaternion(BaseModel):
         Returns:
             Quaternion representing the rotation
         """
-        axis = axis.flatten()
-        axis_norm = np.linalg.norm(axis)
+        x, y, z = axis.ravel().tolist()
+        data = _axis_angle_data(x, y, z, float(angle))
 
-        if axis_norm < 1e-10:
+        if data is None:
             # Zero rotation
             return cls.identity()
 
-        axis = axis / axis_norm
-        half_angle = angle / 2.0
-        sin_half = math.sin(half_angle)
+        # The cached components are valid and shared, so copy without validating
+        return cls.model_construct(data=data.copy())
 
-        return cls(
-            w=math.cos(half_angle),
-            x=axis[0] * sin_half,
-            y=axis[1] * sin_half,
-            z=axis[2] * sin_half
-        )
+    @staticmethod
+    def from_axis_angle_batch(axes: np.ndarray, angles: np.ndarray) -> np.ndarray:
+        """
+        Compute quaternions for many axis-angle rotations at once.
+
+        Args:
+            axes: (N, 3) array of rotation axes (will be normalized)
+            angles: (N,) array of rotation angles in radians
+
+        Returns:
+            (N, 4) array with one [w, x, y, z] row per rotation; rows with a
+            zero axis are the identity
+        """
+        axes = np.asarray(axes, dtype=np.float64)
+        half_angles = 0.5 * np.asarray(angles, dtype=np.float64)
+
+        norms = np.sqrt(np.einsum('ij,ij->i', axes, axes))
+        valid = norms >= 1e-10
+        scale = np.zeros_like(norms)
+        np.divide(np.sin(half_angles), norms, out=scale, where=valid)
+
+        result = np.empty((len(axes), 4))
+        result[:, 0] = np.where(valid, np.cos(half_angles), 1.0)
+        np.multiply(axes, scale[:, None], out=result[:, 1:])
+        return result
 
     @classmethod
     def from_axis_angle_vector(cls, axis_angle: np.ndarray) -> 'Quaternion':
@@ -110,14 +177,14 @@ class Quaternion(BaseModel):
         Returns:
             Quaternion representing the rotation
         """
-        axis_angle = axis_angle.flatten()
-        angle = np.linalg.norm(axis_angle)
+        x, y, z = axis_angle.ravel().tolist()
+        angle = math.sqrt(x*x + y*y + z*z)
 
         if angle < 1e-10:
             return cls.identity()
 
-        axis = axis_angle / angle
-        return cls.from_axis_angle(axis, angle)
+        # The axis is normalized by _axis_angle_data, so pass it unscaled
+        return cls.model_construct(data=_axis_angle_data(x, y, z, angle).copy())
 
     @classmethod
     def from_euler(cls, roll: float, pitch: float, yaw: float) -> 'Quaternion':
@@ -146,6 +213,37 @@ class Quaternion(BaseModel):
             z=cr * cp * sy - sr * sp * cy
         )
 
+    @staticmethod
+    def from_euler_batch(roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray) -> np.ndarray:
+        """
+        Compute quaternions for many Euler angle triples at once (XYZ convention).
+
+        Args:
+            roll: (N,) rotations around X-axis (radians)
+            pitch: (N,) rotations around Y-axis (radians)
+            yaw: (N,) rotations around Z-axis (radians)
+
+        Returns:
+            (N, 4) array with one [w, x, y, z] row per rotation
+        """
+        half_roll = 0.5 * np.asarray(roll, dtype=np.float64)
+        half_pitch = 0.5 * np.asarray(pitch, dtype=np.float64)
+        half_yaw = 0.5 * np.asarray(yaw, dtype=np.float64)
+        cr, sr = np.cos(half_roll), np.sin(half_roll)
+        cp, sp = np.cos(half_pitch), np.sin(half_pitch)
+        cy, sy = np.cos(half_yaw), np.sin(half_yaw)
+
+        # Shared products of the closed form
+        cp_cy, sp_sy = cp * cy, sp * sy
+        sp_cy, cp_sy = sp * cy, cp * sy
+
+        result = np.empty((len(half_roll), 4))
+        result[:, 0] = cr * cp_cy + sr * sp_sy
+        result[:, 1] = sr * cp_cy - cr * sp_sy
+        result[:, 2] = cr * sp_cy + sr * cp_sy
+        result[:, 3] = cr * cp_sy - sr * sp_cy
+        return result
+
     def to_axis_angle(self) -> Tuple[np.ndarray, float]:
         """
         Convert quaternion to axis-angle representation.
@@ -171,7 +269,7 @@ class Quaternion(BaseModel):
             # No rotation or 360° rotation
             axis = np.array([[0], [0], [1]])
         else:
-            axis = np.array([[x], [y], [z]]) / sin_half
+            axis = col3(x, y, z) / sin_half
 
         return axis, angle
 
@@ -182,31 +280,55 @@ class Quaternion(BaseModel):
         Returns:
             3x1 array where direction is axis and magnitude is angle
         """
-        axis, angle = self.to_axis_angle()
-        return axis * angle
+        # Same result as to_axis_angle() scaled, without building the unit axis:
+        # the vector part divided by its length is the axis, and
+        # atan2(|v|, w) = acos(w / |q|) is the half angle
+        w, x, y, z = self.data.ravel().tolist()
+        v_norm = math.sqrt(x*x + y*y + z*z)
+        norm = math.sqrt(w*w + v_norm*v_norm)
+        if norm < 1e-10:
+            return col3(0.0, 0.0, 0.0)
+
+        angle = 2.0 * math.atan2(v_norm, w)
+        if v_norm < 1e-10 * norm:
+            # No rotation or 360° rotation
+            return col3(0.0, 0.0, angle)
 
-    def to_rotation_matrix(self) -> np.ndarray:
+        scale = angle / v_norm
+        return col3(x * scale, y * scale, z * scale)
+
+    def to_rotation_matrix(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Convert quaternion to 3x3 rotation matrix.
 
+        Args:
+            out: Optional preallocated 3x3 array (or view) to write the result into
+
         Returns:
-            3x3 rotation matrix
+            3x3 rotation matrix (``out`` if it was given)
         """
-        w, x, y, z = self.w, self.x, self.y, self.z
+        w, x, y, z = self.data.ravel().tolist()
 
         # Normalize quaternion
-        norm = math.sqrt(w*w + x*x + y*y + z*z)
-        if norm < 1e-10:
-            return np.eye(3)
-
-        w, x, y, z = w/norm, x/norm, y/norm, z/norm
-
-        # Convert to rotation matrix
-        return np.array([
-            [1 - 2*(y*y + z*z),     2*(x*y - w*z),     2*(x*z + w*y)],
-            [    2*(x*y + w*z), 1 - 2*(x*x + z*z),     2*(y*z - w*x)],
-            [    2*(x*z - w*y),     2*(y*z + w*x), 1 - 2*(x*x + y*y)]
-        ])
+        norm_sq = w*w + x*x + y*y + z*z
+        if norm_sq < 1e-20:
+            if out is None:
+                return np.eye(3)
+            out[...] = np.eye(3)
+            return out
+
+        # Scaling the products by 2/|q|² normalizes without dividing each component
+        s = 2.0 / norm_sq
+        xx, yy, zz = x*x*s, y*y*s, z*z*s
+        xy, xz, yz = x*y*s, x*z*s, y*z*s
+        wx, wy, wz = w*x*s, w*y*s, w*z*s
+
+        if out is None:
+            out = np.empty((3, 3))
+        out[0] = (1.0 - (yy + zz), xy - wz, xz + wy)
+        out[1] = (xy + wz, 1.0 - (xx + zz), yz - wx)
+        out[2] = (xz - wy, yz + wx, 1.0 - (xx + yy))
+        return out
 
     def to_euler(self) -> Tuple[float, float, float]:
         """
@@ -215,7 +337,7 @@ class Quaternion(BaseModel):
         Returns:
             Tuple of (roll, pitch, yaw) in radians
         """
-        w, x, y, z = self.w, self.x, self.y, self.z
+        w, x, y, z = self.data.ravel().tolist()
 
         # Roll (X-axis)
         sinr_cosp = 2 * (w * x + y * z)
@@ -236,6 +358,15 @@ class Quaternion(BaseModel):
 
         return roll, pitch, yaw
 
+    def as_array(self) -> np.ndarray:
+        """
+        Components as a flat array
+
+        Returns:
+            (4,) view of [w, x, y, z]
+        """
+        return self.data.ravel()
+
     @property
     def w(self) -> float:
         """Scalar part"""
@@ -263,10 +394,28 @@ class Quaternion(BaseModel):
         Returns:
             Normalized quaternion
         """
-        norm = math.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
-        if norm < 1e-10:
+        w, x, y, z = self.data.ravel().tolist()
+        norm_sq = w*w + x*x + y*y + z*z
+        if norm_sq < 1e-20:
             return Quaternion.identity()
-        return Quaternion.from_array(self.data / norm)
+        # One reciprocal square root, then multiplications only
+        inv_norm = 1.0 / math.sqrt(norm_sq)
+        return Quaternion(w=w*inv_norm, x=x*inv_norm, y=y*inv_norm, z=z*inv_norm)
+
+    def fast_renormalize(self) -> 'Quaternion':
+        """
+        Return a renormalized copy of a quaternion that is already close to unit length.
+
+        Uses the first-order approximation 1/sqrt(n) ~ (3 - n) / 2, which is accurate
+        only near n = 1. Meant for removing the drift that builds up when unit
+        quaternions are composed repeatedly; use normalize() for arbitrary quaternions.
+
+        Returns:
+            Approximately normalized quaternion
+        """
+        w, x, y, z = self.data.ravel().tolist()
+        scale = 0.5 * (3.0 - (w*w + x*x + y*y + z*z))
+        return Quaternion(w=w*scale, x=x*scale, y=y*scale, z=z*scale)
 
     def conjugate(self) -> 'Quaternion':
         """
@@ -275,7 +424,8 @@ class Quaternion(BaseModel):
         Returns:
             Conjugate quaternion q* = w - xi - yj - zk
         """
-        return Quaternion(w=self.w, x=-self.x, y=-self.y, z=-self.z)
+        w, x, y, z = self.data.ravel().tolist()
+        return Quaternion(w=w, x=-x, y=-y, z=-z)
 
     def inverse(self) -> 'Quaternion':
         """
@@ -284,12 +434,13 @@ class Quaternion(BaseModel):
         Returns:
             Inverse quaternion q^-1
         """
-        norm_sq = self.w**2 + self.x**2 + self.y**2 + self.z**2
+        w, x, y, z = self.data.ravel().tolist()
+        norm_sq = w*w + x*x + y*y + z*z
         if norm_sq < 1e-10:
             return Quaternion.identity()
 
-        conj = self.conjugate()
-        return Quaternion.from_array(conj.data / norm_sq)
+        inv = 1.0 / norm_sq
+        return Quaternion(w=w * inv, x=-x * inv, y=-y * inv, z=-z * inv)
 
     def __mul__(self, other: 'Quaternion') -> 'Quaternion':
         """
@@ -301,8 +452,9 @@ class Quaternion(BaseModel):
         Returns:
             Product quaternion self * other
         """
-        w1, x1, y1, z1 = self.w, self.x, self.y, self.z
-        w2, x2, y2, z2 = other.w, other.x, other.y, other.z
+        # Unpack the packed components once instead of per property access
+        w1, x1, y1, z1 = self.data.ravel().tolist()
+        w2, x2, y2, z2 = other.data.ravel().tolist()
 
         return Quaternion(
             w=w1*w2 - x1*x2 - y1*y2 - z1*z2,
@@ -321,15 +473,44 @@ class Quaternion(BaseModel):
         Returns:
             Rotated 3x1 vector
         """
-        vector = vector.flatten()
+        w, x, y, z = self.data.ravel().tolist()
+        vx, vy, vz = vector.ravel().tolist()
+
+        # Expanded form of v' = q * v * q*, without building quaternions:
+        # v' = (w² - u·u) v + 2 (u·v) u + 2w (u × v) with u = (x, y, z)
+        a = w*w - (x*x + y*y + z*z)
+        b = 2.0 * (x*vx + y*vy + z*vz)
+        c = 2.0 * w
+
+        return col3(
+            a*vx + b*x + c*(y*vz - z*vy),
+            a*vy + b*y + c*(z*vx - x*vz),
+            a*vz + b*z + c*(x*vy - y*vx)
+        )
 
-        # Create quaternion from vector
-        v_quat = Quaternion(w=0.0, x=vector[0], y=vector[1], z=vector[2])
+    def rotate_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Rotate many 3D vectors using this quaternion.
 
-        # Rotate: v' = q * v * q*
-        result = self * v_quat * self.conjugate()
+        Args:
+            vectors: (N, 3) array with one vector per row
 
-        return np.array([[result.x], [result.y], [result.z]])
+        Returns:
+            (N, 3) array of rotated vectors
+        """
+        w, x, y, z = self.data.ravel().tolist()
+        vectors = np.asarray(vectors, dtype=np.float64)
+        vx, vy, vz = vectors[:, 0], vectors[:, 1], vectors[:, 2]
+
+        # Same expansion as rotate_vector, with the cross product written out
+        # per component instead of calling np.cross
+        b = 2.0 * (x*vx + y*vy + z*vz)
+        rotated = vectors * (w*w - (x*x + y*y + z*z))
+        c = 2.0 * w
+        rotated[:, 0] += b*x + c*(y*vz - z*vy)
+        rotated[:, 1] += b*y + c*(z*vx - x*vz)
+        rotated[:, 2] += b*z + c*(x*vy - y*vx)
+        return rotated
 
     def dot(self, other: 'Quaternion') -> float:
         """
@@ -341,10 +522,37 @@ class Quaternion(BaseModel):
         Returns:
             Dot product
         """
-        return self.w * other.w + self.x * other.x + self.y * other.y + self.z * other.z
+        w1, x1, y1, z1 = self.data.ravel().tolist()
+        w2, x2, y2, z2 = other.data.ravel().tolist()
+        return w1*w2 + x1*x2 + y1*y2 + z1*z2
+
+    @staticmethod
+    def mul_batch(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+        """
+        Hamilton products of many quaternion pairs at once.
+
+        Args:
+            p: (N, 4) array of [w, x, y, z] rows (left factors)
+            q: (N, 4) array of [w, x, y, z] rows (right factors); a single
+               (4,) row is broadcast against all of p
+
+        Returns:
+            (N, 4) array with the rows of p * q
+        """
+        p = np.asarray(p, dtype=np.float64)
+        q = np.asarray(q, dtype=np.float64)
+        w1, x1, y1, z1 = p[..., 0], p[..., 1], p[..., 2], p[..., 3]
+        w2, x2, y2, z2 = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+
+        result = np.empty(np.broadcast_shapes(p.shape, q.shape))
+        result[..., 0] = w1*w2 - x1*x2 - y1*y2 - z1*z2
+        result[..., 1] = w1*x2 + x1*w2 + y1*z2 - z1*y2
+        result[..., 2] = w1*y2 - x1*z2 + y1*w2 + z1*x2
+        result[..., 3] = w1*z2 + x1*y2 - y1*x2 + z1*w2
+        return result
 
     def __repr__(self) -> str:
-        return f"Quaternion(w={self.w:.4f}, x={self.x:.4f}, y={self.y:.4f}, z={self.z:.4f})"
+        return _REPR_FORMAT(*self.data.ravel().tolist())
 
 
 def slerp(q1: Quaternion, q2: Quaternion, t: float) -> Quaternion:
@@ -394,6 +602,47 @@ def slerp(q1: Quaternion, q2: Quaternion, t: float) -> Quaternion:
     return result.normalize()
 
 
+def slerp_batch(q1: Quaternion, q2: Quaternion, ts: np.ndarray) -> np.ndarray:
+    """
+    Spherical Linear Interpolation between two quaternions at many parameters.
+
+    Gives the same rotations as calling slerp() once per parameter, but the
+    dot product, shorter-path flip and angle are computed only once.
+
+    Args:
+        q1: Start quaternion
+        q2: End quaternion
+        ts: (N,) interpolation parameters, clamped to [0, 1]
+
+    Returns:
+        (N, 4) array with one normalized [w, x, y, z] row per parameter
+    """
+    ts = np.clip(np.asarray(ts, dtype=np.float64), 0.0, 1.0)
+    start = q1.data.ravel()
+    end = q2.data.ravel()
+
+    # Take the shorter path
+    dot = q1.dot(q2)
+    if dot < 0.0:
+        end = -end
+        dot = -dot
+
+    if dot > 0.9995:
+        # Quaternions are very close, use linear interpolation
+        s1 = 1.0 - ts
+        s2 = ts
+    else:
+        theta_0 = math.acos(min(dot, 1.0))
+        sin_theta_0 = math.sin(theta_0)
+        s1 = np.sin((1.0 - ts) * theta_0) / sin_theta_0
+        s2 = np.sin(ts * theta_0) / sin_theta_0
+
+    result = np.outer(s1, start)
+    result += np.outer(s2, end)
+    result /= np.sqrt(np.einsum('ij,ij->i', result, result))[:, None]
+    return result
+
+
 def lerp(q1: Quaternion, q2: Quaternion, t: float) -> Quaternion:
     """
     Linear interpolation between two quaternions.
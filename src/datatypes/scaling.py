@@ -1,7 +1,8 @@
-import numpy as np
 from pydantic import BaseModel, field_validator
 from numpydantic import NDArray
 
+from src.datatypes.transform import col3
+
 
 class Scaling(BaseModel):
     x: float
@@ -16,7 +17,7 @@ class Scaling(BaseModel):
         return v
 
     def get_scaling(self) -> NDArray:
-        return np.array([[self.x],[self.y],[self.z]])
+        return col3(self.x, self.y, self.z)
 
     def set_scaling(self, scaling: NDArray) -> None:
         if scaling.shape != (3, 1):
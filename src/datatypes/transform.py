@@ -13,6 +13,31 @@ import math
 from typing import Optional
 
 
+# Read-only templates; functions hand out copies because callers may write to
+# the returned matrices
+_IDENTITY3 = np.eye(3)
+_IDENTITY3.flags.writeable = False
+_IDENTITY4 = np.eye(4)
+_IDENTITY4.flags.writeable = False
+
+
+def col3(x: float, y: float, z: float) -> np.ndarray:
+    """
+    Build a 3x1 float column vector from three scalars.
+
+    Faster than np.array([[x], [y], [z]]), which has to parse nested lists.
+
+    Args:
+        x: First component
+        y: Second component
+        z: Third component
+
+    Returns:
+        3x1 float64 numpy array
+    """
+    return np.array((x, y, z), dtype=np.float64).reshape(3, 1)
+
+
 def axis_angle_to_rotation_matrix(axis_angle: np.ndarray) -> np.ndarray:
     """
     Convert axis-angle representation to a 3x3 rotation matrix.
@@ -30,32 +55,33 @@ def axis_angle_to_rotation_matrix(axis_angle: np.ndarray) -> np.ndarray:
         >>> rot = np.array([[0], [0], [np.pi/2]])
         >>> R = axis_angle_to_rotation_matrix(rot)
     """
-    # Flatten to 1D array for easier handling
-    r = axis_angle.flatten()
+    x, y, z = axis_angle.ravel().tolist()
 
     # Calculate angle (magnitude of rotation vector)
-    angle = np.linalg.norm(r)
+    angle = math.sqrt(x*x + y*y + z*z)
 
     # If angle is zero, return identity matrix
     if angle < 1e-10:
-        return np.eye(3)
+        return _IDENTITY3.copy()
 
     # Normalize to get axis
-    axis = r / angle
-
-    # Rodrigues' formula: R = I + sin(θ)K + (1-cos(θ))K²
-    # where K is the skew-symmetric cross-product matrix
-    K = np.array([
-        [0, -axis[2], axis[1]],
-        [axis[2], 0, -axis[0]],
-        [-axis[1], axis[0], 0]
+    kx, ky, kz = x / angle, y / angle, z / angle
+
+    # Rodrigues' formula R = I + sin(θ)K + (1-cos(θ))K², written out per entry
+    # so the trig is evaluated once and no 3x3 temporaries are built
+    c = math.cos(angle)
+    s = math.sin(angle)
+    C = 1.0 - c
+    xC, yC, zC = kx * C, ky * C, kz * C
+    xs, ys, zs = kx * s, ky * s, kz * s
+    xyC, xzC, yzC = kx * yC, kx * zC, ky * zC
+
+    return np.array([
+        [c + kx * xC, xyC - zs, xzC + ys],
+        [xyC + zs, c + ky * yC, yzC - xs],
+        [xzC - ys, yzC + xs, c + kz * zC]
     ])
 
-    # Compute rotation matrix
-    R = np.eye(3) + math.sin(angle) * K + (1 - math.cos(angle)) * (K @ K)
-
-    return R
-
 
 def translation_to_matrix(translation: np.ndarray) -> np.ndarray:
     """
@@ -75,7 +101,7 @@ def translation_to_matrix(translation: np.ndarray) -> np.ndarray:
         >>> #      [0, 0, 1, 3],
         >>> #      [0, 0, 0, 1]]
     """
-    T = np.eye(4)
+    T = _IDENTITY4.copy()
     T[0:3, 3:4] = translation
     return T
 
@@ -95,7 +121,7 @@ def rotation_to_matrix(rotation: np.ndarray) -> np.ndarray:
         >>> R = rotation_to_matrix(rot)
     """
     R_3x3 = axis_angle_to_rotation_matrix(rotation)
-    R_4x4 = np.eye(4)
+    R_4x4 = _IDENTITY4.copy()
     R_4x4[0:3, 0:3] = R_3x3
     return R_4x4
 
@@ -119,7 +145,7 @@ def scaling_to_matrix(scaling) -> np.ndarray:
         >>> #      [0, 0, 1, 0],
         >>> #      [0, 0, 0, 1]]
     """
-    S = np.eye(4)
+    S = _IDENTITY4.copy()
 
     if scaling is not None:
         scale_vec = scaling.get_scaling()
@@ -132,7 +158,8 @@ def scaling_to_matrix(scaling) -> np.ndarray:
 
 def compose_transform(translation: np.ndarray,
                       rotation: np.ndarray,
-                      scaling=None) -> np.ndarray:
+                      scaling=None,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Compose a complete 4x4 transformation matrix from translation, rotation, and scaling.
 
@@ -146,9 +173,10 @@ def compose_transform(translation: np.ndarray,
         translation: 3x1 numpy array [x, y, z]
         rotation: 3x1 numpy array (axis-angle representation)
         scaling: Scaling object or None for identity scaling
+        out: Optional preallocated 4x4 float64 array to write the result into
 
     Returns:
-        4x4 transformation matrix
+        4x4 transformation matrix (``out`` if it was given)
 
     Example:
         >>> from src.datatypes.pose import Pose
@@ -160,25 +188,71 @@ def compose_transform(translation: np.ndarray,
         >>> scaling = Scaling(x=2.0, y=1.0, z=1.0)
         >>> M = compose_transform(pose.translation, pose.rotation, scaling)
     """
-    # Build individual matrices
-    T = translation_to_matrix(translation)
-    R = rotation_to_matrix(rotation)
-    S = scaling_to_matrix(scaling)
+    if out is None:
+        out = np.empty((4, 4))
+
+    # Fill the result directly instead of multiplying T, R and S:
+    # T × R × S is [R·diag(s) | t] over [0 0 0 1]
+    out[0:3, 0:3] = axis_angle_to_rotation_matrix(rotation)
+    if scaling is not None:
+        out[0:3, 0:3] *= (scaling.x, scaling.y, scaling.z)
+    out[0:3, 3] = translation.ravel()
+    out[3] = (0.0, 0.0, 0.0, 1.0)
+    return out
+
+
+def propagate_world_transforms(parents: np.ndarray,
+                               locals_: np.ndarray,
+                               worlds: np.ndarray) -> np.ndarray:
+    """
+    Compute world transforms for a flattened hierarchy.
+
+    Nodes must be in topological order (every parent index is smaller than the
+    indices of its children). All nodes of one depth level are multiplied in a
+    single batched matmul, so the number of Python-level steps grows with the
+    depth of the hierarchy instead of its node count.
+
+    Args:
+        parents: (N,) integer array of parent indices, -1 for roots
+        locals_: (N, 4, 4) array of local transformation matrices
+        worlds: (N, 4, 4) array the world transformations are written into
+
+    Returns:
+        The ``worlds`` array
+
+    Example:
+        >>> parents = np.array([-1, 0, 1], dtype=np.int32)
+        >>> worlds = propagate_world_transforms(parents, locals_, np.empty_like(locals_))
+    """
+    is_root = parents < 0
+    worlds[is_root] = locals_[is_root]
+
+    # Depth of every node, settled one level per iteration
+    parent_idx = np.where(is_root, 0, parents)
+    depth = np.zeros(len(parents), dtype=np.int32)
+    while True:
+        new_depth = np.where(is_root, 0, depth[parent_idx] + 1)
+        if np.array_equal(new_depth, depth):
+            break
+        depth = new_depth
 
-    # Compose in order: T × R × S
-    return T @ R @ S
+    for level in range(1, int(depth.max(initial=0)) + 1):
+        idx = np.flatnonzero(depth == level)
+        worlds[idx] = np.matmul(worlds[parents[idx]], locals_[idx])
+    return worlds
 
 
-def pose_to_matrix(pose, scaling=None) -> np.ndarray:
+def pose_to_matrix(pose, scaling=None, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Convert a Pose object (and optional Scaling) to a 4x4 transformation matrix.
 
     Args:
         pose: Pose object with translation and rotation
         scaling: Optional Scaling object
+        out: Optional preallocated 4x4 float64 array to write the result into
 
     Returns:
-        4x4 transformation matrix
+        4x4 transformation matrix (``out`` if it was given)
 
     Example:
         >>> from src.datatypes.pose import Pose
@@ -191,7 +265,8 @@ def pose_to_matrix(pose, scaling=None) -> np.ndarray:
     return compose_transform(
         pose.get_translation(),
         pose.get_rotation(),
-        scaling
+        scaling,
+        out=out
     )
 
 
@@ -208,7 +283,7 @@ def decompose_matrix(matrix: np.ndarray) -> tuple:
         Tuple of (translation, rotation_matrix, scale) where:
         - translation: 3x1 numpy array
         - rotation_matrix: 3x3 numpy array
-        - scale: 3x1 numpy array [sx, sy, sz]
+        - scale: 3x1 numpy array [sx, sy, sz]; sx is negative for mirroring matrices
 
     Warning:
         Converting rotation matrix back to axis-angle is not implemented yet.
@@ -221,15 +296,17 @@ def decompose_matrix(matrix: np.ndarray) -> tuple:
     upper_left = matrix[0:3, 0:3]
 
     # Extract scale (length of each column vector)
-    scale_x = np.linalg.norm(upper_left[:, 0])
-    scale_y = np.linalg.norm(upper_left[:, 1])
-    scale_z = np.linalg.norm(upper_left[:, 2])
-    scale = np.array([[scale_x], [scale_y], [scale_z]])
+    (a, b, c), (d, e, f), (g, h, i) = upper_left.tolist()
+    scale_x = math.sqrt(a*a + d*d + g*g)
+    scale_y = math.sqrt(b*b + e*e + h*h)
+    scale_z = math.sqrt(c*c + f*f + i*i)
+
+    # A negative determinant means a mirroring scale; put the sign on x so the
+    # rotation stays a proper rotation
+    if a*(e*i - f*h) - b*(d*i - f*g) + c*(d*h - e*g) < 0.0:
+        scale_x = -scale_x
 
     # Extract rotation (normalize columns to remove scale)
-    rotation_matrix = np.zeros((3, 3))
-    rotation_matrix[:, 0] = upper_left[:, 0] / scale_x
-    rotation_matrix[:, 1] = upper_left[:, 1] / scale_y
-    rotation_matrix[:, 2] = upper_left[:, 2] / scale_z
+    rotation_matrix = upper_left / (scale_x, scale_y, scale_z)
 
-    return translation, rotation_matrix, scale
+    return translation, rotation_matrix, col3(scale_x, scale_y, scale_z)
@@ -20,30 +20,36 @@ class BaseLight(SceneObject):
         for o_name in options:
             self.__options[o_name] = options[o_name]
         self.light_type = light_type
+        # Bumped whenever pose or options change so wrappers can rebuild cached GL state
+        self._light_version = 0
 
     def get_options(self) -> Dict:
         return self.__options
 
+    def set_options(self, **options):
+        for o_name in options:
+            self.__options[o_name] = options[o_name]
+        self._light_version += 1
+
     def get_pose(self) -> Pose:
         return self.pose
 
     def set_pose(self, pose: Pose):
         self.pose = pose
-
-    def get_name(self) -> str:
-        pass
+        self._light_version += 1
 
     def get_light_type(self) -> LightPrimitive:
         return self.light_type
 
+    # Lights are not part of the transform hierarchy
     def get_parent(self):
-        pass
+        return None
 
     def set_parent(self, parent):
         pass
 
     def get_children(self) -> List:
-        pass
+        return []
 
     def add_child(self, child):
         pass
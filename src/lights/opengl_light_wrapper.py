@@ -4,11 +4,21 @@ import math
 
 from src.lights.base_light import BaseLight
 
+# Spotlights point down -Y before their pose rotation is applied
+_BASE_DIR = np.array([0.0, -1.0, 0.0])
+_BASE_DIR.flags.writeable = False
+
 
 class OpenGLLightWrapper:
     def __init__(self, light: BaseLight, index: int = 0):
         self.light = light
         self.index = index
+        # Display list holding the compiled glLight state, rebuilt when the light changes
+        self._dlist = None
+        self._dlist_version = None
+        # Unit spot direction, recomputed only when the light's pose changes
+        self._direction_cache = None
+        self._direction_version = None
 
     @staticmethod
     def _rotation_vector_to_matrix(rotation_vec: np.ndarray) -> np.ndarray:
@@ -52,21 +62,55 @@ class OpenGLLightWrapper:
         Calculate spotlight direction based on pose rotation.
         Base direction is [0, -1, 0] (pointing downward).
 
+        The direction is normalized once and cached until the light changes,
+        so GL never has to renormalize it.
+
         Returns:
-            List of 3 floats representing the direction
+            List of 3 floats representing the unit direction
         """
-        base_direction = np.array([0.0, -1.0, 0.0])
+        if self._direction_version == self.light._light_version:
+            return self._direction_cache
+
         rotation_vec = self.light.get_pose().get_rotation()
 
         # Convert rotation vector to rotation matrix
         R = self._rotation_vector_to_matrix(rotation_vec)
 
         # Apply rotation to base direction
-        rotated_direction = R @ base_direction
+        rotated_direction = R @ _BASE_DIR
+        rotated_direction /= np.linalg.norm(rotated_direction)
 
-        return rotated_direction.tolist()
+        self._direction_cache = rotated_direction.tolist()
+        self._direction_version = self.light._light_version
+        return self._direction_cache
+
+    def invalidate(self):
+        """Force the light state to be recompiled on the next setup_lighting call."""
+        self._dlist_version = None
+        self._direction_version = None
 
     def setup_lighting(self):
+        """
+        Apply this light's state. The glLight calls are compiled once into a
+        display list and replayed with glCallList until the light changes.
+        """
+        if self._dlist is None:
+            self._dlist = glGenLists(1)
+        if self._dlist_version != self.light._light_version:
+            glNewList(self._dlist, GL_COMPILE)
+            self._emit_light_state()
+            glEndList()
+            self._dlist_version = self.light._light_version
+        glCallList(self._dlist)
+
+    def release(self):
+        """Delete the display list, if one was allocated."""
+        if self._dlist is not None:
+            glDeleteLists(self._dlist, 1)
+            self._dlist = None
+            self._dlist_version = None
+
+    def _emit_light_state(self):
         glEnable(eval(f"GL_LIGHT{self.index}"))
         for l in self.light.get_options():
             if type(self.light.get_options()[l]) is list:
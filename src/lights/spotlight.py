@@ -45,18 +45,3 @@ class Spotlight(BaseLight):
 
     def get_type(self) -> str:
         return "SPOTLIGHT"
-
-    def get_parent(self):
-        return None
-
-    def set_parent(self, parent):
-        pass
-
-    def get_children(self) -> List:
-        return []
-
-    def add_child(self, child):
-        pass
-
-    def remove_child(self, child):
-        pass
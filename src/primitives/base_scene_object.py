@@ -1,13 +1,18 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from enum import Enum
 import numpy as np
 
 from src.datatypes.scaling import Scaling
 from src.datatypes.material import Material
+from src.datatypes import transform
 from src.scene_object import SceneObject
 
 
+# Packed [normal, position] vertex layout matching glNormalPointer/glVertexPointer with stride 24
+INTERLEAVED_VERTEX_DTYPE = np.dtype([('n', '<f4', 3), ('v', '<f4', 3)])
+
+
 class MeshPrimitive(Enum):
     TRIANGLES = 1
     TRIANGLE_STRIP = 2
@@ -37,6 +42,9 @@ class BaseSceneObject(SceneObject):
         """
         super().__init__(*args, **kwargs)
         self.scaling = scaling
+        # Bumped by the material setters, so a scene can tell that the object
+        # needs to be redrawn even though its transform did not change
+        self.material_version = 0
 
         # Handle material/color initialization
         if material is not None:
@@ -65,6 +73,7 @@ class BaseSceneObject(SceneObject):
             material: New material to apply
         """
         self.material = material
+        self.material_version += 1
 
     def set_color(self, color: List[float]):
         """
@@ -76,25 +85,24 @@ class BaseSceneObject(SceneObject):
             color: RGBA color [r, g, b, a] where each component is in [0, 1]
         """
         self.material.set_color(color)
+        self.material_version += 1
+
+    def _compute_local_is_identity(self) -> bool:
+        return (super()._compute_local_is_identity() and
+                self.scaling.x == 1.0 and self.scaling.y == 1.0 and self.scaling.z == 1.0)
 
-    def get_local_transform(self) -> np.ndarray:
+    def _write_local_transform(self, out: np.ndarray) -> np.ndarray:
         """
-        Get the local transformation matrix (pose + scaling).
+        Write the local transformation matrix (pose + scaling) into out.
         Overrides SceneObject to include scaling.
-        Uses caching to avoid unnecessary recalculation.
+
+        Args:
+            out: 4x4 float64 array to write into
 
         Returns:
-            4x4 local transformation matrix
+            out
         """
-        if self._local_transform_dirty:
-            from src.datatypes import transform
-            self._local_transform_cache = transform.pose_to_matrix(
-                self.pose,
-                self.scaling
-            )
-            self._local_transform_dirty = False
-
-        return self._local_transform_cache
+        return transform.pose_to_matrix(self.pose, self.scaling, out=out)
 
     @abstractmethod
     def get_vertices(self) -> List[List[float]]:
@@ -108,6 +116,37 @@ class BaseSceneObject(SceneObject):
     def get_mesh_primitives(self) -> List[MeshPrimitive]:
         pass
 
+    def get_indexed_mesh(self) -> Optional[Tuple[np.ndarray, np.ndarray, List[np.ndarray]]]:
+        """
+        Get a shared vertex/normal array with one index array per mesh primitive.
+
+        Primitives that share vertices between meshes can override this so the
+        renderer uploads each vertex once and draws with glDrawElements.
+
+        Returns:
+            (vertices (N, 3), normals (N, 3), [indices per mesh]) or None
+        """
+        return None
+
+    def get_interleaved_buffer(self) -> Optional[np.ndarray]:
+        """
+        Get the indexed mesh's vertices as one packed array, if the primitive keeps one.
+
+        Returns:
+            Structured array with fields 'n' and 'v' (3 x float32 each, 24 byte stride),
+            row-aligned with get_indexed_mesh(), or None
+        """
+        return None
+
+    def get_mesh_key(self) -> Optional[Tuple]:
+        """
+        Get a hashable key identifying this object's geometry.
+
+        Objects returning the same key have identical mesh data, so the renderer
+        can share one set of GPU buffers between them. None disables sharing.
+        """
+        return None
+
 
     # @abstractmethod
     # def get_bounding_box(self):
@@ -1,10 +1,11 @@
-import math
+import numpy as np
 from typing import List, Optional
 
 from src.datatypes.pose import Pose
 from src.datatypes.scaling import Scaling
 from src.datatypes.material import Material
 from src.primitives.base_scene_object import MeshPrimitive, BaseSceneObject
+from src.utils.bounding_box import BoundingBox
 
 
 class Cone(BaseSceneObject):
@@ -31,38 +32,53 @@ class Cone(BaseSceneObject):
         self.__create_vertices()
 
     def __create_vertices(self):
+        # Both fans live in one vertex array: [center, apex, side ring..., base ring...].
+        # The base ring duplicates the side ring positions so the flat base keeps
+        # its own (0, 0, -1) normal instead of the slanted side normals.
         self.mesh_primitives.append(MeshPrimitive.TRIANGLE_FAN)
         self.mesh_primitives.append(MeshPrimitive.TRIANGLE_FAN)
-        v_base = list()
-        v_side = list()
-        n_base = list()
-        n_side = list()
-        v_base.append([0.0, 0.0, 0.0])
-        v_side.append([0.0, 0.0, self.height])
-        n_base.append([0.0, 0.0, 1.0])
-        n_side.append([0.0, 0.0, 1.0])
-        for i in range(self.num_segments + 1):
-            angle = 2.0 * math.pi * i / self.num_segments
-            x = self.radius * math.cos(angle)
-            y = self.radius * math.sin(angle)
-            v_base.append([x, y, 0.0])
-            v_side.append([x, y, 0.0])
+        n = self.num_segments
+        angles = 2.0 * np.pi * np.arange(n + 1) / n
+        x = self.radius * np.cos(angles)
+        y = self.radius * np.sin(angles)
+        side = slice(2, n + 3)
+        base = slice(n + 3, 2 * n + 4)
 
-            # Normals for smooth shading
-            nx = x
-            ny = y
-            nz = self.radius / self.height  # Derivative of cone surface
-            length = math.sqrt(nx**2 + ny**2 + nz**2)
-            n_base.append([nx / length, ny / length, nz / length])
-            n_side.append([nx / length, ny / length, nz / length])
+        self.vertex_array = np.empty((2 * n + 4, 3), dtype=np.float32)
+        self.vertex_array[0] = (0.0, 0.0, 0.0)
+        self.vertex_array[1] = (0.0, 0.0, self.height)
+        self.vertex_array[side, 0] = x
+        self.vertex_array[side, 1] = y
+        self.vertex_array[side, 2] = 0.0
+        self.vertex_array[base] = self.vertex_array[side]
 
-        self.vertices.append(v_base)
-        self.vertices.append(v_side)
-        self.normals.append(v_base)
-        self.normals.append(v_side)
+        # Normals for smooth shading, nz is the derivative of the cone surface
+        self.normal_array = np.empty_like(self.vertex_array)
+        self.normal_array[0] = (0.0, 0.0, -1.0)
+        self.normal_array[1] = (0.0, 0.0, 1.0)
+        self.normal_array[side, 0] = x
+        self.normal_array[side, 1] = y
+        self.normal_array[side, 2] = self.radius / self.height
+        self.normal_array[side] /= np.linalg.norm(self.normal_array[side], axis=1, keepdims=True)
+        self.normal_array[base] = (0.0, 0.0, -1.0)
+
+        base_idx = np.concatenate(([0], np.arange(n + 3, 2 * n + 4))).astype(np.uint32)
+        side_idx = np.concatenate(([1], np.arange(2, n + 3))).astype(np.uint32)
+        self.indices = [base_idx, side_idx]
+
+        for idx in self.indices:
+            self.vertices.append(self.vertex_array[idx])
+            self.normals.append(self.normal_array[idx])
 
     def get_type(self) -> str:
-        pass
+        return "CONE"
+
+    def local_bounds(self) -> BoundingBox:
+        # Base circle at z = 0, apex at z = height
+        return BoundingBox(
+            min=np.array([-self.radius, -self.radius, 0.0]),
+            max=np.array([self.radius, self.radius, self.height])
+        )
 
     def get_vertices(self) -> List[List[float]]:
         return self.vertices
@@ -72,3 +88,6 @@ class Cone(BaseSceneObject):
 
     def get_mesh_primitives(self) -> List[MeshPrimitive]:
         return self.mesh_primitives
+
+    def get_indexed_mesh(self):
+        return self.vertex_array, self.normal_array, self.indices
@@ -1,10 +1,11 @@
-import math
+import numpy as np
 from typing import List, Optional
 
 from src.datatypes.pose import Pose
 from src.datatypes.scaling import Scaling
 from src.datatypes.material import Material
 from src.primitives.base_scene_object import MeshPrimitive, BaseSceneObject
+from src.utils.bounding_box import BoundingBox
 
 
 class Cylinder(BaseSceneObject):
@@ -33,49 +34,47 @@ class Cylinder(BaseSceneObject):
     def __create_vertices(self):
 
         half_height = self.height / 2.0
-        angle_step = 2 * math.pi / self.num_segments
+        angles = np.arange(self.num_segments + 1) * (2 * np.pi / self.num_segments)
+        cos_t = np.cos(angles).astype(np.float32)
+        sin_t = np.sin(angles).astype(np.float32)
+        x = self.radius * cos_t
+        y = self.radius * sin_t
+        ones = np.ones_like(cos_t)
 
         # Mantel (seitliche Fläche)
         self.mesh_primitives.append(MeshPrimitive.QUAD_STRIP)
-        self.normals.append(list())
-        self.vertices.append(list())
-        for i in range(self.num_segments + 1):
-            angle = i * angle_step
-            x = self.radius * math.cos(angle)
-            y = self.radius * math.sin(angle)
-            nx, ny = math.cos(angle), math.sin(angle)  # Normale = Radiusrichtung
-            self.normals[-1].append([nx, ny, 0.0])
-            self.vertices[-1].append([x, y, -half_height])
-            self.vertices[-1].append([x, y, half_height])
+        # Normale = Radiusrichtung
+        self.normals.append(np.column_stack([cos_t, sin_t, 0.0 * ones]))
+        side = np.empty((2 * (self.num_segments + 1), 3), dtype=np.float32)
+        side[0::2] = np.column_stack([x, y, -half_height * ones])
+        side[1::2] = np.column_stack([x, y, half_height * ones])
+        self.vertices.append(side)
 
         # Deckel oben
         self.mesh_primitives.append(MeshPrimitive.TRIANGLE_FAN)
-        self.normals.append(list())
-        self.vertices.append(list())
-        self.normals[-1].append([0.0, 0.0, 1.0])
-        self.vertices[-1].append([0.0, 0.0, half_height])
-        for i in range(self.num_segments + 1):
-            angle = i * angle_step
-            x = self.radius * math.cos(angle)
-            y = self.radius * math.sin(angle)
-            self.normals[-1].append([x, y, 1.0])
-            self.vertices[-1].append([x, y, half_height])
+        self.normals.append(np.vstack([[0.0, 0.0, 1.0], np.column_stack([x, y, ones])]).astype(np.float32))
+        self.vertices.append(np.vstack([[0.0, 0.0, half_height],
+                                        np.column_stack([x, y, half_height * ones])]).astype(np.float32))
 
-        # Boden unten
+        # Boden unten: der obere Ring rückwärts durchlaufen (im Uhrzeigersinn,
+        # Normale nach unten), da cos(-a) = cos(2pi - a) und sin(-a) = sin(2pi - a)
+        xb = x[::-1]
+        yb = y[::-1]
         self.mesh_primitives.append(MeshPrimitive.TRIANGLE_FAN)
-        self.normals.append(list())
-        self.vertices.append(list())
-        self.normals[-1].append([0.0, 0.0, -1.0])
-        self.vertices[-1].append([0.0, 0.0, -half_height])
-        for i in range(self.num_segments + 1):
-            angle = -i * angle_step  # Im Uhrzeigersinn für Normale nach unten
-            x = self.radius * math.cos(angle)
-            y = self.radius * math.sin(angle)
-            self.normals[-1].append([x, y, -1.0])
-            self.vertices[-1].append([x, y, -half_height])
+        self.normals.append(np.vstack([[0.0, 0.0, -1.0], np.column_stack([xb, yb, -ones])]).astype(np.float32))
+        self.vertices.append(np.vstack([[0.0, 0.0, -half_height],
+                                        np.column_stack([xb, yb, -half_height * ones])]).astype(np.float32))
 
     def get_type(self) -> str:
-        pass
+        return "CYLINDER"
+
+    def local_bounds(self) -> BoundingBox:
+        # Zylinder ist um den Ursprung zentriert: z von -height/2 bis +height/2
+        half_height = self.height / 2.0
+        return BoundingBox(
+            min=np.array([-self.radius, -self.radius, -half_height]),
+            max=np.array([self.radius, self.radius, half_height])
+        )
 
     def get_vertices(self) -> List[List[float]]:
         return self.vertices
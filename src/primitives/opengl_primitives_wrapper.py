@@ -1,11 +1,33 @@
 from OpenGL.GL import *
+import ctypes
 import numpy as np
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 
 from src.primitives.base_scene_object import BaseSceneObject
 
+# MeshPrimitive name -> GL enum
+_GL_PRIM = {
+    "TRIANGLES": GL_TRIANGLES,
+    "TRIANGLE_STRIP": GL_TRIANGLE_STRIP,
+    "TRIANGLE_FAN": GL_TRIANGLE_FAN,
+    "QUAD": GL_QUADS,
+    "QUADS": GL_QUADS,
+    "QUAD_STRIP": GL_QUAD_STRIP,
+}
+_TRIANGLE_PRIMS = frozenset({"TRIANGLES", "TRIANGLE_STRIP", "TRIANGLE_FAN"})
+_QUAD_PRIMS = frozenset({"QUAD", "QUADS", "QUAD_STRIP"})
+
 
 class OpenGLPrimitivesWrapper:
+    # Indexed GPU buffers shared between wrappers whose objects report the same
+    # mesh key: key -> [indexed buffers tuple, reference count]. The buffer ids
+    # belong to the current GL context, so release_shared_buffers() must run
+    # before that context is destroyed.
+    _shared_buffers: Dict[Tuple, list] = {}
+    # Bumped by release_shared_buffers(); wrappers holding shared buffers from an
+    # older generation drop them instead of drawing or deleting stale ids
+    _shared_generation = 0
+
     def __init__(self, object: BaseSceneObject, color: Optional[List[float]] = None):
         """
         Initialize OpenGL wrapper for a primitive object.
@@ -17,56 +39,254 @@ class OpenGLPrimitivesWrapper:
         """
         self.object = object
         self.color_override = color
+        # One (vbo, vao, vertex_count) per mesh, or None for meshes drawn in immediate mode.
+        # Uploaded lazily on first draw because a GL context is required.
+        self._vbos = None
+        # (vbo, ebo, vao, vertex_count, [(mesh, index_count, byte_offset)]) for indexed meshes
+        self._indexed = None
+        # _shared_generation at the time self._indexed was acquired
+        self._indexed_generation = None
+        # Display list holding the meshes that are still issued in immediate mode (quads)
+        self._display_list = None
+        # id(object) -> (pose version, column-major float32 world matrix)
+        self._instance_matrices = {}
 
-    def draw(self):
-        # Get world transformation matrix
-        world_matrix = self.object.get_world_transform()
-
-        # Push current matrix onto stack
-        glPushMatrix()
-
-        # Apply world transformation
-        # OpenGL expects column-major, NumPy is row-major, so transpose
-        glMultMatrixf(world_matrix.T.astype(np.float32).flatten())
-
-        # Apply material properties
-        self._apply_material()
+        # Mesh layout is fixed at construction, so validate it once instead of every frame
+        self._validate_meshes()
 
-        # Now draw all primitives
+    def _validate_meshes(self):
+        """Check that primitives, vertex and normal lists line up."""
         p = self.object.get_mesh_primitives()
         v = self.object.get_vertices()
         n = self.object.get_normals()
         assert len(p) == len(v), f"len(p): {len(p)}, len(n): {len(v)}"
         assert len(p) == len(n), f"len(p): {len(p)}, len(n): {len(n)}"
-
-        for i, mesh in enumerate(self.object.get_mesh_primitives()):
-            if mesh.name in ["TRIANGLES", "TRIANGLE_STRIP", "TRIANGLE_FAN"]:
+        for i, mesh in enumerate(p):
+            if mesh.name in _TRIANGLE_PRIMS:
                 assert len(v[i]) == len(n[i]), f"len(v): {len(v[i])}, len(n): {len(n[i])}"
-                glBegin(eval(f"GL_{mesh.name}"))
-                for vertex, normal in zip(self.object.get_vertices()[i], self.object.get_normals()[i]):
-                    glNormal3f(*normal)
-                    glVertex3f(*vertex)
-                glEnd()
-            elif mesh.name in ["QUADS", "QUAD_STRIP"]:
+            elif mesh.name in _QUAD_PRIMS:
                 assert len(v[i]) == 2*len(n[i]), f"len(v): {len(v[i])}, (2x) len(n): {2*len(n[i])}"
-                glBegin(eval(f"GL_{mesh.name}"))
-                for vertex in self.object.get_vertices()[i]:
+
+    def _acquire_indexed(self):
+        """Upload the object's indexed mesh, or reuse buffers already uploaded for the same mesh key."""
+        indexed = self.object.get_indexed_mesh()
+        if indexed is None:
+            return
+        key = self.object.get_mesh_key()
+        shared = OpenGLPrimitivesWrapper._shared_buffers.get(key) if key is not None else None
+        if shared is not None:
+            self._indexed = shared[0]
+            shared[1] += 1
+        else:
+            self._upload_indexed(*indexed)
+            if key is not None:
+                OpenGLPrimitivesWrapper._shared_buffers[key] = [self._indexed, 1]
+        self._indexed_generation = OpenGLPrimitivesWrapper._shared_generation
+
+    def _drop_stale_indexed(self):
+        """Forget shared buffers that release_shared_buffers() already deleted."""
+        if (self._indexed is not None and self.object.get_mesh_key() is not None and
+                self._indexed_generation != OpenGLPrimitivesWrapper._shared_generation):
+            self._indexed = None
+
+    @classmethod
+    def release_shared_buffers(cls):
+        """
+        Delete all shared indexed buffers and empty the share table.
+
+        Call this while the GL context the buffers were created in is still
+        current, e.g. when the renderer closes its window. Wrappers that still
+        reference the deleted buffers upload their mesh again on the next draw.
+        """
+        for indexed, _ in cls._shared_buffers.values():
+            vbo, ebo, vao, _, _ = indexed
+            glDeleteVertexArrays(1, [vao])
+            glDeleteBuffers(2, [vbo, ebo])
+        cls._shared_buffers.clear()
+        cls._shared_generation += 1
+
+    def _upload_indexed(self, vertices: np.ndarray, normals: np.ndarray, indices: List[np.ndarray]):
+        """
+        Upload a shared vertex/normal array and all index arrays (concatenated into
+        one element buffer) and record the bindings in a single VAO.
+        """
+        interleaved = self.object.get_interleaved_buffer()
+        if interleaved is None:
+            interleaved = np.ascontiguousarray(
+                np.hstack([np.asarray(normals, dtype=np.float32),
+                           np.asarray(vertices, dtype=np.float32)]))
+        elements = np.ascontiguousarray(np.concatenate(indices).astype(np.uint32))
+
+        draws = []
+        offset = 0
+        for mesh, idx in zip(self.object.get_mesh_primitives(), indices):
+            draws.append((mesh, len(idx), offset))
+            offset += len(idx) * elements.itemsize
+
+        vao = glGenVertexArrays(1)
+        glBindVertexArray(vao)
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, interleaved.nbytes, interleaved, GL_STATIC_DRAW)
+        ebo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ebo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, elements.nbytes, elements, GL_STATIC_DRAW)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glNormalPointer(GL_FLOAT, 24, ctypes.c_void_p(0))
+        glVertexPointer(3, GL_FLOAT, 24, ctypes.c_void_p(12))
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        self._indexed = (vbo, ebo, vao, len(interleaved), draws)
+
+    def _upload_buffers(self):
+        """
+        Upload each triangle mesh as an interleaved [nx, ny, nz, vx, vy, vz] float32 VBO
+        and record its attribute pointers in a VAO, so drawing only needs one bind.
+        """
+        p = self.object.get_mesh_primitives()
+        v = self.object.get_vertices()
+        n = self.object.get_normals()
+
+        self._vbos = []
+        for mesh, vertices, normals in zip(p, v, n):
+            if mesh.name not in _TRIANGLE_PRIMS:
+                self._vbos.append(None)
+                continue
+            interleaved = np.ascontiguousarray(
+                np.hstack([np.asarray(normals, dtype=np.float32),
+                           np.asarray(vertices, dtype=np.float32)]))
+            vao = glGenVertexArrays(1)
+            glBindVertexArray(vao)
+            vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, interleaved.nbytes, interleaved, GL_STATIC_DRAW)
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glNormalPointer(GL_FLOAT, 24, ctypes.c_void_p(0))
+            glVertexPointer(3, GL_FLOAT, 24, ctypes.c_void_p(12))
+            glBindVertexArray(0)
+            self._vbos.append((vbo, vao, len(interleaved)))
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        # Quads have no buffer path; compile their immediate-mode calls once instead
+        quads = [(mesh, vertices) for mesh, vertices in zip(p, v) if mesh.name in _QUAD_PRIMS]
+        if quads:
+            self._display_list = glGenLists(1)
+            glNewList(self._display_list, GL_COMPILE)
+            for mesh, vertices in quads:
+                glBegin(_GL_PRIM[mesh.name])
+                for vertex in vertices:
                     glVertex3f(*vertex)
                 glEnd()
-            else:
-                raise ValueError(f"Unsupported mesh primitive type: {mesh.name}")
+            glEndList()
 
-        # Pop matrix to restore previous state
-        glPopMatrix()
+    def release(self):
+        """Delete the GL buffers owned by this wrapper, if any were created."""
+        if self._vbos is not None:
+            entries = [entry for entry in self._vbos if entry is not None]
+            if entries:
+                glDeleteVertexArrays(len(entries), [entry[1] for entry in entries])
+                glDeleteBuffers(len(entries), [entry[0] for entry in entries])
+            self._vbos = None
+        if self._display_list is not None:
+            glDeleteLists(self._display_list, 1)
+            self._display_list = None
+        self._drop_stale_indexed()
+        if self._indexed is not None:
+            key = self.object.get_mesh_key()
+            shared = OpenGLPrimitivesWrapper._shared_buffers.get(key) if key is not None else None
+            if shared is not None and shared[0] is self._indexed:
+                shared[1] -= 1
+                if shared[1] > 0:
+                    self._indexed = None
+                    return
+                del OpenGLPrimitivesWrapper._shared_buffers[key]
+            vbo, ebo, vao, _, _ = self._indexed
+            glDeleteVertexArrays(1, [vao])
+            glDeleteBuffers(2, [vbo, ebo])
+            self._indexed = None
 
-    def _apply_material(self):
-        """Apply material properties to OpenGL state"""
-        material = self.object.get_material()
+    def _world_matrix(self, obj: BaseSceneObject) -> np.ndarray:
+        """Get obj's column-major float32 world matrix, converted only when its pose changed."""
+        entry = self._instance_matrices.get(id(obj))
+        if entry is None or entry[0] != obj.last_modified:
+            # OpenGL expects column-major, NumPy is row-major, so transpose
+            matrix = np.ascontiguousarray(obj.get_world_transform().T, dtype=np.float32)
+            entry = (obj.last_modified, matrix)
+            self._instance_matrices[id(obj)] = entry
+        return entry[1]
+
+    def forget(self, obj: BaseSceneObject):
+        """Drop cached per-object state after obj stopped being drawn by this wrapper."""
+        self._instance_matrices.pop(id(obj), None)
+
+    def draw(self):
+        """Draw the wrapped object."""
+        self.draw_instances([self.object], [self.color_override])
+
+    def draw_instances(self, objects: List[BaseSceneObject], colors: List[Optional[List[float]]]):
+        """
+        Draw several objects that share this wrapper's mesh.
 
+        The geometry is bound once for the whole list; each object then only sets
+        its matrix and material. This is the fixed-function counterpart to
+        instanced drawing.
+
+        Args:
+            objects: Objects with the same geometry as self.object
+            colors: Per-object color override (or None), parallel to objects
+        """
+        self._drop_stale_indexed()
+        if self._indexed is None and self._vbos is None:
+            self._acquire_indexed()
+            if self._indexed is None:
+                self._upload_buffers()
+
+        if self._indexed is not None:
+            _, _, vao, vertex_count, draws = self._indexed
+            glBindVertexArray(vao)
+            for obj, color in zip(objects, colors):
+                glPushMatrix()
+                glMultMatrixf(self._world_matrix(obj))
+                self._apply_material(obj.get_material(), color)
+                for mesh, count, offset in draws:
+                    glDrawRangeElements(_GL_PRIM[mesh.name], 0, vertex_count - 1, count,
+                                        GL_UNSIGNED_INT, ctypes.c_void_p(offset))
+                glPopMatrix()
+            glBindVertexArray(0)
+            return
+
+        p = self.object.get_mesh_primitives()
+        for obj, color in zip(objects, colors):
+            # Push current matrix onto stack and apply world transformation
+            glPushMatrix()
+            glMultMatrixf(self._world_matrix(obj))
+            self._apply_material(obj.get_material(), color)
+
+            for i, mesh in enumerate(p):
+                if mesh.name in _TRIANGLE_PRIMS:
+                    _, vao, count = self._vbos[i]
+                    glBindVertexArray(vao)
+                    glDrawArrays(_GL_PRIM[mesh.name], 0, count)
+                    glBindVertexArray(0)
+                elif mesh.name not in _QUAD_PRIMS:
+                    raise ValueError(f"Unsupported mesh primitive type: {mesh.name}")
+
+            if self._display_list is not None:
+                glCallList(self._display_list)
+
+            # Pop matrix to restore previous state
+            glPopMatrix()
+
+    @staticmethod
+    def _apply_material(material, color_override: Optional[List[float]] = None):
+        """Apply material properties to OpenGL state"""
         # If color override is provided, use it for diffuse and ambient
-        if self.color_override is not None:
-            ambient = [c * 0.2 for c in self.color_override]
-            diffuse = self.color_override
+        if color_override is not None:
+            ambient = [c * 0.2 for c in color_override]
+            diffuse = color_override
             specular = material.get_specular()
             shininess = material.get_shininess()
         else:
@@ -1,15 +1,72 @@
 import math
-from typing import List, Optional
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 
 from src.datatypes.pose import Pose
 from src.datatypes.scaling import Scaling
 from src.datatypes.material import Material
-from src.primitives.base_scene_object import MeshPrimitive, BaseSceneObject
+from src.primitives.base_scene_object import MeshPrimitive, BaseSceneObject, INTERLEAVED_VERTEX_DTYPE
+from src.utils.bounding_box import BoundingBox, compute_sphere_bounds
 
 # This is a Python implementation of an icosphere, which is a type of sphere made up of triangles.
 # https://www.songho.ca/opengl/gl_sphere.html#icosphere
 
+
+def _subdivide_icosphere(vertices: np.ndarray, triangles: np.ndarray, levels: int):
+    """
+    Split every triangle into four, pushing the new edge midpoints onto the unit sphere.
+
+    Args:
+        vertices: (N, 3) float64 unit vectors
+        triangles: (T, 3) int64 vertex indices
+        levels: Number of subdivision passes
+
+    Returns:
+        (vertices (2 + 10 * 4^levels, 3), triangles (20 * 4^levels, 3)) for an icosahedron input
+    """
+    # Closed mesh: every level adds one vertex per edge (3T/2) and quadruples T,
+    # which gives 2 + 10 * 4^levels vertices and 20 * 4^levels faces for an icosahedron
+    n_verts_final = len(vertices) + sum(3 * len(triangles) * 4 ** level // 2 for level in range(levels))
+    out_vertices = np.empty((n_verts_final, 3), dtype=np.float64)
+    out_vertices[:len(vertices)] = vertices
+    v_count = len(vertices)
+
+    for _ in range(levels):
+        n_tris = len(triangles)
+        # Every triangle contributes edges ab, bc, ca; shared edges are
+        # collapsed with np.unique so each midpoint is created only once
+        edges = np.concatenate([triangles[:, [0, 1]],
+                                triangles[:, [1, 2]],
+                                triangles[:, [2, 0]]])
+        unique_edges, inverse = np.unique(np.sort(edges, axis=1), axis=0, return_inverse=True)
+        midpoints = out_vertices[v_count:v_count + len(unique_edges)]
+        np.add(out_vertices[unique_edges[:, 0]], out_vertices[unique_edges[:, 1]], out=midpoints)
+        midpoints /= np.linalg.norm(midpoints, axis=1, keepdims=True)
+
+        mid = inverse.reshape(-1) + v_count
+        v_count += len(unique_edges)
+        ab, bc, ca = mid[:n_tris], mid[n_tris:2 * n_tris], mid[2 * n_tris:]
+        a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        new_triangles = np.empty((n_tris, 4, 3), dtype=triangles.dtype)
+        new_triangles[:, 0] = np.stack([a, ab, ca], axis=1)
+        new_triangles[:, 1] = np.stack([b, bc, ab], axis=1)
+        new_triangles[:, 2] = np.stack([c, ca, bc], axis=1)
+        new_triangles[:, 3] = np.stack([ab, bc, ca], axis=1)
+        triangles = new_triangles.reshape(-1, 3)
+
+    return out_vertices, triangles
+
+
+# Maximum number of distinct (subdivision, radius) meshes kept in Sphere._mesh_cache
+_MESH_CACHE_SIZE = 32
+
+
 class Sphere(BaseSceneObject):
+    # Generated meshes shared by all spheres with the same (subdivision, radius),
+    # least recently used first. The cached arrays are read-only, since every
+    # instance references them.
+    _mesh_cache: Dict[Tuple[int, float], tuple] = {}
+
     def __init__(self,
                  pose: Pose,
                  radius: float = 1.0,
@@ -31,17 +88,31 @@ class Sphere(BaseSceneObject):
         self.vertices = list()
         self.triangles = list()
         self.normals = list()
-        self.__create_icosahedron()
-        self.__subdivide()
-
-    @staticmethod
-    def __normalize(v: List[float]) -> List[float]:
-        length = math.sqrt(sum([coord ** 2 for coord in v]))
-        return [coord / length for coord in v]
 
-    @staticmethod
-    def __midpoint(v1: List[float], v2:  List[float]) -> List[float]:
-        return Sphere.__normalize([(v1[i] + v2[i]) / 2.0 for i in range(3)])
+        key = (subdivision, float(radius))
+        mesh = Sphere._mesh_cache.pop(key, None)
+        if mesh is None:
+            self.__create_icosahedron()
+            self.__subdivide()
+            mesh = (self.__vertices, self.__triangles, self.interleaved, self.indices[0],
+                    self.normals[0], self.vertices[0])
+            for array in mesh:
+                array.flags.writeable = False
+            if len(Sphere._mesh_cache) >= _MESH_CACHE_SIZE:
+                del Sphere._mesh_cache[next(iter(Sphere._mesh_cache))]
+        else:
+            self.__load_mesh(mesh)
+        # (Re)insert at the end so the least recently used mesh is evicted first
+        Sphere._mesh_cache[key] = mesh
+
+    def __load_mesh(self, mesh: tuple):
+        self.__vertices, self.__triangles, self.interleaved, indices, normals, vertices = mesh
+        self.mesh_primitives.append(MeshPrimitive.TRIANGLES)
+        self.normal_array = self.interleaved['n']
+        self.vertex_array = self.interleaved['v']
+        self.indices = [indices]
+        self.normals.append(normals)
+        self.vertices.append(vertices)
 
     def __create_icosahedron(self):
         self.mesh_primitives.append(MeshPrimitive.TRIANGLES)
@@ -53,7 +124,8 @@ class Sphere(BaseSceneObject):
             [0, -1, t], [0, 1, t], [0, -1, -t], [0, 1, -t],
             [t, 0, -1], [t, 0, 1], [-t, 0, -1], [-t, 0, 1],
         ]
-        self.__vertices = [Sphere.__normalize(v) for v in base_vertices]
+        vertices = np.asarray(base_vertices, dtype=np.float64)
+        self.__vertices = vertices / np.linalg.norm(vertices, axis=1, keepdims=True)
 
         base_faces = [
             [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
@@ -64,47 +136,33 @@ class Sphere(BaseSceneObject):
         self.__triangles.extend(base_faces)
 
     def __subdivide(self):
-        for _ in range(self.subdivision):
-            new_triangles = []
-            midpoint_cache = {}
-
-            def cached_midpoint(i1, i2):
-                key = tuple(sorted((i1, i2)))
-                if key in midpoint_cache:
-                    return midpoint_cache[key]
-                v1, v2 = self.__vertices[i1], self.__vertices[i2]
-                mid = Sphere.__midpoint(v1, v2)
-                self.__vertices.append(mid)
-                idx = len(self.__vertices) - 1
-                midpoint_cache[key] = idx
-                return idx
-
-            for tri in self.__triangles:
-                a, b, c = tri
-                ab = cached_midpoint(a, b)
-                bc = cached_midpoint(b, c)
-                ca = cached_midpoint(c, a)
-
-                new_triangles += [
-                    [a, ab, ca],
-                    [b, bc, ab],
-                    [c, ca, bc],
-                    [ab, bc, ca]
-                ]
-            self.__triangles = new_triangles
-
-        self.normals.append(list())
-        self.vertices.append(list())
-        for tri in self.__triangles:
-            for idx in tri:
-                normal = self.__vertices[idx]
-                vertex = [coord * self.radius for coord in normal]
-                self.normals[0].append(normal)
-                self.vertices[0].append(vertex)
-
+        vertices, triangles = _subdivide_icosphere(
+            np.asarray(self.__vertices, dtype=np.float64),
+            np.asarray(self.__triangles, dtype=np.int64),
+            self.subdivision)
+
+        # Subdivide in float64, then keep everything in GL's native float32
+        self.__vertices = vertices.astype(np.float32)
+        self.__triangles = triangles
+
+        # Unique vertices plus an index buffer for indexed drawing. The vertices are
+        # stored as one packed [normal, position] buffer; the arrays are field views into it
+        self.interleaved = np.empty(len(self.__vertices), dtype=INTERLEAVED_VERTEX_DTYPE)
+        self.interleaved['n'] = self.__vertices
+        self.interleaved['v'] = self.__vertices * np.float32(self.radius)
+        self.normal_array = self.interleaved['n']
+        self.vertex_array = self.interleaved['v']
+        self.indices = [self.__triangles.astype(np.uint32).flatten()]
+
+        flat_normals = self.__vertices[self.__triangles.flatten()]
+        self.normals.append(flat_normals)
+        self.vertices.append(flat_normals * np.float32(self.radius))
 
     def get_type(self) -> str:
-        pass
+        return "SPHERE"
+
+    def local_bounds(self) -> BoundingBox:
+        return compute_sphere_bounds(center=np.zeros(3), radius=self.radius)
 
     def get_vertices(self) -> List[List[float]]:
         return self.vertices
@@ -113,4 +171,13 @@ class Sphere(BaseSceneObject):
         return self.normals
 
     def get_mesh_primitives(self) -> List[MeshPrimitive]:
-        return self.mesh_primitives
\ No newline at end of file
+        return self.mesh_primitives
+
+    def get_indexed_mesh(self):
+        return self.vertex_array, self.normal_array, self.indices
+
+    def get_interleaved_buffer(self) -> np.ndarray:
+        return self.interleaved
+
+    def get_mesh_key(self) -> Tuple:
+        return ("SPHERE", self.subdivision, float(self.radius))
\ No newline at end of file
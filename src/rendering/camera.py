@@ -44,6 +44,15 @@ class Camera:
         self.ortho_near = -10.0
         self.ortho_far = 10.0
 
+        # Matrices read back from GL after they were last built, together with the
+        # parameters they were built from. They are reloaded with glLoadMatrixf while
+        # the parameters compare equal, so directly assigned attributes (e.g. fov)
+        # are picked up as well as the setters.
+        self._proj_state = None
+        self._view_state = None
+        self._proj_matrix = None
+        self._view_matrix = None
+
     @classmethod
     def perspective(cls,
                     fov: float = 45.0,
@@ -75,11 +84,11 @@ class Camera:
         camera.far = far
 
         if position is not None:
-            camera.position = np.array(position)
+            camera.set_position(position)
         if look_at is not None:
-            camera.look_at_point = np.array(look_at)
+            camera.set_look_at(look_at)
         if up is not None:
-            camera.up_vector = np.array(up)
+            camera.set_up_vector(up)
 
         return camera
 
@@ -120,33 +129,53 @@ class Camera:
         camera.ortho_far = far
 
         if position is not None:
-            camera.position = np.array(position)
+            camera.set_position(position)
         if look_at is not None:
-            camera.look_at_point = np.array(look_at)
+            camera.set_look_at(look_at)
         if up is not None:
-            camera.up_vector = np.array(up)
+            camera.set_up_vector(up)
 
         return camera
 
     def set_position(self, position: List[float]):
         """Set camera position."""
-        self.position = np.array(position)
+        self.position[:] = position
 
     def set_look_at(self, look_at: List[float]):
         """Set point camera is looking at."""
-        self.look_at_point = np.array(look_at)
+        self.look_at_point[:] = look_at
 
     def set_up_vector(self, up: List[float]):
         """Set camera up vector."""
-        self.up_vector = np.array(up)
+        self.up_vector[:] = up
 
     def set_aspect_ratio(self, width: int, height: int):
         """Update aspect ratio based on window dimensions."""
         self.aspect_ratio = width / height if height > 0 else 1.0
 
+    def mark_dirty(self):
+        """Rebuild both matrices on the next apply, e.g. after the GL matrices were overwritten."""
+        self._proj_state = None
+        self._view_state = None
+
+    def projection_state(self) -> tuple:
+        """Snapshot of every parameter that affects the projection matrix."""
+        return (self.projection_type, self.fov, self.aspect_ratio, self.near, self.far,
+                self.left, self.right, self.bottom, self.top, self.ortho_near, self.ortho_far)
+
+    def view_state(self) -> tuple:
+        """Snapshot of the view parameters, laid out as the gluLookAt arguments."""
+        return (*map(float, self.position), *map(float, self.look_at_point),
+                *map(float, self.up_vector))
+
     def apply_projection(self):
         """Apply projection matrix to OpenGL state."""
         glMatrixMode(GL_PROJECTION)
+        state = self.projection_state()
+        if state == self._proj_state:
+            glLoadMatrixf(self._proj_matrix)
+            return
+
         glLoadIdentity()
 
         if self.projection_type == "perspective":
@@ -157,15 +186,21 @@ class Camera:
         else:
             raise ValueError(f"Unknown projection type: {self.projection_type}")
 
+        self._proj_matrix = glGetFloatv(GL_PROJECTION_MATRIX)
+        self._proj_state = state
+
     def apply_view(self):
         """Apply view matrix to OpenGL state."""
         glMatrixMode(GL_MODELVIEW)
+        state = self.view_state()
+        if state == self._view_state:
+            glLoadMatrixf(self._view_matrix)
+            return
+
         glLoadIdentity()
-        gluLookAt(
-            self.position[0], self.position[1], self.position[2],
-            self.look_at_point[0], self.look_at_point[1], self.look_at_point[2],
-            self.up_vector[0], self.up_vector[1], self.up_vector[2]
-        )
+        gluLookAt(*state)
+        self._view_matrix = glGetFloatv(GL_MODELVIEW_MATRIX)
+        self._view_state = state
 
     def apply(self):
         """Apply both projection and view transformations."""
@@ -8,6 +8,7 @@ from OpenGL.GL import *
 from typing import Optional, Callable
 from src.rendering.scene import Scene
 from src.rendering.camera import Camera
+from src.primitives.opengl_primitives_wrapper import OpenGLPrimitivesWrapper
 
 
 class Renderer:
@@ -67,16 +68,23 @@ class Renderer:
         # Set background color
         glClearColor(*self.background_color)
 
+        # Global VAO so drivers never see vertex array calls without a bound VAO
+        self._default_vao = glGenVertexArrays(1)
+        glBindVertexArray(self._default_vao)
+
         # Window resize callback
         glfw.set_window_size_callback(self.window, self._on_resize)
 
         self._is_running = False
+        self._needs_redraw = True
+        self._last_camera_state = None
 
     def _on_resize(self, window, width: int, height: int):
         """Handle window resize events."""
         self.width = width
         self.height = height
         glViewport(0, 0, width, height)
+        self._needs_redraw = True
 
     def should_close(self) -> bool:
         """Check if window should close."""
@@ -99,6 +107,15 @@ class Renderer:
         if mask:
             glClear(mask)
 
+    def _frame_changed(self, scene: Scene, camera: Camera) -> bool:
+        """Check whether the window, camera or scene changed since the last rendered frame."""
+        # The camera compares the same snapshots itself when applying its matrices
+        camera_state = (camera.projection_state(), camera.view_state())
+        camera_changed = camera_state != self._last_camera_state
+        changed = self._needs_redraw or camera_changed or scene.needs_redraw()
+        self._last_camera_state = camera_state
+        return changed
+
     def render_frame(self, scene: Scene, camera: Camera):
         """
         Render a single frame.
@@ -154,8 +171,10 @@ class Renderer:
             current_time = glfw.get_time()
             delta_time = current_time - last_time
 
-            # FPS limiting
+            # FPS limiting: block until the next frame is due (or input arrives)
+            # instead of spinning on the clock
             if fps_limit > 0 and delta_time < frame_time:
+                glfw.wait_events_timeout(frame_time - delta_time)
                 continue
 
             last_time = current_time
@@ -167,8 +186,14 @@ class Renderer:
             if update_callback:
                 update_callback(delta_time)
 
+            # Skip the redraw when nothing changed; just wait for input instead
+            if fps_limit > 0 and not self._frame_changed(scene, camera):
+                glfw.wait_events_timeout(frame_time)
+                continue
+
             # Render frame
             self.render_frame(scene, camera)
+            self._needs_redraw = False
 
     def stop(self):
         """Stop the render loop."""
@@ -176,6 +201,8 @@ class Renderer:
 
     def close(self):
         """Close window and terminate GLFW."""
+        # Shared mesh buffers live in this window's context, which terminate() destroys
+        OpenGLPrimitivesWrapper.release_shared_buffers()
         glfw.terminate()
 
     def get_window_size(self) -> tuple:
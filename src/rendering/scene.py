@@ -3,7 +3,7 @@ Scene management for organizing objects and lights.
 
 Provides a high-level container for scene graph elements without exposing OpenGL details.
 """
-from typing import List, Optional
+from typing import Dict, Hashable, List, Optional, Tuple
 from src.primitives.base_scene_object import BaseSceneObject
 from src.primitives.opengl_primitives_wrapper import OpenGLPrimitivesWrapper
 from src.lights.base_light import BaseLight
@@ -26,11 +26,45 @@ class Scene:
         """
         self.name = name
         self._objects: List[BaseSceneObject] = []
-        self._object_wrappers: List[OpenGLPrimitivesWrapper] = []
+        # One wrapper per distinct mesh: key -> (wrapper, objects, color overrides)
+        self._object_wrappers: Dict[Hashable, Tuple[OpenGLPrimitivesWrapper,
+                                                    List[BaseSceneObject],
+                                                    List[Optional[List[float]]]]] = {}
         self._lights: List[BaseLight] = []
         self._light_wrappers: List[OpenGLLightWrapper] = []
         self._next_light_index = 0
 
+        # Redraw tracking: set on any scene mutation, cleared by render()
+        self._dirty = True
+        self._rendered_versions: List[int] = []
+        self._rendered_material_versions: List[int] = []
+
+    def mark_dirty(self):
+        """
+        Force a redraw on the next frame.
+
+        Pose changes and the objects' material setters are detected
+        automatically; call this after changes the scene cannot see, such as
+        editing a Material instance in place.
+        """
+        self._dirty = True
+
+    def needs_redraw(self) -> bool:
+        """Check whether anything changed since the last render()."""
+        if self._dirty:
+            return True
+        for obj, version, material_version in zip(self._objects, self._rendered_versions,
+                                                  self._rendered_material_versions):
+            if obj.last_modified != version or obj.material_version != material_version:
+                return True
+        return False
+
+    @staticmethod
+    def _wrapper_key(obj: BaseSceneObject) -> Hashable:
+        """Objects with equal mesh keys share a wrapper; others get their own."""
+        key = obj.get_mesh_key()
+        return key if key is not None else ("OBJECT", id(obj))
+
     def add(self, obj: BaseSceneObject, color: Optional[List[float]] = None):
         """
         Add an object to the scene.
@@ -41,8 +75,15 @@ class Scene:
         """
         if obj not in self._objects:
             self._objects.append(obj)
-            wrapper = OpenGLPrimitivesWrapper(obj, color=color)
-            self._object_wrappers.append(wrapper)
+            key = self._wrapper_key(obj)
+            entry = self._object_wrappers.get(key)
+            if entry is None:
+                wrapper = OpenGLPrimitivesWrapper(obj, color=color)
+                self._object_wrappers[key] = (wrapper, [obj], [color])
+            else:
+                entry[1].append(obj)
+                entry[2].append(color)
+            self._dirty = True
 
     def remove(self, obj: BaseSceneObject):
         """
@@ -52,9 +93,21 @@ class Scene:
             obj: BaseSceneObject to remove
         """
         if obj in self._objects:
-            idx = self._objects.index(obj)
-            self._objects.pop(idx)
-            self._object_wrappers.pop(idx)
+            self._objects.remove(obj)
+            key = self._wrapper_key(obj)
+            wrapper, objects, colors = self._object_wrappers[key]
+            idx = objects.index(obj)
+            objects.pop(idx)
+            colors.pop(idx)
+            wrapper.forget(obj)
+            if not objects:
+                wrapper.release()
+                del self._object_wrappers[key]
+            elif wrapper.object is obj:
+                # Same geometry, so any remaining object can stand in as the wrapped one
+                wrapper.object = objects[0]
+                wrapper.color_override = colors[0]
+            self._dirty = True
 
     def add_light(self, light: BaseLight):
         """
@@ -76,6 +129,7 @@ class Scene:
             wrapper = OpenGLLightWrapper(light, index=self._next_light_index)
             self._light_wrappers.append(wrapper)
             self._next_light_index += 1
+            self._dirty = True
 
     def remove_light(self, light: BaseLight):
         """
@@ -87,7 +141,8 @@ class Scene:
         if light in self._lights:
             idx = self._lights.index(light)
             self._lights.pop(idx)
-            self._light_wrappers.pop(idx)
+            self._light_wrappers.pop(idx).release()
+            self._dirty = True
             # Note: Light indices don't shift, so _next_light_index stays the same
 
     def get_objects(self) -> List[BaseSceneObject]:
@@ -101,13 +156,19 @@ class Scene:
     def clear_objects(self):
         """Remove all objects from the scene."""
         self._objects.clear()
+        for wrapper, _, _ in self._object_wrappers.values():
+            wrapper.release()
         self._object_wrappers.clear()
+        self._dirty = True
 
     def clear_lights(self):
         """Remove all lights from the scene."""
         self._lights.clear()
+        for wrapper in self._light_wrappers:
+            wrapper.release()
         self._light_wrappers.clear()
         self._next_light_index = 0
+        self._dirty = True
 
     def clear(self):
         """Remove all objects and lights from the scene."""
@@ -120,8 +181,11 @@ class Scene:
 
         This is called internally by the Renderer.
         """
-        for wrapper in self._object_wrappers:
-            wrapper.draw()
+        for wrapper, objects, colors in self._object_wrappers.values():
+            wrapper.draw_instances(objects, colors)
+        self._rendered_versions = [obj.last_modified for obj in self._objects]
+        self._rendered_material_versions = [obj.material_version for obj in self._objects]
+        self._dirty = False
 
     def setup_lights(self):
         """
@@ -1,29 +1,101 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
+import itertools
+import sys
 import numpy as np
 import warnings
 
 from src.datatypes.pose import Pose
+from src.datatypes import transform
+from src.utils.bounding_box import BoundingBox
+
+
+# Source of modification stamps. Stamps are unique and increasing across all
+# objects, so the newest stamp in a subtree tells whether anything in it changed.
+_modification_clock = itertools.count(1)
+
+
+# Shared world transform of identity roots; read-only since several objects alias it
+_IDENTITY = np.eye(4)
+_IDENTITY.flags.writeable = False
+
+
+def _warn_deep_nodes(nodes: List['SceneObject']):
+    """
+    Emit the deep hierarchy warning for nodes that crossed their depth threshold.
+
+    The warning is attributed to the first caller outside this module and outside
+    scene object constructors, so it points at user code whether the hierarchy
+    changed through set_parent, add_child, add_children or a constructor's parent
+    argument.
+
+    Args:
+        nodes: Nodes returned by SceneObject._update_depth()
+    """
+    if not nodes:
+        return
+    frame = sys._getframe()
+    stacklevel = 1
+    while frame is not None and (
+            frame.f_code.co_filename == __file__ or
+            (frame.f_code.co_name == '__init__' and isinstance(frame.f_locals.get('self'), SceneObject))):
+        frame = frame.f_back
+        stacklevel += 1
+    for node in nodes:
+        warnings.warn(
+            f"Deep hierarchy detected: '{node.name}' is at depth {node._depth}. "
+            f"Consider restructuring for better performance.",
+            UserWarning,
+            stacklevel=stacklevel
+        )
 
 
 class SceneObject(ABC):
 
+    # Cache statistics. Plain objects do not count accesses and keep reporting
+    # zero; InstrumentedSceneObject maintains per-instance counters.
+    _cache_hits = 0
+    _cache_misses = 0
+
     def __init__(self, name: str, pose: Pose, parent: Optional['SceneObject'] = None):
         self.name = name
         self.pose = pose
         self.parent = None
         self.children = []
+        # Position in parent.children, kept up to date so detaching is O(1)
+        self._index_in_parent = -1
+        # Depth in the hierarchy, kept up to date on reparenting
+        self._depth = 0
 
-        # Transform caching for performance
-        self._local_transform_dirty = True
-        self._world_transform_dirty = True
-        self._local_transform_cache = None
+        # World transform caching for performance. A cache of None means "needs
+        # recompute"; invalidation happens eagerly on write, so reads only test for None.
         self._world_transform_cache = None
+        # Backing storage for the cache, allocated once and overwritten on recompute.
+        # The cache attribute points at this buffer while valid and is None otherwise.
+        self._world_transform_buffer = np.empty((4, 4))
+        # Whether the local transform is the identity, or None if not yet known.
+        # Such objects share their parent's world matrix instead of computing one.
+        self._local_is_identity = None
+        # Local transform, valid while _local_is_identity is False. Everything that
+        # changes the local transform resets _local_is_identity, so moving an
+        # ancestor only costs a matrix product here, not a new rotation matrix.
+        self._local_transform = np.empty((4, 4))
+        # Bumped whenever the world transform may have changed, so consumers
+        # (e.g. render wrappers) can cache data derived from it
+        self.last_modified = 0
+        # Bumped whenever a child is attached or detached
+        self._children_modified = 0
+
+        # World-space bounds caches, managed by src.utils.bounding_box and
+        # valid while their stamp matches
+        self._world_bounds_cache = None
+        self._world_bounds_stamp = -1
+        self._hierarchy_bounds_cache = None
+        self._hierarchy_bounds_stamp = -1
 
         # Performance monitoring
-        self._cache_hits = 0
-        self._cache_misses = 0
         self._depth_warning_threshold = 15  # Warn if hierarchy exceeds this depth
+        self._depth_warning_emitted = False
 
         # Set parent if provided (uses set_parent to maintain consistency)
         if parent is not None:
@@ -34,7 +106,8 @@ class SceneObject(ABC):
 
     def set_pose(self, pose: Pose):
         self.pose = pose
-        self.mark_transform_dirty()
+        self._local_is_identity = None
+        self._invalidate_world()
 
     def get_name(self) -> str:
         return self.name
@@ -52,14 +125,17 @@ class SceneObject(ABC):
         if potential_parent is None:
             return False
 
-        # Walk up the parent chain
+        # A cycle needs potential_parent inside this subtree, so it must be at least
+        # as deep as this object; its ancestor at this object's depth decides
+        steps = potential_parent._depth - self._depth
+        if steps < 0:
+            return False
+
         current = potential_parent
-        while current is not None:
-            if current is self:
-                return True
-            current = current.get_parent()
+        for _ in range(steps):
+            current = current.parent
 
-        return False
+        return current is self
 
     def get_parent(self) -> Optional['SceneObject']:
         """
@@ -74,6 +150,9 @@ class SceneObject(ABC):
         """
         Set the parent object and update parent-child relationships.
 
+        Detaching swaps the last sibling into the freed slot, so the order of
+        the old parent's children is not preserved.
+
         Args:
             parent: The new parent object, or None to remove parent
 
@@ -84,21 +163,38 @@ class SceneObject(ABC):
         if self._would_create_cycle(parent):
             raise ValueError(f"Setting parent would create a cycle: {self.name}")
 
-        # Remove from old parent's children list
-        if self.parent is not None:
-            if self in self.parent.children:
-                self.parent.children.remove(self)
+        _warn_deep_nodes(self._set_parent_unchecked(parent))
 
-        # Set new parent
-        self.parent = parent
+    def _set_parent_unchecked(self, parent: Optional['SceneObject']) -> List['SceneObject']:
+        """
+        Set the parent object without checking for circular references.
 
-        # Add to new parent's children list
-        if parent is not None:
-            if self not in parent.children:
+        Args:
+            parent: The new parent object, or None to remove parent
+
+        Returns:
+            Nodes that crossed their depth warning threshold; the caller warns
+        """
+        deep_nodes = []
+        if parent is not self.parent:
+            # Remove from old parent's children list
+            if self.parent is not None:
+                self._detach_from_parent()
+
+            # Set new parent
+            self.parent = parent
+
+            # Add to new parent's children list
+            if parent is not None:
+                self._index_in_parent = len(parent.children)
                 parent.children.append(self)
+                parent._children_modified = next(_modification_clock)
+
+            deep_nodes = self._update_depth()
 
-        # Mark transform as dirty
-        self.mark_transform_dirty()
+        # Parent changed, so the world transform of this subtree changed
+        self._invalidate_world()
+        return deep_nodes
 
     def get_children(self) -> List['SceneObject']:
         """
@@ -122,96 +218,274 @@ class SceneObject(ABC):
         # This will handle circular reference checking and updating both sides
         child.set_parent(self)
 
+    def add_children(self, children: Iterable['SceneObject']):
+        """
+        Add several child objects, checking for circular references only once.
+
+        Args:
+            children: The child objects to add
+
+        Raises:
+            ValueError: If a child is this object or one of its ancestors; no child
+                is added in that case
+        """
+        children = list(children)
+
+        # Only this object or one of its ancestors can close a cycle
+        ancestors = set()
+        node = self
+        while node is not None:
+            ancestors.add(id(node))
+            node = node.parent
+
+        for child in children:
+            if id(child) in ancestors:
+                raise ValueError(f"Setting parent would create a cycle: {child.name}")
+
+        deep_nodes = []
+        for child in children:
+            deep_nodes.extend(child._set_parent_unchecked(self))
+        _warn_deep_nodes(deep_nodes)
+
     def remove_child(self, child: 'SceneObject'):
         """
         Remove a child object. This sets the child's parent to None.
+        The order of the remaining children is not preserved.
 
         Args:
             child: The child object to remove
         """
-        if child in self.children:
-            self.children.remove(child)
+        if child.parent is self:
+            child._detach_from_parent()
             child.parent = None
-            child.mark_transform_dirty()
+            _warn_deep_nodes(child._update_depth())
+            child._invalidate_world()
+
+    def _update_depth(self) -> List['SceneObject']:
+        """
+        Recompute the cached depth of this object and all descendants.
+
+        Returns:
+            Nodes that crossed their depth warning threshold for the first time
+        """
+        self._depth = 0 if self.parent is None else self.parent._depth + 1
+        deep_nodes = [self] if self._crosses_depth_threshold() else []
+        stack = list(self.children)
+        while stack:
+            node = stack.pop()
+            node._depth = node.parent._depth + 1
+            if node._crosses_depth_threshold():
+                deep_nodes.append(node)
+            stack.extend(node.children)
+        return deep_nodes
+
+    def _crosses_depth_threshold(self) -> bool:
+        """Check once whether this object is deeper than its depth warning threshold."""
+        if self._depth > self._depth_warning_threshold and not self._depth_warning_emitted:
+            self._depth_warning_emitted = True
+            return True
+        return False
+
+    def _detach_from_parent(self):
+        """
+        Remove this object from its parent's children list in constant time.
+
+        The last child is moved into the freed slot instead of shifting the list.
+        Does not reset self.parent; callers do that.
+        """
+        self.parent._children_modified = next(_modification_clock)
+        siblings = self.parent.children
+        last = siblings.pop()
+        if last is not self:
+            siblings[self._index_in_parent] = last
+            last._index_in_parent = self._index_in_parent
+        self._index_in_parent = -1
 
     def mark_transform_dirty(self):
         """
         Mark this object's transform cache as dirty, requiring recalculation.
-        Recursively marks all children as dirty as well.
+        Marks all descendants as dirty as well.
         """
-        self._local_transform_dirty = True
-        self._world_transform_dirty = True
+        self._local_is_identity = None
+        self._invalidate_world()
 
-        # Recursively mark all children
-        for child in self.children:
-            child.mark_transform_dirty()
+    def _invalidate_world(self):
+        """
+        Drop the cached world transform of this object and all descendants.
 
-    def get_local_transform(self) -> np.ndarray:
+        Keeps the invariant that a non-None world cache is always current.
         """
-        Get the local transformation matrix (pose only, no scaling).
-        Uses caching to avoid unnecessary recalculation.
+        self._world_transform_cache = None
+        self.last_modified = next(_modification_clock)
+
+        # Checking first avoids setting up the loop for leaves, the common case
+        if self.children:
+            stack = list(self.children)
+            while stack:
+                node = stack.pop()
+                # Reading a world transform caches it for the whole parent chain, so an
+                # uncached descendant was invalidated before and has not been read since:
+                # its subtree is uncached and already carries newer stamps than any
+                # cache derived from it
+                if node._world_transform_cache is None:
+                    continue
+                node._world_transform_cache = None
+                node.last_modified = next(_modification_clock)
+                stack.extend(node.children)
+
+    def local_bounds(self) -> Optional[BoundingBox]:
+        """
+        Get the bounding box of this object's own geometry in local space.
+        Subclasses with geometry override this.
 
         Returns:
-            4x4 local transformation matrix
+            BoundingBox in local space, or None if the object has no extent
+        """
+        return None
+
+    def _write_local_transform(self, out: np.ndarray) -> np.ndarray:
         """
-        if self._local_transform_dirty:
-            from src.datatypes import transform
-            self._local_transform_cache = transform.pose_to_matrix(self.pose)
-            self._local_transform_dirty = False
+        Write the local transformation matrix (pose only, no scaling) into out.
+        Subclasses that add to the local transform override this.
 
-        return self._local_transform_cache
+        Args:
+            out: 4x4 float64 array to write into
 
-    def get_world_transform(self) -> np.ndarray:
+        Returns:
+            out
         """
-        Get the world transformation matrix by traversing the parent hierarchy.
-        Uses caching to avoid unnecessary recalculation.
+        return transform.pose_to_matrix(self.pose, out=out)
+
+    def _compute_local_is_identity(self) -> bool:
+        """
+        Check whether the local transform is the identity.
+        Subclasses that add to the local transform override this.
 
         Returns:
-            4x4 world transformation matrix
+            True if the local transform is the identity
         """
-        if self._world_transform_dirty:
-            self._cache_misses += 1
-            local = self.get_local_transform()
+        return self.pose.is_identity()
 
-            if self.parent is None:
+    def get_local_transform(self) -> np.ndarray:
+        """
+        Get the local transformation matrix.
+        Computed on each call; only world transforms are cached.
+
+        Returns:
+            New 4x4 local transformation matrix
+        """
+        return self._write_local_transform(np.empty((4, 4)))
+
+    def get_world_transform(self) -> np.ndarray:
+        """
+        Get the world transformation matrix by traversing the parent hierarchy.
+        Uses caching to avoid unnecessary recalculation: the cache stays valid across
+        frames until a pose in the parent chain changes, so each transform is
+        computed at most once per change no matter how often it is queried.
+
+        Returns:
+            4x4 world transformation matrix. The array may be shared with an ancestor
+            and is overwritten when the transform changes; treat it as read-only and
+            copy it to keep a snapshot.
+        """
+        if self._world_transform_cache is not None:
+            return self._world_transform_cache
+
+        # Collect the unresolved part of the parent chain, then fold the
+        # matrices downward instead of recursing once per level
+        chain = []
+        node = self
+        while node is not None and node._world_transform_cache is None:
+            chain.append(node)
+            node = node.parent
+
+        if node is None:
+            world = None
+        else:
+            world = node._world_transform_cache
+
+        for current in reversed(chain):
+            if current._local_is_identity is None:
+                current._local_is_identity = current._compute_local_is_identity()
+                if not current._local_is_identity:
+                    current._write_local_transform(current._local_transform)
+            if current._local_is_identity:
+                # World transform equals the parent's, so share its matrix. This
+                # stays consistent because invalidating the parent invalidates us.
+                if world is None:
+                    world = _IDENTITY
+                current._world_transform_cache = world
+                continue
+
+            buffer = current._world_transform_buffer
+            if world is None:
                 # No parent, world transform = local transform
-                self._world_transform_cache = local.copy()
+                np.copyto(buffer, current._local_transform)
             else:
                 # Multiply parent's world transform with our local transform
-                parent_world = self.parent.get_world_transform()
-                self._world_transform_cache = parent_world @ local
-
-                # Check hierarchy depth and warn if too deep
-                depth = self.get_depth()
-                if depth > self._depth_warning_threshold:
-                    warnings.warn(
-                        f"Deep hierarchy detected: '{self.name}' is at depth {depth}. "
-                        f"Consider restructuring for better performance.",
-                        UserWarning,
-                        stacklevel=2
-                    )
-
-            self._world_transform_dirty = False
-        else:
-            self._cache_hits += 1
+                np.matmul(world, current._local_transform, out=buffer)
+            world = buffer
+            current._world_transform_cache = world
+
+        return world
 
-        return self._world_transform_cache
+    def flatten_subtree(self) -> Tuple[List['SceneObject'], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Flatten this object and all descendants into contiguous arrays.
+
+        Nodes are listed breadth-first, so every parent index is smaller than
+        the indices of its children and nodes of equal depth are adjacent.
+
+        Returns:
+            Tuple (nodes, parents, locals, worlds) where nodes is the list of
+            objects, parents an int32 (N,) array of parent indices (-1 for this
+            object), locals the (N, 4, 4) local transforms and worlds an
+            uninitialized (N, 4, 4) array for the results
+        """
+        nodes = [self]
+        parents = [-1]
+        i = 0
+        while i < len(nodes):
+            for child in nodes[i].children:
+                nodes.append(child)
+                parents.append(i)
+            i += 1
+
+        locals_ = np.empty((len(nodes), 4, 4))
+        for i, node in enumerate(nodes):
+            node._write_local_transform(locals_[i])
+
+        return nodes, np.array(parents, dtype=np.int32), locals_, np.empty_like(locals_)
+
+    def recompute_subtree(self):
+        """
+        Recompute the world transforms of this object and all descendants in one pass.
+
+        Cheaper than querying get_world_transform() node by node when a large
+        subtree changed, e.g. once per frame after moving its root.
+        """
+        nodes, parents, locals_, worlds = self.flatten_subtree()
+        transform.propagate_world_transforms(parents, locals_, worlds)
+
+        if self.parent is not None:
+            # The subtree was propagated relative to this object's parent
+            np.matmul(self.parent.get_world_transform(), worlds, out=worlds)
+
+        for node, world in zip(nodes, worlds):
+            np.copyto(node._world_transform_buffer, world)
+            node._world_transform_cache = node._world_transform_buffer
 
     # ===== Optimization & Monitoring Methods =====
 
     def get_depth(self) -> int:
         """
         Get the depth of this object in the hierarchy.
+        The value is cached and updated whenever the hierarchy changes.
 
         Returns:
             Depth (0 for root, 1 for children of root, etc.)
         """
-        depth = 0
-        current = self.parent
-        while current is not None:
-            depth += 1
-            current = current.get_parent()
-        return depth
+        return self._depth
 
     def get_hierarchy_depth(self) -> int:
         """
@@ -220,15 +494,16 @@ class SceneObject(ABC):
         Returns:
             Maximum depth of subtree (0 if no children)
         """
-        if not self.children:
-            return 0
-
-        max_child_depth = 0
-        for child in self.children:
-            child_depth = child.get_hierarchy_depth()
-            max_child_depth = max(max_child_depth, child_depth)
+        max_depth = 0
+        stack = [(self, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            for child in node.children:
+                stack.append((child, depth + 1))
 
-        return 1 + max_child_depth
+        return max_depth
 
     def get_descendant_count(self) -> int:
         """
@@ -237,14 +512,18 @@ class SceneObject(ABC):
         Returns:
             Total number of descendants
         """
-        count = len(self.children)
-        for child in self.children:
-            count += child.get_descendant_count()
+        count = 0
+        stack = list(self.children)
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children)
         return count
 
     def get_cache_statistics(self) -> Dict[str, int]:
         """
         Get cache performance statistics for this object.
+        Only InstrumentedSceneObject counts accesses; other objects report zeros.
 
         Returns:
             Dictionary with cache hits, misses, and hit rate
@@ -283,32 +562,63 @@ class SceneObject(ABC):
         Print a visual representation of the hierarchy tree.
 
         Args:
-            indent: Current indentation level (used for recursion)
+            indent: Indentation level of this object
             show_stats: If True, show cache statistics for each node
         """
-        prefix = "  " * indent
-        stats_str = ""
+        # Children are pushed in reverse so they pop in their original order
+        stack = [(self, indent)]
+        while stack:
+            node, level = stack.pop()
+            prefix = "  " * level
+            stats_str = ""
 
-        if show_stats:
-            cache_stats = self.get_cache_statistics()
-            stats_str = f" [cache: {cache_stats['hit_rate_percent']:.1f}% hits, depth: {self.get_depth()}]"
+            if show_stats:
+                cache_stats = node.get_cache_statistics()
+                stats_str = f" [cache: {cache_stats['hit_rate_percent']:.1f}% hits, depth: {node.get_depth()}]"
 
-        print(f"{prefix}{self.name}{stats_str}")
+            print(f"{prefix}{node.name}{stats_str}")
 
-        for child in self.children:
-            child.print_hierarchy(indent + 1, show_stats)
+            for child in reversed(node.children):
+                stack.append((child, level + 1))
 
-    def validate_hierarchy(self) -> List[str]:
+    def validate_hierarchy(self, nodes: Optional[Iterable[Tuple['SceneObject', int]]] = None) -> List[str]:
         """
         Validate the hierarchy and return a list of warnings/issues.
 
+        Args:
+            nodes: Optional (object, depth) pairs of this hierarchy that were already
+                collected, e.g. by a profiler; validating them skips the tree walk
+
         Returns:
             List of warning messages (empty if no issues)
         """
         warnings_list = []
 
+        if nodes is not None:
+            for node, depth in nodes:
+                node._validate_node(depth, warnings_list)
+            return warnings_list
+
+        # Pre-order walk; children are pushed in reverse to keep the original order
+        stack = [(self, self.get_depth())]
+        while stack:
+            node, depth = stack.pop()
+            node._validate_node(depth, warnings_list)
+
+            for child in reversed(node.children):
+                stack.append((child, depth + 1))
+
+        return warnings_list
+
+    def _validate_node(self, depth: int, warnings_list: List[str]):
+        """
+        Append validation warnings for this object alone to warnings_list.
+
+        Args:
+            depth: Depth of this object in the hierarchy
+            warnings_list: List the warning messages are appended to
+        """
         # Check depth
-        depth = self.get_depth()
         if depth > self._depth_warning_threshold:
             warnings_list.append(
                 f"Object '{self.name}' is at depth {depth} "
@@ -322,12 +632,6 @@ class SceneObject(ABC):
                 f"(consider grouping for better organization)"
             )
 
-        # Recursively check children
-        for child in self.children:
-            warnings_list.extend(child.validate_hierarchy())
-
-        return warnings_list
-
     def set_depth_warning_threshold(self, threshold: int):
         """
         Set the depth threshold for performance warnings.
@@ -336,3 +640,33 @@ class SceneObject(ABC):
             threshold: Maximum depth before warning is issued
         """
         self._depth_warning_threshold = threshold
+        if self._crosses_depth_threshold():
+            _warn_deep_nodes([self])
+
+
+class InstrumentedSceneObject(SceneObject):
+    """
+    Scene object that counts world transform cache hits and misses.
+
+    SceneObject itself keeps get_world_transform free of bookkeeping. Mix this
+    class in ahead of a concrete scene object to collect statistics, e.g.
+    ``class ProfiledSphere(InstrumentedSceneObject, Sphere)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._cache_hits = 0
+        self._cache_misses = 0
+        super().__init__(*args, **kwargs)
+
+    def get_world_transform(self) -> np.ndarray:
+        # Every object on the unresolved part of the chain misses; the first
+        # cached one (possibly self) is a hit
+        node = self
+        while node is not None and node._world_transform_cache is None:
+            if isinstance(node, InstrumentedSceneObject):
+                node._cache_misses += 1
+            node = node.parent
+        if isinstance(node, InstrumentedSceneObject):
+            node._cache_hits += 1
+
+        return super().get_world_transform()
@@ -10,34 +10,112 @@ This module provides axis-aligned bounding box (AABB) support for:
 
 import numpy as np
 from typing import Optional, List, Tuple
-from dataclasses import dataclass
 
 
-@dataclass
+# For each of the 8 corners, whether it takes the min (0) or max (1) of x, y, z
+_CORNER_SELECT = np.array([
+    [0, 1, 1, 0, 0, 1, 1, 0],
+    [0, 0, 1, 1, 0, 0, 1, 1],
+    [0, 0, 0, 0, 1, 1, 1, 1]
+])
+# Position of each corner coordinate in a box's flat (min_xyz, max_xyz) storage
+_CORNER_INDEX = _CORNER_SELECT * 3 + np.arange(3).reshape(3, 1)
+
+# Maps the stacked (min, max) rows of a box to its (center, half extent) rows
+_CENTER_EXTENT = np.array([
+    [0.5, 0.5],
+    [-0.5, 0.5]
+])
+
+# Bounds row that intersects nothing, for objects without bounds
+_EMPTY_ROW = np.array([np.inf, np.inf, np.inf, -np.inf, -np.inf, -np.inf])
+
+# Largest coordinate of the 16-bit grid BVHArray quantizes boxes onto
+_QUANTIZED_MAX = 65535
+
+# From this many Nx3 points on, from_points reduces column by column
+_COLUMN_REDUCE_MIN_POINTS = 64
+
+# Below this many stale objects, hierarchy bounds transform boxes one at a time
+_BATCH_MIN_OBJECTS = 16
+
+
 class BoundingBox:
     """
     Axis-Aligned Bounding Box (AABB).
 
-    Represented by minimum and maximum corners in 3D space.
+    Represented by minimum and maximum corners in 3D space, stored together in
+    one contiguous array of 6 values (min_x, min_y, min_z, max_x, max_y, max_z).
+    Boxes are treated as immutable: all operations return new boxes.
 
     Attributes:
-        min: Minimum corner (3x1 array)
-        max: Maximum corner (3x1 array)
+        min: Minimum corner (flat array of shape (3,), a view into the storage)
+        max: Maximum corner (flat array of shape (3,), a view into the storage)
     """
-    min: np.ndarray  # 3x1
-    max: np.ndarray  # 3x1
+    __slots__ = ('_data',)
 
-    def __post_init__(self):
-        """Validate bounding box"""
-        if self.min.shape != (3, 1):
-            raise ValueError(f"min must be 3x1, got {self.min.shape}")
-        if self.max.shape != (3, 1):
-            raise ValueError(f"max must be 3x1, got {self.max.shape}")
+    def __init__(self, min: np.ndarray, max: np.ndarray):
+        """
+        Create a bounding box from its corners.
+
+        Args:
+            min: (3,) minimum corner
+            max: (3,) maximum corner
+
+        Raises:
+            ValueError: If a corner has the wrong shape or min > max on any axis
+        """
+        if min.shape != (3,):
+            raise ValueError(f"min must have shape (3,), got {min.shape}")
+        if max.shape != (3,):
+            raise ValueError(f"max must have shape (3,), got {max.shape}")
 
         # Ensure min <= max for each dimension (skip for empty boxes with inf values)
-        if not (np.any(np.isinf(self.min)) or np.any(np.isinf(self.max))):
-            if np.any(self.min > self.max):
-                raise ValueError(f"min must be <= max. Got min={self.min.flatten()}, max={self.max.flatten()}")
+        if not (np.any(np.isinf(min)) or np.any(np.isinf(max))):
+            if np.any(min > max):
+                raise ValueError(f"min must be <= max. Got min={min}, max={max}")
+
+        data = np.empty(6)
+        data[:3] = min
+        data[3:] = max
+        self._data = data
+
+    @classmethod
+    def _from_valid(cls, data: np.ndarray) -> 'BoundingBox':
+        """
+        Create a bounding box from storage that is valid by construction.
+
+        Skips the checks in __init__, which dominate the cost of the
+        boxes produced by transform() and merge().
+
+        Args:
+            data: (6,) float array (min_xyz, max_xyz) with min <= max, owned by the box
+
+        Returns:
+            New BoundingBox
+        """
+        box = cls.__new__(cls)
+        box._data = data
+        return box
+
+    @property
+    def min(self) -> np.ndarray:
+        """Minimum corner, shape (3,)"""
+        return self._data[:3]
+
+    @property
+    def max(self) -> np.ndarray:
+        """Maximum corner, shape (3,)"""
+        return self._data[3:]
+
+    def as_array(self) -> np.ndarray:
+        """
+        Get the box as one flat array.
+
+        Returns:
+            (6,) array (min_x, min_y, min_z, max_x, max_y, max_z); do not modify
+        """
+        return self._data
 
     @classmethod
     def from_points(cls, points: np.ndarray) -> 'BoundingBox':
@@ -50,16 +128,27 @@ class BoundingBox:
         Returns:
             BoundingBox enclosing all points
         """
+        if points.ndim != 2 or 3 not in points.shape:
+            raise ValueError(f"points must have shape (N, 3) or (3, N), got {points.shape}")
+
+        data = np.empty(6)
         if points.shape[0] == 3:
             # 3xN format
-            min_corner = np.min(points, axis=1).reshape(3, 1)
-            max_corner = np.max(points, axis=1).reshape(3, 1)
-        else:
+            points.min(axis=1, out=data[:3])
+            points.max(axis=1, out=data[3:])
+        elif len(points) < _COLUMN_REDUCE_MIN_POINTS:
             # Nx3 format
-            min_corner = np.min(points, axis=0).reshape(3, 1)
-            max_corner = np.max(points, axis=0).reshape(3, 1)
+            points.min(axis=0, out=data[:3])
+            points.max(axis=0, out=data[3:])
+        else:
+            # Nx3 format: NumPy reduces a long array over its short axis slowly,
+            # each strided column on its own is several times faster
+            for axis in range(3):
+                column = points[:, axis]
+                data[axis] = column.min()
+                data[axis + 3] = column.max()
 
-        return cls(min=min_corner, max=max_corner)
+        return cls._from_valid(data)
 
     @classmethod
     def from_center_size(cls, center: np.ndarray, size: np.ndarray) -> 'BoundingBox':
@@ -67,8 +156,8 @@ class BoundingBox:
         Create bounding box from center and size.
 
         Args:
-            center: 3x1 center point
-            size: 3x1 size (width, height, depth)
+            center: (3,) center point
+            size: (3,) size (width, height, depth)
 
         Returns:
             BoundingBox centered at center with given size
@@ -85,13 +174,14 @@ class BoundingBox:
             BoundingBox with inverted min/max (useful for merging)
         """
         return cls(
-            min=np.array([[np.inf], [np.inf], [np.inf]]),
-            max=np.array([[-np.inf], [-np.inf], [-np.inf]])
+            min=np.full(3, np.inf),
+            max=np.full(3, -np.inf)
         )
 
     def get_center(self) -> np.ndarray:
         """Get center point of bounding box"""
-        return (self.min + self.max) / 2.0
+        data = self._data
+        return (data[:3] + data[3:]) * 0.5
 
     def get_size(self) -> np.ndarray:
         """Get size (extents) of bounding box"""
@@ -99,13 +189,14 @@ class BoundingBox:
 
     def get_volume(self) -> float:
         """Get volume of bounding box"""
-        size = self.get_size()
-        return float(size[0, 0] * size[1, 0] * size[2, 0])
+        min_x, min_y, min_z, max_x, max_y, max_z = self._data.tolist()
+        return (max_x - min_x) * (max_y - min_y) * (max_z - min_z)
 
     def get_surface_area(self) -> float:
         """Get surface area of bounding box"""
-        size = self.get_size().flatten()
-        return 2.0 * (size[0] * size[1] + size[1] * size[2] + size[2] * size[0])
+        min_x, min_y, min_z, max_x, max_y, max_z = self._data.tolist()
+        sx, sy, sz = max_x - min_x, max_y - min_y, max_z - min_z
+        return 2.0 * (sx * sy + sy * sz + sz * sx)
 
     def get_corners(self) -> np.ndarray:
         """
@@ -114,31 +205,43 @@ class BoundingBox:
         Returns:
             3x8 array where each column is a corner
         """
-        x_min, y_min, z_min = self.min[0, 0], self.min[1, 0], self.min[2, 0]
-        x_max, y_max, z_max = self.max[0, 0], self.max[1, 0], self.max[2, 0]
-
-        corners = np.array([
-            [x_min, x_max, x_max, x_min, x_min, x_max, x_max, x_min],
-            [y_min, y_min, y_max, y_max, y_min, y_min, y_max, y_max],
-            [z_min, z_min, z_min, z_min, z_max, z_max, z_max, z_max]
-        ])
-
-        return corners
+        # A single gather from the flat storage, no per-corner arithmetic
+        return self._data[_CORNER_INDEX]
 
     def contains_point(self, point: np.ndarray) -> bool:
         """
         Check if a point is inside the bounding box.
 
         Args:
-            point: 3x1 point to test
+            point: Point to test, shape (3,) or 3x1
 
         Returns:
             True if point is inside or on the boundary
         """
-        return bool(
-            np.all(point >= self.min) and
-            np.all(point <= self.max)
-        )
+        # Compare Python floats: one tolist() per box instead of a NumPy scalar per index
+        x, y, z = point.reshape(3).tolist()
+        d = self._data.tolist()
+        return d[0] <= x <= d[3] and d[1] <= y <= d[4] and d[2] <= z <= d[5]
+
+    def contains_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Check many points against the bounding box at once.
+
+        Args:
+            points: Nx3 array with one point per row
+
+        Returns:
+            Boolean array of length N, True where the point is inside or on the boundary
+        """
+        min_x, min_y, min_z, max_x, max_y, max_z = self._data.tolist()
+        x, y, z = points[:, 0], points[:, 1], points[:, 2]
+        mask = x >= min_x
+        mask &= x <= max_x
+        mask &= y >= min_y
+        mask &= y <= max_y
+        mask &= z >= min_z
+        mask &= z <= max_z
+        return mask
 
     def intersects(self, other: 'BoundingBox') -> bool:
         """
@@ -150,11 +253,35 @@ class BoundingBox:
         Returns:
             True if bounding boxes overlap
         """
-        return bool(
-            np.all(self.min <= other.max) and
-            np.all(self.max >= other.min)
+        # Compare Python floats: one tolist() per box instead of a NumPy scalar per index
+        a = self._data.tolist()
+        b = other._data.tolist()
+        return (
+            a[0] <= b[3] and a[1] <= b[4] and a[2] <= b[5] and
+            a[3] >= b[0] and a[4] >= b[1] and a[5] >= b[2]
         )
 
+    def intersects_many(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Check this bounding box against many boxes at once.
+
+        Args:
+            boxes: Nx6 array with one box per row as (min_x, min_y, min_z, max_x, max_y, max_z)
+
+        Returns:
+            Boolean array of length N, True where the boxes overlap
+        """
+        # One pass per column: reducing over the short row axis with np.all is
+        # several times slower than six full-length comparisons
+        q_min_x, q_min_y, q_min_z, q_max_x, q_max_y, q_max_z = self._data.tolist()
+        mask = boxes[:, 0] <= q_max_x
+        mask &= boxes[:, 1] <= q_max_y
+        mask &= boxes[:, 2] <= q_max_z
+        mask &= boxes[:, 3] >= q_min_x
+        mask &= boxes[:, 4] >= q_min_y
+        mask &= boxes[:, 5] >= q_min_z
+        return mask
+
     def merge(self, other: 'BoundingBox') -> 'BoundingBox':
         """
         Merge this bounding box with another.
@@ -165,34 +292,31 @@ class BoundingBox:
         Returns:
             New bounding box containing both boxes
         """
-        new_min = np.minimum(self.min, other.min)
-        new_max = np.maximum(self.max, other.max)
-        return BoundingBox(min=new_min, max=new_max)
+        a, b = self._data, other._data
+        data = np.minimum(a, b)
+        data[3:] = np.maximum(a[3:], b[3:])
+        return BoundingBox._from_valid(data)
 
     def transform(self, matrix: np.ndarray) -> 'BoundingBox':
         """
-        Transform bounding box by a 4x4 transformation matrix.
+        Transform bounding box by a 4x4 affine transformation matrix.
 
         Args:
-            matrix: 4x4 transformation matrix
+            matrix: 4x4 affine transformation matrix (last row [0, 0, 0, 1])
 
         Returns:
             New bounding box in transformed space
         """
-        # Get all 8 corners
-        corners = self.get_corners()  # 3x8
-
-        # Convert to homogeneous coordinates
-        corners_homo = np.vstack([corners, np.ones((1, 8))])  # 4x8
-
-        # Transform all corners
-        transformed = matrix @ corners_homo  # 4x8
-
-        # Extract 3D points
-        transformed_3d = transformed[0:3, :]  # 3x8
-
-        # Create new bounding box from transformed points
-        return BoundingBox.from_points(transformed_3d)
+        # Work on center and half extent instead of the 8 corners: the new center is
+        # the transformed old one, and the new half extent along each axis is the
+        # sum of the absolute matrix entries times the old half extents
+        center, extent = _CENTER_EXTENT @ self._data.reshape(2, 3)
+        rotation_scale = matrix[0:3, 0:3]
+        new_center = rotation_scale @ center + matrix[0:3, 3]
+        new_extent = np.abs(rotation_scale) @ extent
+        return BoundingBox._from_valid(
+            np.concatenate((new_center - new_extent, new_center + new_extent))
+        )
 
     def expand(self, amount: float) -> 'BoundingBox':
         """
@@ -204,13 +328,12 @@ class BoundingBox:
         Returns:
             New expanded bounding box
         """
-        expansion = np.array([[amount], [amount], [amount]])
-        return BoundingBox(min=self.min - expansion, max=self.max + expansion)
+        return BoundingBox(min=self.min - amount, max=self.max + amount)
 
     def __repr__(self) -> str:
-        min_str = f"[{self.min[0,0]:.2f}, {self.min[1,0]:.2f}, {self.min[2,0]:.2f}]"
-        max_str = f"[{self.max[0,0]:.2f}, {self.max[1,0]:.2f}, {self.max[2,0]:.2f}]"
-        return f"BoundingBox(min={min_str}, max={max_str})"
+        x0, y0, z0, x1, y1, z1 = self._data.tolist()
+        return (f"BoundingBox(min=[{x0:.2f}, {y0:.2f}, {z0:.2f}], "
+                f"max=[{x1:.2f}, {y1:.2f}, {z1:.2f}])")
 
 
 def compute_sphere_bounds(center: np.ndarray, radius: float) -> BoundingBox:
@@ -218,14 +341,13 @@ def compute_sphere_bounds(center: np.ndarray, radius: float) -> BoundingBox:
     Compute bounding box for a sphere.
 
     Args:
-        center: 3x1 center of sphere
+        center: (3,) center of sphere
         radius: Radius of sphere
 
     Returns:
         BoundingBox tightly enclosing the sphere
     """
-    r = np.array([[radius], [radius], [radius]])
-    return BoundingBox(min=center - r, max=center + r)
+    return BoundingBox(min=center - radius, max=center + radius)
 
 
 def compute_hierarchy_bounds(scene_object, include_children: bool = True) -> Optional[BoundingBox]:
@@ -237,6 +359,10 @@ def compute_hierarchy_bounds(scene_object, include_children: bool = True) -> Opt
     2. Transforming to world space
     3. Merging with children's bounding boxes if requested
 
+    Results are cached on each object and reused until a transform in the
+    subtree changes or children are attached or detached, so repeated queries
+    on an unchanged hierarchy only compare modification stamps.
+
     Args:
         scene_object: SceneObject to compute bounds for
         include_children: If True, include all descendants in the bounds
@@ -244,30 +370,25 @@ def compute_hierarchy_bounds(scene_object, include_children: bool = True) -> Opt
     Returns:
         BoundingBox in world space, or None if object has no bounds
     """
-    # Import here to avoid circular dependency
-    from src.primitives.sphere import Sphere
-    from src.primitives.cylinder import Cylinder
-    from src.primitives.cone import Cone
-
-    # Compute local bounding box based on object type
-    local_bounds = None
-
-    if isinstance(scene_object, Sphere):
-        # Sphere: bounding box around origin with radius
-        local_bounds = compute_sphere_bounds(
-            center=np.zeros((3, 1)),
-            radius=scene_object.radius
-        )
+    if include_children:
+        return _subtree_bounds(scene_object)
+    return _object_bounds(scene_object)
 
-    elif isinstance(scene_object, (Cylinder, Cone)):
-        # Cylinder/Cone: bounding box based on height and radius
-        height = scene_object.height
-        radius = scene_object.radius
 
-        local_bounds = BoundingBox(
-            min=np.array([[-radius], [-radius], [0]]),
-            max=np.array([[radius], [radius], [height]])
-        )
+def _object_bounds(scene_object) -> Optional[BoundingBox]:
+    """
+    World-space bounds of a single object, cached until its transform changes.
+
+    Args:
+        scene_object: SceneObject to compute bounds for
+
+    Returns:
+        BoundingBox in world space, or None if object has no bounds
+    """
+    if scene_object._world_bounds_stamp == scene_object.last_modified:
+        return scene_object._world_bounds_cache
+
+    local_bounds = scene_object.local_bounds()
 
     # If we have local bounds, transform to world space
     if local_bounds is not None:
@@ -276,18 +397,295 @@ def compute_hierarchy_bounds(scene_object, include_children: bool = True) -> Opt
     else:
         world_bounds = None
 
-    # Include children if requested
-    if include_children:
-        children = scene_object.get_children()
-        for child in children:
-            child_bounds = compute_hierarchy_bounds(child, include_children=True)
+    scene_object._world_bounds_cache = world_bounds
+    scene_object._world_bounds_stamp = scene_object.last_modified
+    return world_bounds
+
+
+def _refresh_object_bounds(objects: List):
+    """
+    Recompute the cached world-space bounds of many objects at once.
+
+    Local boxes and world transforms are gathered into stacked arrays and
+    transformed together, in the same center/half-extent form as
+    BoundingBox.transform().
+
+    Args:
+        objects: SceneObjects whose world bounds are stale
+    """
+    with_bounds = []
+    boxes = []
+    for obj in objects:
+        local_bounds = obj.local_bounds()
+        if local_bounds is None:
+            obj._world_bounds_cache = None
+            obj._world_bounds_stamp = obj.last_modified
+        else:
+            with_bounds.append(obj)
+            boxes.append(local_bounds.as_array())
+    if not with_bounds:
+        return
+
+    boxes = np.array(boxes)
+    worlds = np.array([obj.get_world_transform() for obj in with_bounds])
+    rotation_scale = worlds[:, 0:3, 0:3]
+
+    centers = (boxes[:, :3] + boxes[:, 3:]) * 0.5
+    extents = (boxes[:, 3:] - boxes[:, :3]) * 0.5
+    new_centers = np.einsum('nij,nj->ni', rotation_scale, centers) + worlds[:, 0:3, 3]
+    new_extents = np.einsum('nij,nj->ni', np.abs(rotation_scale), extents)
+    world_boxes = np.concatenate((new_centers - new_extents, new_centers + new_extents), axis=1)
+
+    for obj, row in zip(with_bounds, world_boxes):
+        obj._world_bounds_cache = BoundingBox._from_valid(row)
+        obj._world_bounds_stamp = obj.last_modified
+
+
+def _subtree_bounds(scene_object) -> Optional[BoundingBox]:
+    """
+    World-space bounds of an object and all descendants, cached per subtree.
+
+    Walks the hierarchy with an explicit node list instead of recursion; nodes
+    are processed in reverse breadth-first order so children come before parents.
+
+    Args:
+        scene_object: SceneObject to compute bounds for
+
+    Returns:
+        BoundingBox in world space, or None if no object in the subtree has bounds
+    """
+    order = [scene_object]
+    i = 0
+    while i < len(order):
+        order.extend(order[i].get_children())
+        i += 1
+
+    # Bring many stale per-object bounds up to date in one batch
+    stale = [node for node in order if node._world_bounds_stamp != node.last_modified]
+    if len(stale) >= _BATCH_MIN_OBJECTS:
+        _refresh_object_bounds(stale)
+
+    # id(node) -> (bounds, newest modification stamp in the node's subtree)
+    results = {}
+    for node in reversed(order):
+        stamp = max(node.last_modified, node._children_modified)
+        child_results = [results.pop(id(child)) for child in node.get_children()]
+        for _, child_stamp in child_results:
+            if child_stamp > stamp:
+                stamp = child_stamp
+
+        # Stamps only grow, so an unchanged newest stamp means an unchanged subtree
+        if node._hierarchy_bounds_stamp == stamp:
+            results[id(node)] = (node._hierarchy_bounds_cache, stamp)
+            continue
+
+        world_bounds = _object_bounds(node)
+        for child_bounds, _ in child_results:
             if child_bounds is not None:
                 if world_bounds is None:
                     world_bounds = child_bounds
                 else:
                     world_bounds = world_bounds.merge(child_bounds)
 
-    return world_bounds
+        node._hierarchy_bounds_cache = world_bounds
+        node._hierarchy_bounds_stamp = stamp
+        results[id(node)] = (world_bounds, stamp)
+
+    return results[id(scene_object)][0]
+
+
+def collect_bounds_array(scene_object, include_children: bool = True) -> Tuple[List, np.ndarray]:
+    """
+    Gather the world-space bounds of a hierarchy into one array.
+
+    Each object contributes its own bounds (without its children); objects
+    without bounds are skipped.
+
+    Args:
+        scene_object: Root object to collect from
+        include_children: If True, collect all descendants as well
+
+    Returns:
+        Tuple (objects, boxes) where boxes is an Nx6 array whose row i holds
+        (min_xyz, max_xyz) of objects[i], in depth-first order
+    """
+    objects = []
+    rows = []
+
+    # Children are pushed in reverse so they pop in their original order
+    stack = [scene_object]
+    while stack:
+        obj = stack.pop()
+        bounds = compute_hierarchy_bounds(obj, include_children=False)
+        if bounds is not None:
+            objects.append(obj)
+            rows.append(bounds.as_array())
+        if include_children:
+            stack.extend(reversed(obj.get_children()))
+
+    boxes = np.array(rows) if rows else np.empty((0, 6))
+    return objects, boxes
+
+
+class BVHArray:
+    """
+    Scene hierarchy flattened into arrays for repeated box queries.
+
+    Objects are stored in breadth-first order, so the children of each object
+    occupy one contiguous index range. Every object keeps its own world bounds
+    and the world bounds of its whole subtree, and queries skip each subtree
+    whose bounds miss the query box. The arrays are a snapshot: build a new
+    BVHArray after the hierarchy or a transform in it changes.
+
+    Attributes:
+        objects: SceneObjects in breadth-first order
+        boxes: Nx6 own world bounds per object as (min_xyz, max_xyz); objects
+            without bounds get an empty (inverted) row
+        subtree_boxes: Nx6 world bounds of each object and its descendants
+        first_child: Index of each object's first child
+        child_count: Number of children of each object
+    """
+
+    def __init__(self, objects: List, boxes: np.ndarray, subtree_boxes: np.ndarray,
+                 first_child: np.ndarray, child_count: np.ndarray):
+        self.objects = objects
+        self.boxes = boxes
+        self.subtree_boxes = subtree_boxes
+        self.first_child = first_child
+        self.child_count = child_count
+
+        # 16-bit copies of both box arrays, one row per coordinate, for the
+        # conservative first test in query(). The grid spans the finite bounds.
+        finite = boxes[np.isfinite(boxes).all(axis=1)]
+        if len(finite):
+            low = finite[:, :3].min(axis=0)
+            extent = finite[:, 3:].max(axis=0) - low
+        else:
+            low = np.zeros(3)
+            extent = np.ones(3)
+        self._grid_low = np.tile(low, 2)
+        self._grid_scale = np.tile(_QUANTIZED_MAX / np.where(extent > 0, extent, 1.0), 2)
+        self._quantized_boxes = self._quantize(boxes).T.copy()
+        self._quantized_subtree_boxes = self._quantize(subtree_boxes).T.copy()
+
+    def _quantize(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Map boxes onto the 16-bit grid, rounding outward so they only grow.
+
+        Args:
+            boxes: Nx6 (or (6,)) boxes as (min_xyz, max_xyz)
+
+        Returns:
+            Boxes of the same shape as uint16
+        """
+        scaled = (boxes - self._grid_low) * self._grid_scale
+        scaled[..., :3] = np.floor(scaled[..., :3])
+        scaled[..., 3:] = np.ceil(scaled[..., 3:])
+        return np.clip(scaled, 0, _QUANTIZED_MAX).astype(np.uint16)
+
+    @staticmethod
+    def _columns(boxes: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """
+        Select the columns of a 6xN box array for ascending indices.
+
+        A run of consecutive indices, such as all children of one object, is
+        sliced instead of gathered.
+        """
+        if indices.size and indices[-1] - indices[0] + 1 == indices.size:
+            return boxes[:, indices[0]:indices[-1] + 1]
+        return np.take(boxes, indices, axis=1)
+
+    @classmethod
+    def from_root(cls, scene_object) -> 'BVHArray':
+        """
+        Flatten a hierarchy together with its world-space bounds.
+
+        Args:
+            scene_object: Root object of the hierarchy
+
+        Returns:
+            BVHArray of scene_object and all descendants
+        """
+        # Brings the per-object and per-subtree bounds caches of the hierarchy up to date
+        compute_hierarchy_bounds(scene_object)
+
+        objects = [scene_object]
+        first_child = []
+        child_count = []
+        i = 0
+        while i < len(objects):
+            children = objects[i].get_children()
+            first_child.append(len(objects))
+            child_count.append(len(children))
+            objects.extend(children)
+            i += 1
+
+        boxes = np.array([
+            _EMPTY_ROW if obj._world_bounds_cache is None else obj._world_bounds_cache.as_array()
+            for obj in objects
+        ])
+        subtree_boxes = np.array([
+            _EMPTY_ROW if obj._hierarchy_bounds_cache is None else obj._hierarchy_bounds_cache.as_array()
+            for obj in objects
+        ])
+        return cls(objects, boxes, subtree_boxes,
+                   np.array(first_child, dtype=np.intp), np.array(child_count, dtype=np.intp))
+
+    def query(self, query_box: BoundingBox) -> List:
+        """
+        Find all objects whose own bounds intersect a query box.
+
+        Args:
+            query_box: Query bounding box
+
+        Returns:
+            List of objects whose bounds intersect the query box, in breadth-first order
+        """
+        hits = []
+        quantized_query = self._quantize(query_box.as_array()).tolist()
+        # One hierarchy level per iteration, each tested with batched NumPy calls
+        frontier = np.zeros(1 if self.objects else 0, dtype=np.intp)
+        while frontier.size:
+            # The 16-bit test never misses an overlap; the float test confirms
+            frontier = frontier[_intersects_quantized(
+                self._columns(self._quantized_subtree_boxes, frontier), quantized_query
+            )]
+            candidates = frontier[_intersects_quantized(
+                self._columns(self._quantized_boxes, frontier), quantized_query
+            )]
+            hits.extend(candidates[query_box.intersects_many(self.boxes[candidates])].tolist())
+
+            # Expand each remaining object into the index range of its children
+            counts = self.child_count[frontier]
+            total = int(counts.sum())
+            if not total:
+                break
+            range_offsets = np.cumsum(counts) - counts
+            frontier = (np.repeat(self.first_child[frontier] - range_offsets, counts)
+                        + np.arange(total))
+
+        objects = self.objects
+        return [objects[i] for i in hits]
+
+
+def _intersects_quantized(boxes: np.ndarray, query: List[int]) -> np.ndarray:
+    """
+    Test quantized boxes against a quantized query box.
+
+    Args:
+        boxes: 6xN uint16 array, one row per coordinate (min_xyz, max_xyz)
+        query: Quantized query box as 6 ints (min_xyz, max_xyz)
+
+    Returns:
+        Boolean array of length N, True where the boxes overlap
+    """
+    mask = boxes[0] <= query[3]
+    mask &= boxes[1] <= query[4]
+    mask &= boxes[2] <= query[5]
+    mask &= boxes[3] >= query[0]
+    mask &= boxes[4] >= query[1]
+    mask &= boxes[5] >= query[2]
+    return mask
 
 
 def find_objects_in_box(scene_object, query_box: BoundingBox,
@@ -295,6 +693,9 @@ def find_objects_in_box(scene_object, query_box: BoundingBox,
     """
     Find all objects whose bounding boxes intersect a query box.
 
+    For many queries against an unchanged hierarchy, build a BVHArray once
+    and query that instead.
+
     Args:
         scene_object: Root object to search from
         query_box: Query bounding box
@@ -303,20 +704,9 @@ def find_objects_in_box(scene_object, query_box: BoundingBox,
     Returns:
         List of objects whose bounds intersect the query box
     """
-    results = []
-
-    # Check this object
-    obj_bounds = compute_hierarchy_bounds(scene_object, include_children=False)
-    if obj_bounds is not None and obj_bounds.intersects(query_box):
-        results.append(scene_object)
-
-    # Check children if requested
-    if include_children:
-        children = scene_object.get_children()
-        for child in children:
-            results.extend(find_objects_in_box(child, query_box, include_children=True))
-
-    return results
+    objects, boxes = collect_bounds_array(scene_object, include_children)
+    mask = query_box.intersects_many(boxes)
+    return [objects[i] for i in np.flatnonzero(mask)]
 
 
 def check_collision(obj1, obj2) -> bool:
@@ -7,22 +7,149 @@ and get recommendations for optimization.
 """
 
 import time
-from typing import List, Dict, Any, Optional
+from array import array
+import numpy as np
+from collections import deque
+from typing import Deque, Iterable, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProfileResult:
-    """Result of a profiling operation"""
+    """Result of a profiling operation (immutable, without a per-instance __dict__)"""
     name: str
     total_objects: int
     max_depth: int
     avg_depth: float
     total_cache_hits: int
     total_cache_misses: int
-    cache_hit_rate: float
+    # None when no object counted accesses (plain SceneObjects are not instrumented)
+    cache_hit_rate: Optional[float]
     warnings: List[str]
-    execution_time_ms: float
+    execution_time_ns: int
+    sampled: bool = False
+
+    @property
+    def execution_time_ms(self) -> float:
+        """Profiling time in milliseconds"""
+        return self.execution_time_ns / 1_000_000
+
+
+# One row per benchmark_transform_updates() call
+_BENCH_DTYPE = np.dtype([('iters', 'i8'), ('ns', 'i8'), ('n_obj', 'i8'), ('batched', '?')])
+
+_get_cache_hits = attrgetter('_cache_hits')
+_get_cache_misses = attrgetter('_cache_misses')
+
+
+def _hit_rate(hits: int, misses: int) -> Optional[float]:
+    """
+    Cache hit rate in percent.
+
+    Args:
+        hits: Total cache hits
+        misses: Total cache misses
+
+    Returns:
+        Hit rate, or None if nothing was counted (e.g. only plain SceneObjects,
+        which do not track cache accesses)
+    """
+    total_accesses = hits + misses
+    return hits / total_accesses * 100 if total_accesses > 0 else None
+
+
+def _format_hit_rate(hit_rate: Optional[float]) -> str:
+    """Format a hit rate as e.g. ' 95.00%', or 'n/a' when unavailable"""
+    return f"{hit_rate:6.2f}%" if hit_rate is not None else "   n/a"
+
+
+@lru_cache(maxsize=128)
+def _recommendations(max_depth: int, cache_hit_rate: Optional[float],
+                     total_objects: int, warning_count: int) -> Tuple[str, ...]:
+    """
+    Build optimization recommendations from profiling summary values.
+
+    Args:
+        max_depth: Maximum hierarchy depth
+        cache_hit_rate: Cache hit rate in percent, or None if not measured
+        total_objects: Number of objects in the hierarchy
+        warning_count: Number of validation warnings
+
+    Returns:
+        Tuple of recommendation strings
+    """
+    recommendations = []
+
+    # Deep hierarchy check
+    if max_depth > 20:
+        recommendations.append(
+            f"[FIX] Deep hierarchy detected (depth={max_depth}). "
+            f"Consider flattening by grouping objects or restructuring."
+        )
+    elif max_depth > 10:
+        recommendations.append(
+            f"[TIP] Moderate hierarchy depth ({max_depth}). "
+            f"Monitor performance if it increases further."
+        )
+
+    # Cache performance check; skipped when the objects do not count accesses
+    if cache_hit_rate is not None and cache_hit_rate < 50:
+        recommendations.append(
+            f"[FIX] Low cache hit rate ({cache_hit_rate:.1f}%). "
+            f"Objects may be updating too frequently. Consider batching updates."
+        )
+    elif cache_hit_rate is not None and cache_hit_rate < 70:
+        recommendations.append(
+            f"[TIP] Cache hit rate could be improved ({cache_hit_rate:.1f}%). "
+            f"Review update patterns."
+        )
+
+    # Large hierarchy check
+    if total_objects > 1000:
+        recommendations.append(
+            f"[FIX] Large hierarchy ({total_objects} objects). "
+            f"Consider spatial partitioning or level-of-detail techniques."
+        )
+    elif total_objects > 500:
+        recommendations.append(
+            f"[TIP] Growing hierarchy ({total_objects} objects). "
+            f"Monitor memory usage as it scales."
+        )
+
+    # Specific warnings
+    if warning_count:
+        recommendations.append(
+            f"[ACTION] Address {warning_count} validation warnings above."
+        )
+
+    if not recommendations:
+        recommendations.append("[OK] Hierarchy is well-optimized! No recommendations.")
+
+    return tuple(recommendations)
+
+
+# Comparison report templates, bound once so compare_results only fills them in
+_COMPARISON_FMT = "\n".join([
+    "\n" + "=" * 70,
+    "COMPARISON: '{r1.name}' vs '{r2.name}'",
+    "=" * 70,
+    "\n[SIZE COMPARISON]",
+    "  Objects:      {r1.total_objects:6} vs {r2.total_objects:6}",
+    "  Max Depth:    {r1.max_depth:6} vs {r2.max_depth:6}",
+    "  Avg Depth:    {r1.avg_depth:6.2f} vs {r2.avg_depth:6.2f}",
+    "\n[CACHE COMPARISON]",
+    "  Hit Rate:     {rate1} vs {rate2}",
+    "{cache_change}",
+    "\n[WARNINGS]",
+    "  {r1.name}: {warnings1} warnings",
+    "  {r2.name}: {warnings2} warnings",
+    "\n" + "=" * 70,
+]).format
+_IMPROVEMENT_FMT = "  Improvement:  +{:.2f}% [BETTER]".format
+_WORSENING_FMT = "  Change:       {:.2f}% [WORSE]".format
 
 
 class HierarchyProfiler:
@@ -30,42 +157,84 @@ class HierarchyProfiler:
     Profiler for analyzing scene hierarchies and providing optimization recommendations.
     """
 
-    def __init__(self):
-        self.results: List[ProfileResult] = []
+    def __init__(self, history_limit: Optional[int] = 1000):
+        """
+        Initialize profiler.
 
-    def profile(self, root_object, name: str = "Unnamed Hierarchy") -> ProfileResult:
+        Args:
+            history_limit: Maximum number of results kept in self.results; the oldest
+                results are dropped first. None keeps every result.
+        """
+        self.results: Deque[ProfileResult] = deque(maxlen=history_limit)
+        # Random source for sampled profiles
+        self._rng = np.random.default_rng()
+        self._bench_history = np.empty(0, dtype=_BENCH_DTYPE)
+        # State of the last profile() call, used by profile_incremental()
+        self._last_root = None
+        self._last_objects: List = []
+        self._last_depths: List[int] = []
+        # Per-object snapshot: id -> (object, parent id, depth, hits, misses, child ids)
+        self._last_snapshot: Optional[Dict[int, tuple]] = None
+        self._snapshot_warnings: Dict[int, List[str]] = {}
+        self._depth_counts: Dict[int, int] = {}
+        self._depth_total = 0
+        self._hits_total = 0
+        self._misses_total = 0
+        self._dirty: Dict[int, Any] = {}
+
+    def profile(self, root_object, name: str = "Unnamed Hierarchy",
+                sample_rate: float = 1.0) -> ProfileResult:
         """
         Profile a hierarchy starting from a root object.
 
+        With a sample_rate below 1, cache counters are read from a random subset of
+        the objects and extrapolated, and validation is skipped. Object count and
+        depth statistics stay exact.
+
         Args:
             root_object: The root of the hierarchy to profile
             name: Name for this profiling session
+            sample_rate: Fraction of objects whose cache counters are read, in (0, 1]
 
         Returns:
             ProfileResult with comprehensive statistics
+
+        Raises:
+            ValueError: If sample_rate is not in (0, 1]
         """
-        start_time = time.perf_counter()
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        sampled = sample_rate < 1
 
-        # Collect all objects in hierarchy
-        all_objects = self._collect_all_objects(root_object)
+        start_time = time.perf_counter_ns()
+
+        # Collect all objects in hierarchy together with their depths
+        all_objects, depths = self._collect_with_depths(root_object)
 
-        # Calculate statistics
+        # Depth statistics are reduced by NumPy; cache counters are summed through
+        # pre-bound attribute getters, which avoids a generator frame per object
         total_objects = len(all_objects)
-        depths = [obj.get_depth() for obj in all_objects]
-        max_depth = max(depths) if depths else 0
-        avg_depth = sum(depths) / len(depths) if depths else 0
+        max_depth = int(depths.max()) if total_objects else 0
+        avg_depth = float(depths.mean()) if total_objects else 0
+        depth_list = depths.tolist()
+        if sampled:
+            # Each object is drawn independently, so every depth level is sampled
+            # at the same expected rate
+            mask = self._rng.random(total_objects) < sample_rate
+            sample = list(compress(all_objects, mask.tolist()))
+            total_hits = round(sum(map(_get_cache_hits, sample)) / sample_rate)
+            total_misses = round(sum(map(_get_cache_misses, sample)) / sample_rate)
+            warnings = []
+        else:
+            total_hits = sum(map(_get_cache_hits, all_objects))
+            total_misses = sum(map(_get_cache_misses, all_objects))
 
-        # Cache statistics
-        total_hits = sum(obj._cache_hits for obj in all_objects)
-        total_misses = sum(obj._cache_misses for obj in all_objects)
-        total_accesses = total_hits + total_misses
-        hit_rate = (total_hits / total_accesses * 100) if total_accesses > 0 else 0
+            # Validate the collected objects without walking the tree again
+            warnings = root_object.validate_hierarchy(nodes=zip(all_objects, depth_list))
 
-        # Validate and collect warnings
-        warnings = root_object.validate_hierarchy()
+        hit_rate = _hit_rate(total_hits, total_misses)
 
-        end_time = time.perf_counter()
-        execution_time = (end_time - start_time) * 1000  # ms
+        execution_time = time.perf_counter_ns() - start_time
 
         result = ProfileResult(
             name=name,
@@ -76,19 +245,214 @@ class HierarchyProfiler:
             total_cache_misses=total_misses,
             cache_hit_rate=hit_rate,
             warnings=warnings,
-            execution_time_ms=execution_time
+            execution_time_ns=execution_time,
+            sampled=sampled
         )
 
+        # Keep the traversal for profile_incremental(); the per-object snapshot
+        # is only built from it once an incremental profile is requested
+        self._last_root = root_object
+        self._last_objects = all_objects
+        self._last_depths = depth_list
+        self._last_snapshot = None
+        self._dirty.clear()
+
         self.results.append(result)
         return result
 
+    def mark_dirty(self, obj):
+        """
+        Mark a subtree as changed since the last profile.
+
+        Args:
+            obj: Root of the changed subtree; re-walked by the next
+                profile_incremental() call without explicit changed_roots
+        """
+        self._dirty[id(obj)] = obj
+
+    def profile_incremental(self, changed_roots: Optional[Iterable] = None,
+                            name: str = "Unnamed Hierarchy") -> ProfileResult:
+        """
+        Profile the hierarchy of the last profile() call, re-walking only changed subtrees.
+
+        Every object whose subtree was mutated must be passed (or marked dirty); after
+        a reparenting this includes the old and the new parent. Objects outside the
+        changed subtrees keep the statistics of the previous profile, and warnings of
+        re-walked objects are reported after the unchanged ones.
+
+        Args:
+            changed_roots: Roots of the subtrees mutated since the last profile;
+                defaults to the objects passed to mark_dirty()
+            name: Name for this profiling session
+
+        Returns:
+            ProfileResult with comprehensive statistics
+
+        Raises:
+            ValueError: If profile() was not called before
+        """
+        if self._last_root is None:
+            raise ValueError("profile() must be called before profile_incremental()")
+
+        start_time = time.perf_counter_ns()
+
+        root_object = self._last_root
+        if self._last_snapshot is None:
+            self._build_snapshot()
+
+        if changed_roots is None:
+            changed_roots = list(self._dirty.values())
+        self._dirty.clear()
+
+        for changed in changed_roots:
+            # Drop the old subtree, then re-add it if it still belongs to the hierarchy
+            self._snapshot_remove(id(changed))
+            if self._in_hierarchy(changed, root_object):
+                self._snapshot_add(changed)
+
+        total_objects = len(self._last_snapshot)
+        max_depth = max(self._depth_counts) if total_objects else 0
+        avg_depth = self._depth_total / total_objects if total_objects else 0
+        total_hits = self._hits_total
+        total_misses = self._misses_total
+        warnings = [message
+                    for node_warnings in self._snapshot_warnings.values()
+                    for message in node_warnings]
+
+        hit_rate = _hit_rate(total_hits, total_misses)
+
+        execution_time = time.perf_counter_ns() - start_time
+
+        result = ProfileResult(
+            name=name,
+            total_objects=total_objects,
+            max_depth=max_depth,
+            avg_depth=avg_depth,
+            total_cache_hits=total_hits,
+            total_cache_misses=total_misses,
+            cache_hit_rate=hit_rate,
+            warnings=warnings,
+            execution_time_ns=execution_time
+        )
+
+        self.results.append(result)
+        return result
+
+    def _build_snapshot(self):
+        """Build the per-object snapshot from the traversal of the last profile() call"""
+        self._last_snapshot = {}
+        self._snapshot_warnings = {}
+        self._depth_counts = {}
+        self._depth_total = 0
+        self._hits_total = 0
+        self._misses_total = 0
+        for obj, depth in zip(self._last_objects, self._last_depths):
+            self._snapshot_insert(obj, depth)
+
+    def _snapshot_insert(self, obj, depth: int):
+        """Record a single object in the snapshot and add it to the running totals"""
+        if id(obj) in self._last_snapshot:
+            # Reached again through another changed root; replace the old record
+            self._discard_entry(id(obj))
+        hits = obj._cache_hits
+        misses = obj._cache_misses
+        child_ids = tuple(map(id, obj.get_children()))
+        self._last_snapshot[id(obj)] = (obj, id(obj.parent), depth, hits, misses, child_ids)
+
+        self._depth_counts[depth] = self._depth_counts.get(depth, 0) + 1
+        self._depth_total += depth
+        self._hits_total += hits
+        self._misses_total += misses
+
+        node_warnings = obj.validate_hierarchy(nodes=((obj, depth),))
+        if node_warnings:
+            self._snapshot_warnings[id(obj)] = node_warnings
+
+    def _snapshot_add(self, obj):
+        """Record the current subtree of obj in the snapshot"""
+        stack = [(obj, obj.get_depth())]
+        while stack:
+            node, depth = stack.pop()
+            self._snapshot_insert(node, depth)
+            stack.extend((child, depth + 1) for child in reversed(node.get_children()))
+
+    def _snapshot_remove(self, obj_id: int):
+        """
+        Remove the subtree recorded under obj_id from the snapshot.
+
+        Children are followed through the recorded child ids, but only while they are
+        still recorded under this parent, so objects that were moved elsewhere and
+        re-added already are kept.
+        """
+        stack = [(obj_id, None)]
+        while stack:
+            node_id, parent_id = stack.pop()
+            entry = self._last_snapshot.get(node_id)
+            if entry is None or (parent_id is not None and entry[1] != parent_id):
+                continue
+            self._discard_entry(node_id)
+            stack.extend((child_id, node_id) for child_id in entry[5])
+
+    def _discard_entry(self, obj_id: int):
+        """Remove a single recorded object and subtract it from the running totals"""
+        _, _, depth, hits, misses, _ = self._last_snapshot.pop(obj_id)
+        count = self._depth_counts[depth] - 1
+        if count:
+            self._depth_counts[depth] = count
+        else:
+            del self._depth_counts[depth]
+        self._depth_total -= depth
+        self._hits_total -= hits
+        self._misses_total -= misses
+        self._snapshot_warnings.pop(obj_id, None)
+
+    @staticmethod
+    def _in_hierarchy(obj, root_object) -> bool:
+        """Check whether obj is root_object or one of its descendants"""
+        while obj is not None:
+            if obj is root_object:
+                return True
+            obj = obj.parent
+        return False
+
     def _collect_all_objects(self, obj) -> List:
-        """Recursively collect all objects in hierarchy"""
-        objects = [obj]
-        for child in obj.get_children():
-            objects.extend(self._collect_all_objects(child))
+        """Collect all objects in hierarchy in depth-first pre-order, without recursion"""
+        objects = []
+        stack = [obj]
+        # Bound methods are hoisted out of the loop; the result list is grown in place
+        pop = stack.pop
+        push_all = stack.extend
+        append = objects.append
+        while stack:
+            node = pop()
+            append(node)
+            # Pushed in reverse so children are visited in their original order
+            push_all(node.children[::-1])
         return objects
 
+    def _collect_with_depths(self, obj) -> Tuple[List, np.ndarray]:
+        """
+        Collect all objects in hierarchy in depth-first pre-order with their depths.
+
+        Depths are derived while descending, so no parent chain is walked per object.
+
+        Args:
+            obj: Root of the hierarchy
+
+        Returns:
+            Tuple (objects, depths) where depths[i] is the depth of objects[i]
+        """
+        objects = []
+        depths = array('q')
+        stack = [(obj, obj.get_depth())]
+        while stack:
+            node, depth = stack.pop()
+            objects.append(node)
+            depths.append(depth)
+            # Pushed in reverse so children are visited in their original order
+            stack.extend((child, depth + 1) for child in reversed(node.get_children()))
+        return objects, np.frombuffer(depths, dtype=np.int64)
+
     def print_report(self, result: ProfileResult):
         """
         Print a detailed profiling report.
@@ -96,44 +460,55 @@ class HierarchyProfiler:
         Args:
             result: The ProfileResult to report on
         """
-        print("\n" + "=" * 70)
-        print(f"HIERARCHY PROFILING REPORT: {result.name}")
-        print("=" * 70)
-
-        print(f"\n[HIERARCHY STATISTICS]")
-        print(f"  Total Objects:       {result.total_objects}")
-        print(f"  Maximum Depth:       {result.max_depth}")
-        print(f"  Average Depth:       {result.avg_depth:.2f}")
-
-        print(f"\n[CACHE PERFORMANCE]")
-        print(f"  Cache Hits:          {result.total_cache_hits}")
-        print(f"  Cache Misses:        {result.total_cache_misses}")
-        print(f"  Hit Rate:            {result.cache_hit_rate:.2f}%")
-
-        # Interpret cache performance
-        if result.cache_hit_rate > 90:
-            print(f"  Status:              [EXCELLENT]")
-        elif result.cache_hit_rate > 70:
-            print(f"  Status:              [GOOD]")
-        elif result.cache_hit_rate > 50:
-            print(f"  Status:              [FAIR] (consider optimization)")
+        # Build the report first and write it with a single print
+        lines = [
+            "\n" + "=" * 70,
+            f"HIERARCHY PROFILING REPORT: {result.name}",
+            "=" * 70,
+            "\n[HIERARCHY STATISTICS]",
+            f"  Total Objects:       {result.total_objects}",
+            f"  Maximum Depth:       {result.max_depth}",
+            f"  Average Depth:       {result.avg_depth:.2f}",
+            "\n[CACHE PERFORMANCE]",
+            f"  Cache Hits:          {result.total_cache_hits}",
+            f"  Cache Misses:        {result.total_cache_misses}",
+        ]
+
+        if result.cache_hit_rate is None:
+            # Plain SceneObjects do not count accesses, so there is nothing to rate
+            lines.append("  Hit Rate:            n/a (objects are not instrumented;"
+                         " use InstrumentedSceneObject)")
         else:
-            print(f"  Status:              [POOR] (needs optimization)")
+            lines.append(f"  Hit Rate:            {result.cache_hit_rate:.2f}%")
+
+            # Interpret cache performance
+            if result.cache_hit_rate > 90:
+                lines.append("  Status:              [EXCELLENT]")
+            elif result.cache_hit_rate > 70:
+                lines.append("  Status:              [GOOD]")
+            elif result.cache_hit_rate > 50:
+                lines.append("  Status:              [FAIR] (consider optimization)")
+            else:
+                lines.append("  Status:              [POOR] (needs optimization)")
 
-        print(f"\n[PROFILING TIME]        {result.execution_time_ms:.4f} ms")
+        if result.sampled:
+            lines.append("  Sampled:             counters extrapolated, validation skipped")
+
+        lines.append(f"\n[PROFILING TIME]        {result.execution_time_ms:.4f} ms")
 
         if result.warnings:
-            print(f"\n[WARNINGS] ({len(result.warnings)}):")
-            for i, warning in enumerate(result.warnings, 1):
-                print(f"  {i}. {warning}")
+            lines.append(f"\n[WARNINGS] ({len(result.warnings)}):")
+            lines.extend(f"  {i}. {warning}" for i, warning in enumerate(result.warnings, 1))
         else:
-            print(f"\n[OK] NO WARNINGS - Hierarchy looks good!")
+            lines.append("\n[OK] NO WARNINGS - Hierarchy looks good!")
 
-        print("\n" + "=" * 70)
+        lines.append("\n" + "=" * 70)
+        print("\n".join(lines))
 
     def get_optimization_recommendations(self, result: ProfileResult) -> List[str]:
         """
         Generate optimization recommendations based on profiling results.
+        Recommendations depend only on a few summary values and are cached on them.
 
         Args:
             result: The ProfileResult to analyze
@@ -141,54 +516,12 @@ class HierarchyProfiler:
         Returns:
             List of recommendation strings
         """
-        recommendations = []
-
-        # Deep hierarchy check
-        if result.max_depth > 20:
-            recommendations.append(
-                f"[FIX] Deep hierarchy detected (depth={result.max_depth}). "
-                f"Consider flattening by grouping objects or restructuring."
-            )
-        elif result.max_depth > 10:
-            recommendations.append(
-                f"[TIP] Moderate hierarchy depth ({result.max_depth}). "
-                f"Monitor performance if it increases further."
-            )
-
-        # Cache performance check
-        if result.cache_hit_rate < 50:
-            recommendations.append(
-                f"[FIX] Low cache hit rate ({result.cache_hit_rate:.1f}%). "
-                f"Objects may be updating too frequently. Consider batching updates."
-            )
-        elif result.cache_hit_rate < 70:
-            recommendations.append(
-                f"[TIP] Cache hit rate could be improved ({result.cache_hit_rate:.1f}%). "
-                f"Review update patterns."
-            )
-
-        # Large hierarchy check
-        if result.total_objects > 1000:
-            recommendations.append(
-                f"[FIX] Large hierarchy ({result.total_objects} objects). "
-                f"Consider spatial partitioning or level-of-detail techniques."
-            )
-        elif result.total_objects > 500:
-            recommendations.append(
-                f"[TIP] Growing hierarchy ({result.total_objects} objects). "
-                f"Monitor memory usage as it scales."
-            )
-
-        # Specific warnings
-        if result.warnings:
-            recommendations.append(
-                f"[ACTION] Address {len(result.warnings)} validation warnings above."
-            )
-
-        if not recommendations:
-            recommendations.append("[OK] Hierarchy is well-optimized! No recommendations.")
-
-        return recommendations
+        return list(_recommendations(
+            result.max_depth,
+            result.cache_hit_rate,
+            result.total_objects,
+            len(result.warnings)
+        ))
 
     def compare_results(self, result1: ProfileResult, result2: ProfileResult):
         """
@@ -198,43 +531,51 @@ class HierarchyProfiler:
             result1: First profiling result
             result2: Second profiling result
         """
-        print("\n" + "=" * 70)
-        print(f"COMPARISON: '{result1.name}' vs '{result2.name}'")
-        print("=" * 70)
-
-        print(f"\n[SIZE COMPARISON]")
-        print(f"  Objects:      {result1.total_objects:6} vs {result2.total_objects:6}")
-        print(f"  Max Depth:    {result1.max_depth:6} vs {result2.max_depth:6}")
-        print(f"  Avg Depth:    {result1.avg_depth:6.2f} vs {result2.avg_depth:6.2f}")
-
-        print(f"\n[CACHE COMPARISON]")
-        print(f"  Hit Rate:     {result1.cache_hit_rate:6.2f}% vs {result2.cache_hit_rate:6.2f}%")
-        cache_diff = result2.cache_hit_rate - result1.cache_hit_rate
-        if cache_diff > 0:
-            print(f"  Improvement:  +{cache_diff:.2f}% [BETTER]")
+        if result1.cache_hit_rate is None or result2.cache_hit_rate is None:
+            cache_diff = None
+        else:
+            cache_diff = result2.cache_hit_rate - result1.cache_hit_rate
+        if cache_diff is None:
+            cache_change = "  Change:       n/a"
+        elif cache_diff > 0:
+            cache_change = _IMPROVEMENT_FMT(cache_diff)
         elif cache_diff < 0:
-            print(f"  Change:       {cache_diff:.2f}% [WORSE]")
+            cache_change = _WORSENING_FMT(cache_diff)
         else:
-            print(f"  Change:       No change")
+            cache_change = "  Change:       No change"
 
-        print(f"\n[WARNINGS]")
-        print(f"  {result1.name}: {len(result1.warnings)} warnings")
-        print(f"  {result2.name}: {len(result2.warnings)} warnings")
+        print(_COMPARISON_FMT(r1=result1, r2=result2, cache_change=cache_change,
+                              rate1=_format_hit_rate(result1.cache_hit_rate),
+                              rate2=_format_hit_rate(result2.cache_hit_rate),
+                              warnings1=len(result1.warnings),
+                              warnings2=len(result2.warnings)))
 
-        print("\n" + "=" * 70)
+    @property
+    def benchmark_history(self) -> np.ndarray:
+        """
+        Results of all benchmark_transform_updates() calls as a structured array.
 
-    def benchmark_transform_updates(self, root_object, iterations: int = 100) -> Dict[str, float]:
+        Returns:
+            Array with the fields iters, ns (total time), n_obj and batched,
+            one row per call in call order
+        """
+        return self._bench_history
+
+    def benchmark_transform_updates(self, root_object, iterations: int = 100,
+                                    batched: bool = False) -> Dict[str, float]:
         """
         Benchmark transform update performance.
 
         Args:
             root_object: Root of hierarchy to benchmark
             iterations: Number of update iterations
+            batched: If True, refresh the hierarchy with one recompute_subtree()
+                call per iteration instead of querying every object
 
         Returns:
-            Dictionary with benchmark results
+            Dictionary with benchmark results; the run is also appended to
+            benchmark_history
         """
-        import numpy as np
         from src.datatypes.pose import Pose
 
         # Reset cache statistics
@@ -242,23 +583,35 @@ class HierarchyProfiler:
         for obj in all_objects:
             obj.reset_cache_statistics()
 
+        # One pose is updated in place, so allocations do not blur the measurement
+        pose = Pose(translation=np.zeros((3, 1)), rotation=np.zeros((3, 1)))
+        translation = pose.translation
+        rotation = pose.rotation
+
         # Benchmark updates
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         for i in range(iterations):
-            new_pose = Pose(
-                translation=np.array([[i * 0.1], [0], [0]]),
-                rotation=np.array([[0], [0], [i * 0.01]])
-            )
-            root_object.set_pose(new_pose)
-
-            # Force recalculation by getting world transforms
-            for obj in all_objects:
-                obj.get_world_transform()
-
-        end = time.perf_counter()
-        total_time = (end - start) * 1000  # ms
+            translation[0, 0] = i * 0.1
+            rotation[2, 0] = i * 0.01
+            root_object.set_pose(pose)
+
+            # Force recalculation of all world transforms
+            if batched:
+                root_object.recompute_subtree()
+            else:
+                for obj in all_objects:
+                    obj.get_world_transform()
+
+        total_time_ns = time.perf_counter_ns() - start
+        total_time = total_time_ns / 1_000_000  # ms
+
+        self._bench_history = np.append(
+            self._bench_history,
+            np.array([(iterations, total_time_ns, len(all_objects), batched)], dtype=_BENCH_DTYPE)
+        )
 
         return {
+            'total_time_ns': total_time_ns,
             'total_time_ms': total_time,
             'avg_per_iteration_ms': total_time / iterations,
             'iterations': iterations,
@@ -281,9 +634,7 @@ def create_profiling_report(root_object, name: str = "Scene") -> ProfileResult:
     result = profiler.profile(root_object, name)
     profiler.print_report(result)
 
-    print("\n[OPTIMIZATION RECOMMENDATIONS]")
     recommendations = profiler.get_optimization_recommendations(result)
-    for rec in recommendations:
-        print(f"  {rec}")
+    print("\n".join(["\n[OPTIMIZATION RECOMMENDATIONS]"] + [f"  {rec}" for rec in recommendations]))
 
     return result
@@ -6,10 +6,11 @@ import unittest
 import numpy as np
 
 from src.utils.bounding_box import (
-    BoundingBox, compute_sphere_bounds, compute_hierarchy_bounds,
+    BoundingBox, BVHArray, compute_sphere_bounds, compute_hierarchy_bounds,
     find_objects_in_box, check_collision
 )
 from src.primitives.sphere import Sphere
+from src.scene_object import SceneObject
 from src.datatypes.pose import Pose
 
 
@@ -18,22 +19,39 @@ class TestBoundingBox(unittest.TestCase):
     def test_bounding_box_creation(self):
         """Test creating a bounding box"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
-        np.testing.assert_array_equal(bbox.min, np.array([[0], [0], [0]]))
-        np.testing.assert_array_equal(bbox.max, np.array([[1], [1], [1]]))
+        np.testing.assert_array_equal(bbox.min, np.array([0, 0, 0]))
+        np.testing.assert_array_equal(bbox.max, np.array([1, 1, 1]))
 
     def test_invalid_bounding_box_raises_error(self):
         """Test that invalid bounding box raises ValueError"""
         with self.assertRaises(ValueError):
             # min > max
             BoundingBox(
-                min=np.array([[1], [1], [1]]),
-                max=np.array([[0], [0], [0]])
+                min=np.array([1, 1, 1]),
+                max=np.array([0, 0, 0])
             )
 
+    def test_column_vector_corners_raise_error(self):
+        """Test that min/max must be flat (3,) arrays"""
+        with self.assertRaises(ValueError):
+            BoundingBox(
+                min=np.array([[0], [0], [0]]),
+                max=np.array([[1], [1], [1]])
+            )
+
+    def test_as_array(self):
+        """Test that min and max are stored together as one flat array"""
+        bbox = BoundingBox(
+            min=np.array([0, 1, 2]),
+            max=np.array([3, 4, 5])
+        )
+        np.testing.assert_array_equal(bbox.as_array(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(bbox.as_array().dtype, np.float64)
+
     def test_from_points(self):
         """Test creating bounding box from points"""
         points = np.array([
@@ -45,18 +63,29 @@ class TestBoundingBox(unittest.TestCase):
 
         bbox = BoundingBox.from_points(points)
 
-        np.testing.assert_array_equal(bbox.min, np.array([[-1], [-1], [-1]]))
-        np.testing.assert_array_equal(bbox.max, np.array([[2], [2], [3]]))
+        np.testing.assert_array_equal(bbox.min, np.array([-1, -1, -1]))
+        np.testing.assert_array_equal(bbox.max, np.array([2, 2, 3]))
+
+    def test_from_points_large_cloud(self):
+        """Test creating bounding box from many points in both layouts"""
+        points = np.random.default_rng(0).uniform(-5, 5, size=(1000, 3))
+
+        for bbox in (BoundingBox.from_points(points), BoundingBox.from_points(points.T)):
+            np.testing.assert_array_equal(bbox.min, points.min(axis=0))
+            np.testing.assert_array_equal(bbox.max, points.max(axis=0))
+
+        with self.assertRaises(ValueError):
+            BoundingBox.from_points(np.zeros((10, 2)))
 
     def test_from_center_size(self):
         """Test creating bounding box from center and size"""
-        center = np.array([[5], [5], [5]])
-        size = np.array([[2], [4], [6]])
+        center = np.array([5, 5, 5])
+        size = np.array([2, 4, 6])
 
         bbox = BoundingBox.from_center_size(center, size)
 
-        expected_min = np.array([[4], [3], [2]])
-        expected_max = np.array([[6], [7], [8]])
+        expected_min = np.array([4, 3, 2])
+        expected_max = np.array([6, 7, 8])
 
         np.testing.assert_array_almost_equal(bbox.min, expected_min)
         np.testing.assert_array_almost_equal(bbox.max, expected_max)
@@ -71,32 +100,32 @@ class TestBoundingBox(unittest.TestCase):
     def test_get_center(self):
         """Test getting center of bounding box"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[4], [6], [8]])
+            min=np.array([0, 0, 0]),
+            max=np.array([4, 6, 8])
         )
 
         center = bbox.get_center()
-        expected = np.array([[2], [3], [4]])
+        expected = np.array([2, 3, 4])
 
         np.testing.assert_array_almost_equal(center, expected)
 
     def test_get_size(self):
         """Test getting size of bounding box"""
         bbox = BoundingBox(
-            min=np.array([[1], [2], [3]]),
-            max=np.array([[4], [7], [9]])
+            min=np.array([1, 2, 3]),
+            max=np.array([4, 7, 9])
         )
 
         size = bbox.get_size()
-        expected = np.array([[3], [5], [6]])
+        expected = np.array([3, 5, 6])
 
         np.testing.assert_array_almost_equal(size, expected)
 
     def test_get_volume(self):
         """Test computing volume"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[2], [3], [4]])
+            min=np.array([0, 0, 0]),
+            max=np.array([2, 3, 4])
         )
 
         volume = bbox.get_volume()
@@ -105,8 +134,8 @@ class TestBoundingBox(unittest.TestCase):
     def test_get_surface_area(self):
         """Test computing surface area"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[2], [2], [2]])
+            min=np.array([0, 0, 0]),
+            max=np.array([2, 2, 2])
         )
 
         # Cube with side 2: surface area = 6 * 4 = 24
@@ -116,8 +145,8 @@ class TestBoundingBox(unittest.TestCase):
     def test_get_corners(self):
         """Test getting all 8 corners"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
         corners = bbox.get_corners()
@@ -134,42 +163,42 @@ class TestBoundingBox(unittest.TestCase):
     def test_contains_point_inside(self):
         """Test point containment - point inside"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
-        point = np.array([[0.5], [0.5], [0.5]])
+        point = np.array([0.5, 0.5, 0.5])
         self.assertTrue(bbox.contains_point(point))
 
     def test_contains_point_outside(self):
         """Test point containment - point outside"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
-        point = np.array([[2], [0.5], [0.5]])
+        point = np.array([2, 0.5, 0.5])
         self.assertFalse(bbox.contains_point(point))
 
     def test_contains_point_on_boundary(self):
         """Test point containment - point on boundary"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
-        point = np.array([[0], [0.5], [0.5]])
+        point = np.array([0, 0.5, 0.5])
         self.assertTrue(bbox.contains_point(point))
 
     def test_intersects_overlapping(self):
         """Test intersection - overlapping boxes"""
         bbox1 = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[2], [2], [2]])
+            min=np.array([0, 0, 0]),
+            max=np.array([2, 2, 2])
         )
         bbox2 = BoundingBox(
-            min=np.array([[1], [1], [1]]),
-            max=np.array([[3], [3], [3]])
+            min=np.array([1, 1, 1]),
+            max=np.array([3, 3, 3])
         )
 
         self.assertTrue(bbox1.intersects(bbox2))
@@ -178,12 +207,12 @@ class TestBoundingBox(unittest.TestCase):
     def test_intersects_separated(self):
         """Test intersection - separated boxes"""
         bbox1 = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
         bbox2 = BoundingBox(
-            min=np.array([[2], [2], [2]]),
-            max=np.array([[3], [3], [3]])
+            min=np.array([2, 2, 2]),
+            max=np.array([3, 3, 3])
         )
 
         self.assertFalse(bbox1.intersects(bbox2))
@@ -192,37 +221,65 @@ class TestBoundingBox(unittest.TestCase):
     def test_intersects_touching(self):
         """Test intersection - touching boxes"""
         bbox1 = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
         bbox2 = BoundingBox(
-            min=np.array([[1], [0], [0]]),
-            max=np.array([[2], [1], [1]])
+            min=np.array([1, 0, 0]),
+            max=np.array([2, 1, 1])
         )
 
         self.assertTrue(bbox1.intersects(bbox2))
 
+    def test_contains_points(self):
+        """Test batched point containment"""
+        bbox = BoundingBox(
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
+        )
+        points = np.array([
+            [0.5, 0.5, 0.5],   # inside
+            [1.0, 0.0, 1.0],   # on boundary
+            [0.5, 0.5, 1.5],   # outside
+        ])
+
+        np.testing.assert_array_equal(bbox.contains_points(points), [True, True, False])
+
+    def test_intersects_many(self):
+        """Test batched intersection against several boxes"""
+        bbox = BoundingBox(
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
+        )
+        boxes = np.array([
+            [0.5, 0.5, 0.5, 2, 2, 2],   # overlapping
+            [2, 2, 2, 3, 3, 3],         # separated
+            [1, 0, 0, 2, 1, 1],         # touching
+        ])
+
+        np.testing.assert_array_equal(bbox.intersects_many(boxes), [True, False, True])
+
     def test_merge(self):
         """Test merging two bounding boxes"""
         bbox1 = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
         bbox2 = BoundingBox(
-            min=np.array([[2], [2], [2]]),
-            max=np.array([[3], [3], [3]])
+            min=np.array([2, 2, 2]),
+            max=np.array([3, 3, 3])
         )
 
         merged = bbox1.merge(bbox2)
 
-        np.testing.assert_array_equal(merged.min, np.array([[0], [0], [0]]))
-        np.testing.assert_array_equal(merged.max, np.array([[3], [3], [3]]))
+        np.testing.assert_array_equal(merged.min, np.array([0, 0, 0]))
+        np.testing.assert_array_equal(merged.max, np.array([3, 3, 3]))
 
     def test_transform_identity(self):
         """Test transforming by identity matrix"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
         transformed = bbox.transform(np.eye(4))
@@ -233,8 +290,8 @@ class TestBoundingBox(unittest.TestCase):
     def test_transform_translation(self):
         """Test transforming by translation"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
         # Translation by (5, 5, 5)
@@ -243,8 +300,8 @@ class TestBoundingBox(unittest.TestCase):
 
         transformed = bbox.transform(T)
 
-        expected_min = np.array([[5], [5], [5]])
-        expected_max = np.array([[6], [6], [6]])
+        expected_min = np.array([5, 5, 5])
+        expected_max = np.array([6, 6, 6])
 
         np.testing.assert_array_almost_equal(transformed.min, expected_min)
         np.testing.assert_array_almost_equal(transformed.max, expected_max)
@@ -252,8 +309,8 @@ class TestBoundingBox(unittest.TestCase):
     def test_transform_scaling(self):
         """Test transforming by scaling"""
         bbox = BoundingBox(
-            min=np.array([[-1], [-1], [-1]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([-1, -1, -1]),
+            max=np.array([1, 1, 1])
         )
 
         # Scale by 2
@@ -264,8 +321,8 @@ class TestBoundingBox(unittest.TestCase):
 
         transformed = bbox.transform(S)
 
-        expected_min = np.array([[-2], [-2], [-2]])
-        expected_max = np.array([[2], [2], [2]])
+        expected_min = np.array([-2, -2, -2])
+        expected_max = np.array([2, 2, 2])
 
         np.testing.assert_array_almost_equal(transformed.min, expected_min)
         np.testing.assert_array_almost_equal(transformed.max, expected_max)
@@ -273,14 +330,14 @@ class TestBoundingBox(unittest.TestCase):
     def test_expand(self):
         """Test expanding bounding box"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
         expanded = bbox.expand(0.5)
 
-        expected_min = np.array([[-0.5], [-0.5], [-0.5]])
-        expected_max = np.array([[1.5], [1.5], [1.5]])
+        expected_min = np.array([-0.5, -0.5, -0.5])
+        expected_max = np.array([1.5, 1.5, 1.5])
 
         np.testing.assert_array_almost_equal(expanded.min, expected_min)
         np.testing.assert_array_almost_equal(expanded.max, expected_max)
@@ -288,8 +345,8 @@ class TestBoundingBox(unittest.TestCase):
     def test_repr(self):
         """Test string representation"""
         bbox = BoundingBox(
-            min=np.array([[0], [0], [0]]),
-            max=np.array([[1], [1], [1]])
+            min=np.array([0, 0, 0]),
+            max=np.array([1, 1, 1])
         )
 
         repr_str = repr(bbox)
@@ -302,13 +359,13 @@ class TestBoundingBoxUtilities(unittest.TestCase):
 
     def test_compute_sphere_bounds(self):
         """Test computing bounds for a sphere"""
-        center = np.array([[5], [5], [5]])
+        center = np.array([5, 5, 5])
         radius = 2.0
 
         bbox = compute_sphere_bounds(center, radius)
 
-        expected_min = np.array([[3], [3], [3]])
-        expected_max = np.array([[7], [7], [7]])
+        expected_min = np.array([3, 3, 3])
+        expected_max = np.array([7, 7, 7])
 
         np.testing.assert_array_almost_equal(bbox.min, expected_min)
         np.testing.assert_array_almost_equal(bbox.max, expected_max)
@@ -325,8 +382,8 @@ class TestBoundingBoxUtilities(unittest.TestCase):
 
         # Should be centered at origin with radius 1
         self.assertIsNotNone(bbox)
-        np.testing.assert_array_almost_equal(bbox.min, np.array([[-1], [-1], [-1]]))
-        np.testing.assert_array_almost_equal(bbox.max, np.array([[1], [1], [1]]))
+        np.testing.assert_array_almost_equal(bbox.min, np.array([-1, -1, -1]))
+        np.testing.assert_array_almost_equal(bbox.max, np.array([1, 1, 1]))
 
     def test_compute_hierarchy_bounds_translated_sphere(self):
         """Test computing bounds for a translated sphere"""
@@ -340,8 +397,8 @@ class TestBoundingBoxUtilities(unittest.TestCase):
 
         # Should be centered at (5, 0, 0) with radius 1
         self.assertIsNotNone(bbox)
-        np.testing.assert_array_almost_equal(bbox.min, np.array([[4], [-1], [-1]]))
-        np.testing.assert_array_almost_equal(bbox.max, np.array([[6], [1], [1]]))
+        np.testing.assert_array_almost_equal(bbox.min, np.array([4, -1, -1]))
+        np.testing.assert_array_almost_equal(bbox.max, np.array([6, 1, 1]))
 
     def test_compute_hierarchy_bounds_with_children(self):
         """Test computing bounds for hierarchy with children"""
@@ -365,8 +422,57 @@ class TestBoundingBoxUtilities(unittest.TestCase):
         # Parent is at origin with radius 1: [-1, 1] in all dims
         # Child is at (5, 0, 0) relative to parent with radius 1: [4, 6] in x, [-1, 1] in y,z
         # Combined should be roughly [-1, 6] in x, [-1, 1] in y,z
-        self.assertLessEqual(bbox.min[0, 0], -0.9)
-        self.assertGreaterEqual(bbox.max[0, 0], 5.9)
+        self.assertLessEqual(bbox.min[0], -0.9)
+        self.assertGreaterEqual(bbox.max[0], 5.9)
+
+    def test_compute_hierarchy_bounds_cached_until_change(self):
+        """Test that hierarchy bounds are reused until the hierarchy changes"""
+        origin = Pose(
+            translation=np.array([[0], [0], [0]]),
+            rotation=np.array([[0], [0], [0]])
+        )
+        offset = Pose(
+            translation=np.array([[5], [0], [0]]),
+            rotation=np.array([[0], [0], [0]])
+        )
+        parent = Sphere(pose=origin, radius=1.0, name="parent")
+        child = Sphere(pose=offset, radius=1.0, name="child", parent=parent)
+
+        bbox = compute_hierarchy_bounds(parent)
+        self.assertIs(compute_hierarchy_bounds(parent), bbox)
+
+        # Moving the child updates the parent's hierarchy bounds
+        child.set_pose(Pose(
+            translation=np.array([[8], [0], [0]]),
+            rotation=np.array([[0], [0], [0]])
+        ))
+        self.assertAlmostEqual(compute_hierarchy_bounds(parent).max[0], 9.0)
+
+        # Detaching the child shrinks them back to the parent alone
+        parent.remove_child(child)
+        self.assertAlmostEqual(compute_hierarchy_bounds(parent).max[0], 1.0)
+
+    def test_compute_hierarchy_bounds_many_objects(self):
+        """Test that batched bounds of a large hierarchy match per-object transforms"""
+        rotated = Pose(
+            translation=np.array([[1], [2], [3]]),
+            rotation=np.array([[0.3], [0.2], [0.1]])
+        )
+        parent = Sphere(pose=rotated, radius=1.0, name="parent")
+        children = [
+            Sphere(pose=rotated, radius=0.5 + i * 0.1, name=f"child{i}", parent=parent)
+            for i in range(20)
+        ]
+
+        bbox = compute_hierarchy_bounds(parent)
+
+        expected = parent.local_bounds().transform(parent.get_world_transform())
+        for child in children:
+            child_bounds = compute_hierarchy_bounds(child, include_children=False)
+            direct = child.local_bounds().transform(child.get_world_transform())
+            np.testing.assert_array_almost_equal(child_bounds.as_array(), direct.as_array())
+            expected = expected.merge(direct)
+        np.testing.assert_array_almost_equal(bbox.as_array(), expected.as_array())
 
     def test_find_objects_in_box(self):
         """Test finding objects in a query box"""
@@ -402,14 +508,44 @@ class TestBoundingBoxUtilities(unittest.TestCase):
 
         # Query box near origin
         query = BoundingBox(
-            min=np.array([[-2], [-2], [-2]]),
-            max=np.array([[2], [2], [2]])
+            min=np.array([-2, -2, -2]),
+            max=np.array([2, 2, 2])
         )
 
         results = find_objects_in_box(sphere1, query, include_children=True)
 
         # Should find sphere1 (at origin) but not sphere2 or sphere3
-        self.assertIn(sphere1, results)
+        self.assertEqual(results, [sphere1])
+
+    def test_bvh_array_query(self):
+        """Test that a flattened hierarchy finds the same objects as a direct search"""
+        def pose_at(x, y):
+            return Pose(
+                translation=np.array([[x], [y], [0]]),
+                rotation=np.array([[0], [0], [0]])
+            )
+
+        root = SceneObject(pose=pose_at(0, 0), name="root")
+        left = Sphere(pose=pose_at(-10, 0), radius=1.0, name="left", parent=root)
+        right = Sphere(pose=pose_at(10, 0), radius=1.0, name="right", parent=root)
+        left_child = Sphere(pose=pose_at(0, 3), radius=1.0, name="left_child", parent=left)
+        right_child = Sphere(pose=pose_at(0, 3), radius=1.0, name="right_child", parent=right)
+
+        bvh = BVHArray.from_root(root)
+        self.assertEqual(bvh.objects, [root, left, right, left_child, right_child])
+
+        query = BoundingBox(min=np.array([-12, 2, -1]), max=np.array([-8, 4, 1]))
+        self.assertEqual(bvh.query(query), [left_child])
+        self.assertEqual(bvh.query(query), find_objects_in_box(root, query))
+
+        everything = BoundingBox(min=np.full(3, -100.0), max=np.full(3, 100.0))
+        self.assertEqual(bvh.query(everything), [left, right, left_child, right_child])
+
+        # Boxes that only touch still intersect despite the 16-bit prefilter
+        touching = BoundingBox(min=np.array([-9, -1, -1]), max=np.array([-8, 1, 1]))
+        self.assertEqual(bvh.query(touching), [left])
+        gap = BoundingBox(min=np.array([-8.999, -1, -1]), max=np.array([-8, 1, 1]))
+        self.assertEqual(bvh.query(gap), [])
 
     def test_check_collision_intersecting(self):
         """Test collision detection - intersecting spheres"""
@@ -0,0 +1,68 @@
+"""
+Unit tests for camera matrix caching.
+
+OpenGL calls are stubbed, since no GL context is available in the tests.
+"""
+
+import unittest
+from unittest import mock
+
+from src.rendering import camera as camera_module
+from src.rendering import renderer as renderer_module
+from src.rendering.camera import Camera
+from src.rendering.renderer import Renderer
+from src.rendering.scene import Scene
+
+
+class TestCamera(unittest.TestCase):
+
+    def setUp(self):
+        """Stub the GL and GLU calls made by the camera"""
+        self.gl = {}
+        for name in ('glMatrixMode', 'glLoadIdentity', 'glLoadMatrixf', 'glGetFloatv',
+                     'gluPerspective', 'glOrtho', 'gluLookAt'):
+            patcher = mock.patch.object(camera_module, name)
+            self.gl[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_unchanged_camera_reloads_matrices(self):
+        """Test that matrices are built once and then reloaded"""
+        camera = Camera.perspective()
+        camera.apply()
+        camera.apply()
+
+        self.assertEqual(self.gl['gluPerspective'].call_count, 1)
+        self.assertEqual(self.gl['gluLookAt'].call_count, 1)
+        self.assertEqual(self.gl['glLoadMatrixf'].call_count, 2)
+
+    def test_direct_assignment_rebuilds(self):
+        """Test that directly assigned parameters rebuild the matrices"""
+        camera = Camera.perspective(fov=45.0)
+        camera.apply()
+
+        camera.fov = 60.0
+        camera.position = [1.0, 2.0, 3.0]
+        camera.apply()
+
+        self.assertEqual(self.gl['gluPerspective'].call_args[0][0], 60.0)
+        self.assertEqual(self.gl['gluLookAt'].call_args[0][:3], (1.0, 2.0, 3.0))
+
+    def test_render_frame_without_fps_limit(self):
+        """Test that render_frame (the fps_limit=0 path) picks up a changed fov"""
+        renderer = Renderer.__new__(Renderer)
+        renderer.width, renderer.height = 800, 600
+        renderer.window = None
+        camera = Camera.perspective(fov=45.0)
+        scene = Scene()
+
+        with mock.patch.object(Renderer, 'clear'), mock.patch.object(renderer_module, 'glfw'):
+            renderer.render_frame(scene, camera)
+            camera.fov = 70.0
+            renderer.render_frame(scene, camera)
+
+        self.assertEqual(self.gl['gluPerspective'].call_count, 2)
+        self.assertEqual(self.gl['gluPerspective'].call_args[0][0], 70.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+"""
+Unit tests for the cone mesh generation.
+"""
+
+import unittest
+import numpy as np
+
+from src.primitives.cone import Cone
+from src.datatypes.pose import Pose
+
+
+class TestCone(unittest.TestCase):
+
+    def setUp(self):
+        self.cone = Cone(pose=Pose(translation=np.zeros((3, 1)), rotation=np.zeros((3, 1))),
+                         radius=1.0, height=2.0, num_segments=8)
+
+    def test_base_has_flat_normals(self):
+        """Test that every base fan vertex points straight down"""
+        _, normal_array, (base_idx, _) = self.cone.get_indexed_mesh()
+        np.testing.assert_array_equal(normal_array[base_idx], np.tile([0.0, 0.0, -1.0], (len(base_idx), 1)))
+        np.testing.assert_array_equal(self.cone.get_normals()[0], normal_array[base_idx])
+
+    def test_side_normals(self):
+        """Test that side ring normals are unit length, slanted outwards and match the base ring positions"""
+        vertex_array, normal_array, (base_idx, side_idx) = self.cone.get_indexed_mesh()
+        ring = normal_array[side_idx[1:]]
+        np.testing.assert_allclose(np.linalg.norm(ring, axis=1), 1.0, rtol=1e-6)
+        self.assertTrue(np.all(ring[:, 2] > 0.0))
+        np.testing.assert_array_equal(vertex_array[base_idx[1:]], vertex_array[side_idx[1:]])
+
+
+if __name__ == '__main__':
+    unittest.main()
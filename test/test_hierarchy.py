@@ -6,23 +6,30 @@ transform propagation, and reparenting scenarios.
 """
 
 import unittest
+import warnings
 import numpy as np
 
 from src.primitives.sphere import Sphere
+from src.scene_object import InstrumentedSceneObject
 from src.datatypes.pose import Pose
 from src.datatypes.scaling import Scaling
 
 
+class InstrumentedSphere(InstrumentedSceneObject, Sphere):
+    """Sphere that counts world transform cache hits and misses"""
+
+
 class TestHierarchy(unittest.TestCase):
 
-    def setUp(self):
-        """Create test objects before each test"""
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared poses once; no test modifies them"""
         # Create some basic poses
-        self.origin_pose = Pose(
+        cls.origin_pose = Pose(
             translation=np.array([[0], [0], [0]]),
             rotation=np.array([[0], [0], [0]])
         )
-        self.offset_pose = Pose(
+        cls.offset_pose = Pose(
             translation=np.array([[5], [0], [0]]),
             rotation=np.array([[0], [0], [0]])
         )
@@ -133,6 +140,24 @@ class TestHierarchy(unittest.TestCase):
         self.assertNotIn(child, parent1.get_children())
         self.assertEqual(len(parent1.get_children()), 0)
 
+    def test_add_children(self):
+        """Test adding several children at once, and rejecting the batch on a cycle"""
+        root = Sphere(pose=self.origin_pose, name="Root")
+        parent = Sphere(pose=self.offset_pose, name="Parent", parent=root)
+        children = [Sphere(pose=self.offset_pose, name=f"Child{i}") for i in range(3)]
+
+        parent.add_children(children)
+        self.assertEqual(parent.get_children(), children)
+        for child in children:
+            self.assertIs(child.get_parent(), parent)
+            self.assertEqual(child.get_depth(), 2)
+
+        other = Sphere(pose=self.offset_pose, name="Other")
+        with self.assertRaises(ValueError):
+            children[0].add_children([other, root])
+        self.assertIsNone(other.get_parent())
+        self.assertIsNone(root.get_parent())
+
     def test_circular_reference_direct(self):
         """Test that direct circular references are prevented (A -> A)"""
         obj = Sphere(pose=self.origin_pose, name="SelfRef")
@@ -171,6 +196,21 @@ class TestHierarchy(unittest.TestCase):
 
         self.assertIn("cycle", str(context.exception).lower())
 
+    def test_reparent_under_deeper_cousin(self):
+        """Test that a deeper object in another branch is a valid parent"""
+        root = Sphere(pose=self.origin_pose, name="Root")
+        branch_a = Sphere(pose=self.offset_pose, name="BranchA", parent=root)
+        branch_b = Sphere(pose=self.offset_pose, name="BranchB", parent=root)
+        cousin = Sphere(pose=self.offset_pose, name="Cousin", parent=branch_b)
+        deep_cousin = Sphere(pose=self.offset_pose, name="DeepCousin", parent=cousin)
+
+        branch_a.set_parent(deep_cousin)
+        self.assertIs(branch_a.parent, deep_cousin)
+        self.assertEqual(branch_a.get_depth(), 4)
+
+        with self.assertRaises(ValueError):
+            branch_b.set_parent(branch_a)
+
     def test_deep_hierarchy(self):
         """Test creating a deep hierarchy (grandparent -> parent -> child -> grandchild)"""
         grandparent = Sphere(pose=self.origin_pose, name="Grandparent")
@@ -203,8 +243,8 @@ class TestHierarchy(unittest.TestCase):
         child.get_world_transform()
 
         # Verify caches are clean
-        self.assertFalse(parent._world_transform_dirty)
-        self.assertFalse(child._world_transform_dirty)
+        self.assertIsNotNone(parent._world_transform_cache)
+        self.assertIsNotNone(child._world_transform_cache)
 
         # Update parent pose
         new_pose = Pose(
@@ -214,8 +254,8 @@ class TestHierarchy(unittest.TestCase):
         parent.set_pose(new_pose)
 
         # Verify both parent and child are marked dirty
-        self.assertTrue(parent._world_transform_dirty)
-        self.assertTrue(child._world_transform_dirty)
+        self.assertIsNone(parent._world_transform_cache)
+        self.assertIsNone(child._world_transform_cache)
 
     def test_transform_propagation_deep(self):
         """Test that transform dirty flags propagate through deep hierarchy"""
@@ -242,10 +282,27 @@ class TestHierarchy(unittest.TestCase):
         root.set_pose(new_pose)
 
         # Verify all levels are marked dirty
-        self.assertTrue(root._world_transform_dirty)
-        self.assertTrue(level1._world_transform_dirty)
-        self.assertTrue(level2._world_transform_dirty)
-        self.assertTrue(level3._world_transform_dirty)
+        self.assertIsNone(root._world_transform_cache)
+        self.assertIsNone(level1._world_transform_cache)
+        self.assertIsNone(level2._world_transform_cache)
+        self.assertIsNone(level3._world_transform_cache)
+
+    def test_invalidation_beyond_recursion_limit(self):
+        """Test that moving the root of a very deep chain updates its leaf"""
+        root = Sphere(pose=self.origin_pose, name="Root")
+        leaf = root
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for i in range(1500):
+                leaf = Sphere(pose=self.offset_pose, name=f"Node{i}", parent=leaf)
+
+        np.testing.assert_array_almost_equal(leaf.get_world_transform()[0:3, 3], [7500, 0, 0])
+
+        root.set_pose(self.offset_pose)
+        root.set_pose(self.origin_pose)
+        root.set_pose(self.offset_pose)
+        self.assertIsNone(leaf._world_transform_cache)
+        np.testing.assert_array_almost_equal(leaf.get_world_transform()[0:3, 3], [7505, 0, 0])
 
     def test_world_transform_inheritance(self):
         """Test that child's world transform includes parent's transform"""
@@ -368,6 +425,34 @@ class TestHierarchy(unittest.TestCase):
 
         np.testing.assert_array_almost_equal(child_world_pos, expected_pos)
 
+    def test_local_transform_follows_local_changes(self):
+        """Test that a child's local transform is reused across parent moves but not after local changes"""
+        parent = Sphere(pose=self.origin_pose, name="Parent")
+        child_pose = Pose(
+            translation=np.array([[1.0], [0.0], [0.0]]),
+            rotation=np.array([[0.0], [0.0], [0.0]])
+        )
+        child = Sphere(pose=child_pose, name="Child", parent=parent)
+        np.testing.assert_array_almost_equal(child.get_world_transform()[0:3, 3], [1, 0, 0])
+
+        # Moving the parent keeps the child's local offset
+        parent.set_pose(self.offset_pose)
+        np.testing.assert_array_almost_equal(
+            child.get_world_transform(), parent.get_world_transform() @ child.get_local_transform()
+        )
+
+        # Scaling and in-place pose edits change the local transform itself
+        child.set_scaling(Scaling(x=2.0, y=2.0, z=2.0))
+        np.testing.assert_array_almost_equal(
+            child.get_world_transform(), parent.get_world_transform() @ child.get_local_transform()
+        )
+        child_pose.translation[1, 0] = 3.0
+        child.mark_transform_dirty()
+        np.testing.assert_array_almost_equal(
+            child.get_world_transform(), parent.get_world_transform() @ child.get_local_transform()
+        )
+        np.testing.assert_array_almost_equal(child.get_local_transform()[0:3, 3], [1, 3, 0])
+
     def test_constructor_with_parent(self):
         """Test creating object with parent specified in constructor"""
         parent = Sphere(pose=self.origin_pose, name="Parent")
@@ -389,6 +474,155 @@ class TestHierarchy(unittest.TestCase):
         self.assertEqual(len(parent.get_children()), 1)
         self.assertEqual(parent.get_children().count(child), 1)
 
+    def test_remove_middle_child(self):
+        """Test that removing a child from the middle keeps the remaining children consistent"""
+        parent = Sphere(pose=self.origin_pose, name="Parent")
+        children = [Sphere(pose=self.offset_pose, name=f"Child{i}", parent=parent) for i in range(4)]
+
+        parent.remove_child(children[1])
+        children[2].set_parent(None)
+
+        self.assertEqual(sorted(c.name for c in parent.get_children()), ["Child0", "Child3"])
+        for index, child in enumerate(parent.get_children()):
+            self.assertIs(child.get_parent(), parent)
+            self.assertEqual(child._index_in_parent, index)
+
+        # Removing an object that is not a child is a no-op
+        parent.remove_child(children[1])
+        self.assertEqual(len(parent.get_children()), 2)
+
+    def test_depth_follows_reparenting(self):
+        """Test that cached depths are updated for the whole moved subtree"""
+        root = Sphere(pose=self.origin_pose, name="Root")
+        branch = Sphere(pose=self.origin_pose, name="Branch", parent=root)
+        child = Sphere(pose=self.origin_pose, name="Child")
+        grandchild = Sphere(pose=self.origin_pose, name="Grandchild", parent=child)
+
+        child.set_parent(branch)
+        self.assertEqual(child.get_depth(), 2)
+        self.assertEqual(grandchild.get_depth(), 3)
+
+        branch.remove_child(child)
+        self.assertEqual(child.get_depth(), 0)
+        self.assertEqual(grandchild.get_depth(), 1)
+
+    def test_identity_child_shares_parent_world_transform(self):
+        """Test that a child with identity pose reuses its parent's world matrix"""
+        parent = Sphere(pose=self.offset_pose, name="Parent")
+        group = Sphere(pose=self.origin_pose, name="Group", parent=parent)
+
+        self.assertIs(group.get_world_transform(), parent.get_world_transform())
+
+        # Moving the parent is reflected in the shared matrix
+        parent.set_pose(Pose(
+            translation=np.array([[0], [3], [0]]),
+            rotation=np.array([[0], [0], [0]])
+        ))
+        np.testing.assert_array_almost_equal(group.get_world_transform()[:3, 3], [0, 3, 0])
+
+        # Scaling makes the local transform non-identity again
+        group.set_scaling(Scaling(x=2.0, y=2.0, z=2.0))
+        self.assertIsNot(group.get_world_transform(), parent.get_world_transform())
+        self.assertAlmostEqual(group.get_world_transform()[0, 0], 2.0)
+
+    def test_deep_hierarchy_warns_once(self):
+        """Test that exceeding the depth threshold warns when attached, not on every transform query"""
+        root = Sphere(pose=self.offset_pose, name="Root")
+        child = Sphere(pose=self.offset_pose, name="Child", parent=root)
+        leaf = Sphere(pose=self.offset_pose, name="Leaf")
+        leaf.set_depth_warning_threshold(1)
+
+        with self.assertWarns(UserWarning):
+            leaf.set_parent(child)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            leaf.get_world_transform()
+            root.set_pose(self.origin_pose)
+            leaf.get_world_transform()
+            leaf.set_parent(root)
+            leaf.set_parent(child)
+
+    def test_deep_hierarchy_warning_points_at_caller(self):
+        """Test that the depth warning is attributed to the caller for every entry point"""
+        root = Sphere(pose=self.offset_pose, name="Root")
+        child = Sphere(pose=self.offset_pose, name="Child", parent=root)
+
+        def deep_leaf(name):
+            leaf = Sphere(pose=self.offset_pose, name=name)
+            leaf.set_depth_warning_threshold(1)
+            return leaf
+
+        attach = [
+            lambda: deep_leaf("A").set_parent(child),
+            lambda: child.add_child(deep_leaf("B")),
+            lambda: child.add_children([deep_leaf("C")]),
+            lambda: Sphere(pose=self.offset_pose, name="D", parent=child).set_depth_warning_threshold(0),
+        ]
+        for call in attach:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                call()
+            self.assertEqual(len(caught), 1)
+            self.assertEqual(caught[0].filename, __file__)
+
+    def test_plain_objects_do_not_count_cache_accesses(self):
+        """Test that only instrumented objects record cache statistics"""
+        parent = Sphere(pose=self.offset_pose, name="Parent")
+        child = InstrumentedSphere(pose=self.offset_pose, name="Child", parent=parent)
+
+        child.get_world_transform()
+        child.get_world_transform()
+
+        self.assertEqual(parent.get_cache_statistics()['total'], 0)
+        self.assertEqual(child.get_cache_statistics()['hits'], 1)
+        self.assertEqual(child.get_cache_statistics()['misses'], 1)
+
+    def test_shared_parent_transform_computed_once(self):
+        """Test that a parent's world transform is computed once for all children until it changes"""
+        parent = InstrumentedSphere(pose=self.offset_pose, name="Parent")
+        children = [InstrumentedSphere(pose=self.offset_pose, name=f"Child{i}", parent=parent)
+                    for i in range(3)]
+
+        # Two "frames" without any pose change
+        for _ in range(2):
+            for child in children:
+                child.get_world_transform()
+
+        self.assertEqual(parent._cache_misses, 1)
+        for child in children:
+            self.assertEqual(child._cache_misses, 1)
+
+        # Moving the parent invalidates each transform exactly once
+        parent.set_pose(self.origin_pose)
+        for child in children:
+            child.get_world_transform()
+
+        self.assertEqual(parent._cache_misses, 2)
+        for child in children:
+            self.assertEqual(child._cache_misses, 2)
+            np.testing.assert_array_almost_equal(child.get_world_transform()[:3, 3], [5, 0, 0])
+
+
+    def test_recompute_subtree(self):
+        """Test that recomputing a subtree in one pass matches per-node world transforms"""
+        rotated_pose = Pose(
+            translation=np.array([[1], [2], [0]]),
+            rotation=np.array([[0], [0], [np.pi / 4]])
+        )
+        grandparent = Sphere(pose=self.offset_pose, name="Grandparent")
+        parent = Sphere(pose=rotated_pose, name="Parent", parent=grandparent)
+        children = [Sphere(pose=rotated_pose, name=f"Child{i}", parent=parent) for i in range(2)]
+        Sphere(pose=self.offset_pose, name="Grandchild", parent=children[0])
+        nodes = [parent] + children + children[0].get_children()
+
+        expected = [node.get_world_transform().copy() for node in nodes]
+        parent.mark_transform_dirty()
+        parent.recompute_subtree()
+
+        for node, matrix in zip(nodes, expected):
+            self.assertIsNotNone(node._world_transform_cache)
+            np.testing.assert_array_almost_equal(node.get_world_transform(), matrix)
 
 if __name__ == '__main__':
     unittest.main()
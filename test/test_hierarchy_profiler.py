@@ -0,0 +1,144 @@
+"""
+Unit tests for the hierarchy profiler.
+
+Tests that incremental profiles agree with full profiles after
+adding, removing and reparenting objects.
+"""
+
+import contextlib
+import io
+import unittest
+import numpy as np
+
+from src.primitives.sphere import Sphere
+from src.scene_object import InstrumentedSceneObject
+from src.datatypes.pose import Pose
+from src.utils.hierarchy_profiler import HierarchyProfiler
+
+
+class InstrumentedSphere(InstrumentedSceneObject, Sphere):
+    """Sphere that counts world transform cache hits and misses"""
+
+
+class TestHierarchyProfiler(unittest.TestCase):
+
+    def setUp(self):
+        """Create a small hierarchy root -> a -> a1, root -> b"""
+        pose = Pose(
+            translation=np.array([[1], [0], [0]]),
+            rotation=np.array([[0], [0], [0]])
+        )
+        self.root = Sphere(pose, radius=1.0, name="root")
+        self.a = Sphere(pose, radius=1.0, name="a")
+        self.a1 = Sphere(pose, radius=1.0, name="a1")
+        self.b = Sphere(pose, radius=1.0, name="b")
+        self.a.set_parent(self.root)
+        self.a1.set_parent(self.a)
+        self.b.set_parent(self.root)
+        self.profiler = HierarchyProfiler()
+
+    def assert_matches_full_profile(self, result):
+        """Compare an incremental result with a fresh full profile"""
+        full = HierarchyProfiler().profile(self.root)
+        self.assertEqual(result.total_objects, full.total_objects)
+        self.assertEqual(result.max_depth, full.max_depth)
+        self.assertAlmostEqual(result.avg_depth, full.avg_depth)
+        self.assertEqual(sorted(result.warnings), sorted(full.warnings))
+
+    def test_incremental_requires_profile(self):
+        """Test that an incremental profile needs a previous full profile"""
+        with self.assertRaises(ValueError):
+            self.profiler.profile_incremental([self.root])
+
+    def test_incremental_after_adding_and_removing(self):
+        """Test incremental profiles after growing and shrinking a subtree"""
+        self.profiler.profile(self.root)
+
+        leaf = Sphere(self.a1.pose, radius=1.0, name="leaf")
+        leaf.set_parent(self.a1)
+        result = self.profiler.profile_incremental([self.a1])
+        self.assertEqual(result.total_objects, 5)
+        self.assertEqual(result.max_depth, 3)
+        self.assert_matches_full_profile(result)
+
+        self.root.remove_child(self.a)
+        result = self.profiler.profile_incremental([self.root])
+        self.assertEqual(result.total_objects, 2)
+        self.assert_matches_full_profile(result)
+
+    def test_incremental_after_reparenting(self):
+        """Test that marking old and new parent dirty handles a move in any order"""
+        self.profiler.profile(self.root)
+
+        self.a1.set_parent(self.b)
+        self.profiler.mark_dirty(self.b)
+        self.profiler.mark_dirty(self.a)
+        result = self.profiler.profile_incremental()
+        self.assertEqual(result.total_objects, 4)
+        self.assert_matches_full_profile(result)
+
+    def test_history_limit(self):
+        """Test that only the most recent results are kept"""
+        profiler = HierarchyProfiler(history_limit=2)
+        for name in ("first", "second", "third"):
+            profiler.profile(self.root, name)
+        self.assertEqual([result.name for result in profiler.results], ["second", "third"])
+
+    def test_sampled_profile(self):
+        """Test that sampling keeps exact structure statistics and flags the result"""
+        full = self.profiler.profile(self.root)
+        self.assertFalse(full.sampled)
+
+        result = self.profiler.profile(self.root, sample_rate=0.5)
+        self.assertTrue(result.sampled)
+        self.assertEqual(result.total_objects, full.total_objects)
+        self.assertEqual(result.max_depth, full.max_depth)
+        self.assertEqual(result.warnings, [])
+
+        with self.assertRaises(ValueError):
+            self.profiler.profile(self.root, sample_rate=0)
+
+    def test_plain_objects_have_no_hit_rate(self):
+        """Test that uninstrumented objects report no hit rate instead of 0%"""
+        self.a1.get_world_transform()
+        self.a1.get_world_transform()
+        result = self.profiler.profile(self.root)
+        self.assertIsNone(result.cache_hit_rate)
+
+        recommendations = self.profiler.get_optimization_recommendations(result)
+        self.assertFalse(any("cache hit rate" in rec for rec in recommendations))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.profiler.print_report(result)
+            self.profiler.compare_results(result, result)
+        report = output.getvalue()
+        self.assertIn("n/a", report)
+        self.assertNotIn("Status:", report)
+
+    def test_instrumented_hit_rate(self):
+        """Test that instrumented objects report their hit rate"""
+        pose = self.root.pose
+        root = InstrumentedSphere(pose, radius=1.0, name="root")
+        child = InstrumentedSphere(pose, radius=1.0, name="child")
+        child.set_parent(root)
+        child.get_world_transform()  # Two misses: child and root
+        child.get_world_transform()  # One hit
+
+        result = self.profiler.profile(root)
+        self.assertAlmostEqual(result.cache_hit_rate, 100 / 3)
+
+    def test_benchmark_history(self):
+        """Test that every benchmark run is recorded as a row"""
+        self.profiler.benchmark_transform_updates(self.root, iterations=3)
+        self.profiler.benchmark_transform_updates(self.root, iterations=2, batched=True)
+
+        history = self.profiler.benchmark_history
+        self.assertEqual(history['iters'].tolist(), [3, 2])
+        self.assertEqual(history['n_obj'].tolist(), [4, 4])
+        self.assertEqual(history['batched'].tolist(), [False, True])
+        self.assertTrue((history['ns'] > 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
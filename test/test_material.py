@@ -366,6 +366,20 @@ class TestMaterialIntegration(unittest.TestCase):
         expected_ambient = [c * 0.2 for c in new_color]
         self.assertEqual(material.ambient, expected_ambient)
 
+    def test_material_version(self):
+        """Test that material setters bump the object's material version"""
+        pose = Pose(translation=np.array([[0.0], [0.0], [0.0]]),
+                   rotation=np.array([[0.0], [0.0], [0.0]]))
+        sphere = Sphere(pose=pose, radius=1.0)
+        version = sphere.material_version
+
+        sphere.set_color([0.0, 1.0, 0.0, 1.0])
+        self.assertGreater(sphere.material_version, version)
+
+        version = sphere.material_version
+        sphere.set_material(MaterialPresets.gold())
+        self.assertGreater(sphere.material_version, version)
+
     def test_material_preset_integration(self):
         """Test using material presets with primitives"""
         pose = Pose(translation=np.array([[0.0], [0.0], [0.0]]),
@@ -0,0 +1,77 @@
+"""
+Unit tests for GPU buffer sharing between primitive wrappers.
+
+OpenGL calls are stubbed, since no GL context is available in the tests.
+"""
+
+import itertools
+import unittest
+from unittest import mock
+import numpy as np
+
+from src.primitives import opengl_primitives_wrapper as wrapper_module
+from src.primitives.opengl_primitives_wrapper import OpenGLPrimitivesWrapper
+from src.primitives.sphere import Sphere
+from src.datatypes.pose import Pose
+
+
+class TestSharedBuffers(unittest.TestCase):
+
+    def setUp(self):
+        """Stub buffer creation and deletion and start from an empty share table"""
+        ids = itertools.count(1)
+
+        def upload(wrapper, vertices, normals, indices):
+            wrapper._indexed = (next(ids), next(ids), next(ids), len(vertices), [])
+
+        self.gl = {}
+        for name in ('glDeleteVertexArrays', 'glDeleteBuffers'):
+            patcher = mock.patch.object(wrapper_module, name)
+            self.gl[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(OpenGLPrimitivesWrapper, '_upload_indexed', autospec=True,
+                                    side_effect=upload)
+        self.upload = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        OpenGLPrimitivesWrapper.release_shared_buffers()
+        self.addCleanup(OpenGLPrimitivesWrapper._shared_buffers.clear)
+        self.gl['glDeleteVertexArrays'].reset_mock()
+
+        pose = Pose(translation=np.zeros((3, 1)), rotation=np.zeros((3, 1)))
+        self.first = OpenGLPrimitivesWrapper(Sphere(pose=pose, subdivision=1))
+        self.second = OpenGLPrimitivesWrapper(Sphere(pose=pose, subdivision=1))
+
+    def test_same_mesh_is_uploaded_once(self):
+        """Test that wrappers of equal meshes share buffers until the last one is released"""
+        self.first._acquire_indexed()
+        self.second._acquire_indexed()
+        self.assertEqual(self.upload.call_count, 1)
+        self.assertIs(self.first._indexed, self.second._indexed)
+
+        self.first.release()
+        self.gl['glDeleteVertexArrays'].assert_not_called()
+        self.second.release()
+        self.gl['glDeleteVertexArrays'].assert_called_once()
+        self.assertEqual(OpenGLPrimitivesWrapper._shared_buffers, {})
+
+    def test_release_shared_buffers(self):
+        """Test that releasing the share table deletes the buffers once and wrappers upload again"""
+        self.first._acquire_indexed()
+        self.second._acquire_indexed()
+
+        OpenGLPrimitivesWrapper.release_shared_buffers()
+        self.gl['glDeleteVertexArrays'].assert_called_once()
+        self.assertEqual(OpenGLPrimitivesWrapper._shared_buffers, {})
+
+        # Stale wrappers neither delete the buffers again nor keep using them
+        self.first.release()
+        self.gl['glDeleteVertexArrays'].assert_called_once()
+        self.second._drop_stale_indexed()
+        self.assertIsNone(self.second._indexed)
+        self.second._acquire_indexed()
+        self.assertEqual(self.upload.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,12 @@ Tests the performance of transform calculations with:
 - Cache effectiveness
 """
 
+import contextlib
+import gc
+import itertools
+import timeit
 import unittest
+from collections import deque
 import numpy as np
 import time
 
@@ -15,19 +20,58 @@ from src.primitives.sphere import Sphere
 from src.datatypes.pose import Pose
 
 
+@contextlib.contextmanager
+def _no_gc():
+    """Collect garbage up front and keep the collector off inside the block"""
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 class TestPerformance(unittest.TestCase):
 
-    def setUp(self):
-        """Create test poses"""
-        self.origin_pose = Pose(
+    @classmethod
+    def setUpClass(cls):
+        """Create test poses once; Sphere only reads them"""
+        cls.origin_pose = Pose(
             translation=np.array([[0], [0], [0]]),
             rotation=np.array([[0], [0], [0]])
         )
-        self.offset_pose = Pose(
+        cls.offset_pose = Pose(
             translation=np.array([[1], [0], [0]]),
             rotation=np.array([[0], [0], [0.1]])
         )
 
+        # Warm up the transform path once so no test times first-call setup
+        parent = Sphere(pose=cls.offset_pose, name="WarmupParent")
+        child = Sphere(pose=cls.offset_pose, name="WarmupChild")
+        parent.add_child(child)
+        child.get_world_transform()
+
+    def _bench(self, fn, number=200, repeat=3):
+        """
+        Time a callable with timeit.
+
+        A fixed call count keeps the module fast; the limits are loose enough
+        not to need timeit's calibrated loop counts.
+
+        Args:
+            fn: Zero-argument callable to time
+            number: Calls per timed run
+            repeat: Number of timed runs to take the best of
+
+        Returns:
+            Best time per call in seconds
+        """
+        timer = timeit.Timer(fn)
+        with _no_gc():
+            return min(timer.repeat(repeat=repeat, number=number)) / number
+
     def create_linear_hierarchy(self, depth):
         """Create a linear hierarchy (chain) of given depth"""
         objects = []
@@ -41,70 +85,59 @@ class TestPerformance(unittest.TestCase):
     def create_wide_hierarchy(self, width):
         """Create a flat hierarchy with one parent and many children"""
         parent = Sphere(pose=self.origin_pose, name="Parent")
-        children = []
-        for i in range(width):
-            child = Sphere(pose=self.offset_pose, name=f"Child{i}")
-            parent.add_child(child)
-            children.append(child)
+        children = [Sphere(pose=self.offset_pose, name=f"Child{i}") for i in range(width)]
+        parent.add_children(children)
         return parent, children
 
     def create_balanced_tree(self, depth, branching_factor):
         """Create a balanced tree hierarchy"""
-        def create_node(level, parent_name=""):
-            name = f"{parent_name}L{level}"
-            node = Sphere(pose=self.offset_pose, name=name)
-
+        root = Sphere(pose=self.offset_pose, name="L0")
+        queue = deque([(root, 0)])
+        while queue:
+            node, level = queue.popleft()
             if level < depth:
-                for i in range(branching_factor):
-                    child = create_node(level + 1, f"{name}_C{i}")
-                    node.add_child(child)
-
-            return node
-
-        return create_node(0)
-
-    def test_linear_hierarchy_depth_10(self):
-        """Test performance with depth=10 linear hierarchy"""
-        objects = self.create_linear_hierarchy(10)
-
-        start = time.perf_counter()
-        for _ in range(100):
-            objects[-1].get_world_transform()  # Get transform of deepest object
-        end = time.perf_counter()
-
-        elapsed = end - start
-        per_call = elapsed / 100 * 1000  # ms per call
-
-        print(f"\nLinear Hierarchy (depth=10): {per_call:.4f} ms per call")
-        self.assertLess(per_call, 10, "Transform calculation took too long")
-
-    def test_linear_hierarchy_depth_50(self):
-        """Test performance with depth=50 linear hierarchy"""
-        objects = self.create_linear_hierarchy(50)
-
-        start = time.perf_counter()
-        for _ in range(100):
-            objects[-1].get_world_transform()
-        end = time.perf_counter()
-
-        elapsed = end - start
-        per_call = elapsed / 100 * 1000
-
-        print(f"Linear Hierarchy (depth=50): {per_call:.4f} ms per call")
-        self.assertLess(per_call, 50, "Deep hierarchy took too long")
+                children = [
+                    Sphere(pose=self.offset_pose, name=f"{node.get_name()}_C{i}L{level + 1}")
+                    for i in range(branching_factor)
+                ]
+                node.add_children(children)
+                queue.extend((child, level + 1) for child in children)
+
+        return root
+
+    @staticmethod
+    def iter_nodes(root):
+        """Yield every node of a hierarchy, depth first"""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.get_children())
+
+    def test_linear_hierarchy(self):
+        """Test performance of the deepest object in linear hierarchies"""
+        # Allowed ms per call for each depth
+        limits = {10: 10, 50: 50}
+
+        for depth, limit in limits.items():
+            with self.subTest(depth=depth):
+                objects = self.create_linear_hierarchy(depth)
+
+                # Get transform of deepest object
+                per_call = self._bench(objects[-1].get_world_transform) * 1000  # ms per call
+
+                print(f"\nLinear Hierarchy (depth={depth}): {per_call:.4f} ms per call")
+                self.assertLess(per_call, limit, "Transform calculation took too long")
 
     def test_wide_hierarchy_100_children(self):
         """Test performance with 100 children"""
         parent, children = self.create_wide_hierarchy(100)
 
-        start = time.perf_counter()
-        for _ in range(100):
+        def transform_children():
             for child in children:
                 child.get_world_transform()
-        end = time.perf_counter()
 
-        elapsed = end - start
-        per_child = elapsed / (100 * 100) * 1000
+        per_child = self._bench(transform_children, number=20) / len(children) * 1000
 
         print(f"Wide Hierarchy (100 children): {per_child:.4f} ms per child")
         self.assertLess(per_child, 1, "Wide hierarchy took too long")
@@ -114,26 +147,19 @@ class TestPerformance(unittest.TestCase):
         objects = self.create_linear_hierarchy(20)
         leaf = objects[-1]
 
-        # First call (cache miss)
-        start = time.perf_counter()
-        for _ in range(100):
-            leaf._world_transform_dirty = True  # Force recalculation
+        def uncached():
+            leaf._world_transform_cache = None  # Force recalculation
             leaf.get_world_transform()
-        end = time.perf_counter()
-        uncached_time = end - start
 
-        # Second call (cache hit)
-        start = time.perf_counter()
-        for _ in range(100):
-            leaf.get_world_transform()  # Should use cache
-        end = time.perf_counter()
-        cached_time = end - start
+        # Cache miss, then cache hit
+        uncached_time = self._bench(uncached)
+        cached_time = self._bench(leaf.get_world_transform)
 
         speedup = uncached_time / cached_time if cached_time > 0 else float('inf')
 
         print(f"Cache speedup: {speedup:.1f}x faster")
-        print(f"  Uncached: {uncached_time*1000:.4f} ms")
-        print(f"  Cached:   {cached_time*1000:.4f} ms")
+        print(f"  Uncached: {uncached_time*1000:.4f} ms per call")
+        print(f"  Cached:   {cached_time*1000:.4f} ms per call")
 
         self.assertGreater(speedup, 10, "Cache should provide significant speedup")
 
@@ -143,26 +169,17 @@ class TestPerformance(unittest.TestCase):
         root = self.create_balanced_tree(depth=4, branching_factor=3)
 
         # Count total objects
-        def count_nodes(node):
-            count = 1
-            for child in node.get_children():
-                count += count_nodes(child)
-            return count
+        total_objects = sum(1 for _ in self.iter_nodes(root))
 
-        total_objects = count_nodes(root)
+        # Build the poses up front so only set_pose and propagation are timed
+        new_pose = Pose(
+            translation=np.array([[1], [2], [3]]),
+            rotation=np.array([[0.1], [0.2], [0.3]])
+        )
+        next_pose = itertools.cycle((new_pose, self.offset_pose)).__next__
 
         # Time how long it takes to update root and propagate
-        start = time.perf_counter()
-        for _ in range(100):
-            new_pose = Pose(
-                translation=np.array([[1], [2], [3]]),
-                rotation=np.array([[0.1], [0.2], [0.3]])
-            )
-            root.set_pose(new_pose)
-        end = time.perf_counter()
-
-        elapsed = end - start
-        per_update = elapsed / 100 * 1000
+        per_update = self._bench(lambda: root.set_pose(next_pose())) * 1000
 
         print(f"Update propagation ({total_objects} objects): {per_update:.4f} ms per update")
         self.assertLess(per_update, 10, "Update propagation too slow")
@@ -172,20 +189,13 @@ class TestPerformance(unittest.TestCase):
         root = self.create_balanced_tree(depth=4, branching_factor=3)
 
         # Get all leaf nodes
-        def get_leaves(node):
-            if not node.get_children():
-                return [node]
-            leaves = []
-            for child in node.get_children():
-                leaves.extend(get_leaves(child))
-            return leaves
-
-        leaves = get_leaves(root)
-
-        start = time.perf_counter()
-        for leaf in leaves:
-            leaf.get_world_transform()
-        end = time.perf_counter()
+        leaves = [node for node in self.iter_nodes(root) if not node.get_children()]
+
+        with _no_gc():
+            start = time.perf_counter()
+            for leaf in leaves:
+                leaf.get_world_transform()
+            end = time.perf_counter()
 
         elapsed = end - start
         per_leaf = elapsed / len(leaves) * 1000
@@ -195,18 +205,18 @@ class TestPerformance(unittest.TestCase):
 
     def test_create_hierarchy_performance(self):
         """Test performance of creating hierarchies"""
-        start = time.perf_counter()
-        for _ in range(100):
+        # Format the names up front so only construction and linking are timed
+        names = tuple(f"Obj{i}" for i in range(10))
+
+        def create_hierarchy():
             objects = []
-            for i in range(10):
-                obj = Sphere(pose=self.offset_pose, name=f"Obj{i}")
+            for i, name in enumerate(names):
+                obj = Sphere(pose=self.offset_pose, name=name)
                 objects.append(obj)
                 if i > 0:
                     objects[i-1].add_child(obj)
-        end = time.perf_counter()
 
-        elapsed = end - start
-        per_creation = elapsed / 100 * 1000
+        per_creation = self._bench(create_hierarchy, number=20) * 1000
 
         print(f"Hierarchy creation (depth=10): {per_creation:.4f} ms per hierarchy")
         self.assertLess(per_creation, 50, "Hierarchy creation too slow")
@@ -217,16 +227,14 @@ class TestPerformance(unittest.TestCase):
         parent2 = Sphere(pose=self.origin_pose, name="Parent2")
         child = Sphere(pose=self.offset_pose, name="Child")
 
-        start = time.perf_counter()
-        for i in range(1000):
-            if i % 2 == 0:
-                child.set_parent(parent1)
-            else:
-                child.set_parent(parent2)
-        end = time.perf_counter()
+        # Precomputed alternation keeps the timed loop free of branches and calls
+        parents = (parent1, parent2) * 500
 
-        elapsed = end - start
-        per_reparent = elapsed / 1000 * 1000
+        def reparent():
+            for parent in parents:
+                child.set_parent(parent)
+
+        per_reparent = self._bench(reparent, number=5) / len(parents) * 1000
 
         print(f"Reparenting: {per_reparent:.4f} ms per operation")
         self.assertLess(per_reparent, 1, "Reparenting too slow")
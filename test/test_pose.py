@@ -59,6 +59,43 @@ class TestPose(unittest.TestCase):
         pose.set_rotation(new_rotation)
         np.testing.assert_array_equal(pose.get_rotation(), new_rotation)
 
+    def test_flat_vectors(self):
+        # Flat vectors are accepted and stored as column vectors sharing the input data
+        translation = np.array([1.0, 2.0, 3.0])
+        pose = Pose(translation=translation, rotation=np.array([0.0, 0.0, 1.0]))
+        np.testing.assert_array_equal(pose.get_translation(), np.array([[1], [2], [3]]))
+        np.testing.assert_array_equal(pose.get_rotation(), np.array([[0], [0], [1]]))
+        self.assertTrue(np.shares_memory(pose.get_translation(), translation))
+
+        pose.set_rotation(np.array([1.0, 0.0, 0.0]))
+        np.testing.assert_array_equal(pose.get_rotation(), np.array([[1], [0], [0]]))
+        with self.assertRaises(ValueError):
+            pose.set_translation(np.array([1.0, 2.0]))
+
+    def test_is_identity(self):
+        # Only a pose without translation and rotation is the identity
+        self.assertTrue(Pose(translation=np.zeros((3, 1)), rotation=np.zeros((3, 1))).is_identity())
+        self.assertFalse(Pose(translation=np.array([[1], [0], [0]]), rotation=np.zeros((3, 1))).is_identity())
+        self.assertFalse(Pose(translation=np.zeros((3, 1)), rotation=np.array([[0], [0], [1]])).is_identity())
+
+    def test_json_round_trip(self):
+        # Poses dump to nested lists and validate back to column vectors
+        pose = Pose(translation=np.array([[1.0], [2.0], [3.0]]), rotation=np.array([[0.0], [0.0], [0.5]]))
+        dumped = pose.model_dump_json()
+        self.assertEqual(dumped, '{"translation":[[1.0],[2.0],[3.0]],"rotation":[[0.0],[0.0],[0.5]]}')
+
+        restored = Pose.model_validate_json(dumped)
+        self.assertIsInstance(restored.translation, np.ndarray)
+        np.testing.assert_array_equal(restored.get_translation(), pose.get_translation())
+        np.testing.assert_array_equal(restored.get_rotation(), pose.get_rotation())
+
+        # Python mode keeps the arrays
+        self.assertIsInstance(pose.model_dump()['rotation'], np.ndarray)
+
+        schema = Pose.model_json_schema()
+        self.assertEqual(schema['properties']['translation']['minItems'], 3)
+        self.assertEqual(schema['properties']['rotation']['maxItems'], 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,10 +20,7 @@ class TestPoseQuat(unittest.TestCase):
         np.testing.assert_array_almost_equal(pose.translation, np.zeros((3, 1)))
 
         # Check quaternion is identity
-        self.assertAlmostEqual(pose.quaternion.w, 1.0)
-        self.assertAlmostEqual(pose.quaternion.x, 0.0)
-        self.assertAlmostEqual(pose.quaternion.y, 0.0)
-        self.assertAlmostEqual(pose.quaternion.z, 0.0)
+        np.testing.assert_allclose(pose.quaternion.as_array(), [1.0, 0.0, 0.0, 0.0], rtol=0, atol=5e-8)
 
     def test_from_translation_quaternion(self):
         """Test creating pose from translation and quaternion"""
@@ -33,8 +30,7 @@ class TestPoseQuat(unittest.TestCase):
         pose = PoseQuat.from_translation_quaternion(translation, quat)
 
         np.testing.assert_array_almost_equal(pose.translation, translation)
-        self.assertAlmostEqual(pose.quaternion.w, quat.w)
-        self.assertAlmostEqual(pose.quaternion.z, quat.z)
+        np.testing.assert_allclose(pose.quaternion.as_array(), quat.as_array(), rtol=0, atol=5e-8)
 
     def test_from_translation_axis_angle(self):
         """Test creating pose from translation and axis-angle"""
@@ -49,8 +45,7 @@ class TestPoseQuat(unittest.TestCase):
         # Check quaternion represents 90° around Z
         expected_w = math.cos(np.pi / 4)
         expected_z = math.sin(np.pi / 4)
-        self.assertAlmostEqual(pose.quaternion.w, expected_w, places=5)
-        self.assertAlmostEqual(pose.quaternion.z, expected_z, places=5)
+        np.testing.assert_allclose(pose.quaternion.as_array(), [expected_w, 0.0, 0.0, expected_z], rtol=0, atol=5e-6)
 
     def test_from_translation_euler(self):
         """Test creating pose from translation and Euler angles"""
@@ -85,8 +80,7 @@ class TestPoseQuat(unittest.TestCase):
         pose.set_quaternion(new_quat)
 
         retrieved_quat = pose.get_quaternion()
-        self.assertAlmostEqual(retrieved_quat.w, new_quat.w)
-        self.assertAlmostEqual(retrieved_quat.x, new_quat.x)
+        np.testing.assert_allclose(retrieved_quat.as_array(), new_quat.as_array(), rtol=0, atol=5e-8)
 
         # Test shorthand
         self.assertAlmostEqual(pose.q().w, new_quat.w)
@@ -101,6 +95,11 @@ class TestPoseQuat(unittest.TestCase):
         expected = np.array([[1.0], [2.0], [3.0], [1.0]])
         np.testing.assert_array_almost_equal(homogeneous, expected)
 
+        # Writing into a caller-owned buffer returns that buffer
+        out = np.zeros((4, 1))
+        self.assertIs(pose.get_translation_as_homogeneous(out=out), out)
+        np.testing.assert_array_almost_equal(out, expected)
+
     def test_to_matrix(self):
         """Test conversion to transformation matrix"""
         translation = np.array([[1.0], [2.0], [3.0]])
@@ -160,8 +159,7 @@ class TestPoseQuat(unittest.TestCase):
         # Check rotation converts correctly
         expected_w = math.cos(np.pi / 4)
         expected_z = math.sin(np.pi / 4)
-        self.assertAlmostEqual(pose_quat.quaternion.w, expected_w, places=5)
-        self.assertAlmostEqual(pose_quat.quaternion.z, expected_z, places=5)
+        np.testing.assert_allclose(pose_quat.quaternion.as_array(), [expected_w, 0.0, 0.0, expected_z], rtol=0, atol=5e-6)
 
     def test_interpolate_slerp_endpoints(self):
         """Test SLERP interpolation at endpoints"""
@@ -208,8 +206,7 @@ class TestPoseQuat(unittest.TestCase):
 
         # Rotation should be 45° (middle of 0° to 90°)
         expected_quat = Quaternion.from_axis_angle(np.array([[0], [0], [1]]), np.pi/4)
-        self.assertAlmostEqual(result.quaternion.w, expected_quat.w, places=4)
-        self.assertAlmostEqual(result.quaternion.z, expected_quat.z, places=4)
+        np.testing.assert_allclose(result.quaternion.as_array(), expected_quat.as_array(), rtol=0, atol=5e-5)
 
     def test_interpolate_lerp(self):
         """Test LERP interpolation"""
@@ -228,8 +225,8 @@ class TestPoseQuat(unittest.TestCase):
 
         # Quaternion should be interpolated (different from SLERP result)
         # Just check it's valid
-        quat_norm = math.sqrt(result.quaternion.w**2 + result.quaternion.x**2 +
-                              result.quaternion.y**2 + result.quaternion.z**2)
+        w, x, y, z = result.quaternion.as_array().tolist()
+        quat_norm = math.sqrt(w*w + x*x + y*y + z*z)
         self.assertAlmostEqual(quat_norm, 1.0, places=5)
 
     def test_interpolate_invalid_method(self):
@@ -244,6 +241,17 @@ class TestPoseQuat(unittest.TestCase):
         with self.assertRaises(ValueError):
             pose1.interpolate(pose2, 0.5, method='invalid')
 
+    def test_json_round_trip(self):
+        """Test JSON dump and validation round trip"""
+        quat = Quaternion.from_axis_angle(np.array([[0], [0], [1]]), np.pi/2)
+        pose = PoseQuat.from_translation_quaternion(np.array([[1.0], [2.0], [3.0]]), quat)
+
+        restored = PoseQuat.model_validate_json(pose.model_dump_json())
+
+        self.assertIsInstance(restored.translation, np.ndarray)
+        np.testing.assert_array_equal(restored.translation, pose.translation)
+        np.testing.assert_array_equal(restored.quaternion.as_array(), quat.as_array())
+
     def test_repr(self):
         """Test string representation"""
         translation = np.array([[1.5], [2.5], [3.5]])
@@ -257,6 +265,7 @@ class TestPoseQuat(unittest.TestCase):
         self.assertIn("2.500", repr_str)
         self.assertIn("3.500", repr_str)
         self.assertIn("PoseQuat", repr_str)
+        self.assertIn("q=Quaternion(w=1.0000, x=0.0000, y=0.0000, z=0.0000)", repr_str)
 
     def test_round_trip_conversion(self):
         """Test converting Pose -> PoseQuat -> Pose preserves values"""
@@ -6,7 +6,7 @@ import unittest
 import numpy as np
 import math
 
-from src.datatypes.quaternion import Quaternion, slerp, lerp
+from src.datatypes.quaternion import Quaternion, slerp, slerp_batch, lerp
 
 
 class TestQuaternion(unittest.TestCase):
@@ -14,18 +14,12 @@ class TestQuaternion(unittest.TestCase):
     def test_identity_quaternion(self):
         """Test identity quaternion creation"""
         q = Quaternion.identity()
-        self.assertAlmostEqual(q.w, 1.0)
-        self.assertAlmostEqual(q.x, 0.0)
-        self.assertAlmostEqual(q.y, 0.0)
-        self.assertAlmostEqual(q.z, 0.0)
+        np.testing.assert_allclose(q.as_array(), [1.0, 0.0, 0.0, 0.0], rtol=0, atol=5e-8)
 
     def test_quaternion_creation(self):
         """Test basic quaternion creation"""
         q = Quaternion(w=0.5, x=0.5, y=0.5, z=0.5)
-        self.assertAlmostEqual(q.w, 0.5)
-        self.assertAlmostEqual(q.x, 0.5)
-        self.assertAlmostEqual(q.y, 0.5)
-        self.assertAlmostEqual(q.z, 0.5)
+        np.testing.assert_allclose(q.as_array(), [0.5, 0.5, 0.5, 0.5], rtol=0, atol=5e-8)
 
     def test_from_axis_angle_90deg_z(self):
         """Test quaternion from 90° rotation around Z-axis"""
@@ -38,10 +32,18 @@ class TestQuaternion(unittest.TestCase):
         expected_w = math.cos(np.pi / 4)
         expected_z = math.sin(np.pi / 4)
 
-        self.assertAlmostEqual(q.w, expected_w, places=5)
-        self.assertAlmostEqual(q.x, 0.0, places=5)
-        self.assertAlmostEqual(q.y, 0.0, places=5)
-        self.assertAlmostEqual(q.z, expected_z, places=5)
+        np.testing.assert_allclose(q.as_array(), [expected_w, 0.0, 0.0, expected_z], rtol=0, atol=5e-6)
+
+    def test_from_axis_angle_repeated(self):
+        """Test that repeated conversions return independent quaternions"""
+        axis = np.array([[0], [1], [1]])
+        q1 = Quaternion.from_axis_angle(axis, 0.4)
+        q2 = Quaternion.from_axis_angle(axis, 0.4)
+
+        np.testing.assert_array_equal(q1.data, q2.data)
+        q1.data[0, 0] = 0.0
+        self.assertAlmostEqual(q2.w, math.cos(0.2))
+        self.assertAlmostEqual(Quaternion.from_axis_angle(axis, 0.4).w, math.cos(0.2))
 
     def test_from_axis_angle_vector(self):
         """Test quaternion from axis-angle vector"""
@@ -52,8 +54,7 @@ class TestQuaternion(unittest.TestCase):
         expected_w = math.cos(np.pi / 4)
         expected_z = math.sin(np.pi / 4)
 
-        self.assertAlmostEqual(q.w, expected_w, places=5)
-        self.assertAlmostEqual(q.z, expected_z, places=5)
+        np.testing.assert_allclose(q.as_array(), [expected_w, 0.0, 0.0, expected_z], rtol=0, atol=5e-6)
 
     def test_to_axis_angle(self):
         """Test conversion to axis-angle"""
@@ -70,6 +71,21 @@ class TestQuaternion(unittest.TestCase):
         # Check axis (should be [0, 0, 1])
         np.testing.assert_array_almost_equal(axis_out, axis_in, decimal=5)
 
+    def test_to_axis_angle_vector(self):
+        """Test axis-angle vector matches the scaled axis-angle pair"""
+        quats = [
+            Quaternion(w=0.5, x=0.5, y=0.5, z=0.5),
+            Quaternion(w=-0.3, x=0.1, y=-0.8, z=0.2),  # Not normalized, angle > 180°
+            Quaternion.from_axis_angle(np.array([[1], [2], [3]]), 1e-6),
+            Quaternion.identity(),
+            Quaternion(w=-1.0, x=0.0, y=0.0, z=0.0),
+        ]
+        for q in quats:
+            axis, angle = q.to_axis_angle()
+            vec = q.to_axis_angle_vector()
+            self.assertEqual(vec.shape, (3, 1))
+            np.testing.assert_allclose(vec, axis * angle, rtol=1e-9, atol=1e-12)
+
     def test_to_rotation_matrix_identity(self):
         """Test identity quaternion gives identity matrix"""
         q = Quaternion.identity()
@@ -90,6 +106,17 @@ class TestQuaternion(unittest.TestCase):
 
         np.testing.assert_array_almost_equal(R, expected, decimal=5)
 
+    def test_to_rotation_matrix_out(self):
+        """Test writing the rotation matrix into a provided buffer"""
+        q = Quaternion(w=2.0, x=0.3, y=-0.4, z=1.0)
+        buffer = np.zeros((4, 4))
+
+        result = q.to_rotation_matrix(out=buffer[0:3, 0:3])
+
+        np.testing.assert_array_almost_equal(buffer[0:3, 0:3], q.to_rotation_matrix())
+        np.testing.assert_array_almost_equal(buffer[0:3, 0:3] @ buffer[0:3, 0:3].T, np.eye(3))
+        self.assertTrue(np.shares_memory(result, buffer))
+
     def test_normalize(self):
         """Test quaternion normalization"""
         q = Quaternion(w=1.0, x=1.0, y=1.0, z=1.0)
@@ -99,15 +126,43 @@ class TestQuaternion(unittest.TestCase):
         magnitude = math.sqrt(q_norm.w**2 + q_norm.x**2 + q_norm.y**2 + q_norm.z**2)
         self.assertAlmostEqual(magnitude, 1.0, places=10)
 
+    def test_fast_renormalize(self):
+        """Test that renormalizing a slightly drifted quaternion restores unit length"""
+        q = Quaternion.from_axis_angle(np.array([1.0, 2.0, 3.0]), 0.8)
+        drifted = Quaternion.from_array(q.data * 1.001)
+        q_norm = drifted.fast_renormalize()
+
+        magnitude = math.sqrt(q_norm.w**2 + q_norm.x**2 + q_norm.y**2 + q_norm.z**2)
+        self.assertAlmostEqual(magnitude, 1.0, places=5)
+        np.testing.assert_array_almost_equal(q_norm.data, q.data, decimal=5)
+
+    def test_as_array(self):
+        """Test flat component view"""
+        q = Quaternion(w=0.1, x=0.2, y=0.3, z=0.4)
+        arr = q.as_array()
+
+        self.assertEqual(arr.shape, (4,))
+        np.testing.assert_array_equal(arr, [0.1, 0.2, 0.3, 0.4])
+
+    def test_json_round_trip(self):
+        """Test JSON dump and validation round trip"""
+        q = Quaternion(w=1.0)
+        dumped = q.model_dump_json()
+        self.assertEqual(dumped, '{"data":[[1.0],[0.0],[0.0],[0.0]]}')
+
+        restored = Quaternion.model_validate_json(dumped)
+        self.assertIsInstance(restored.data, np.ndarray)
+        np.testing.assert_array_equal(restored.as_array(), q.as_array())
+
+        schema = Quaternion.model_json_schema()
+        self.assertEqual(schema['properties']['data']['minItems'], 4)
+
     def test_conjugate(self):
         """Test quaternion conjugate"""
         q = Quaternion(w=0.5, x=0.5, y=0.5, z=0.5)
         q_conj = q.conjugate()
 
-        self.assertAlmostEqual(q_conj.w, 0.5)
-        self.assertAlmostEqual(q_conj.x, -0.5)
-        self.assertAlmostEqual(q_conj.y, -0.5)
-        self.assertAlmostEqual(q_conj.z, -0.5)
+        np.testing.assert_allclose(q_conj.as_array(), [0.5, -0.5, -0.5, -0.5], rtol=0, atol=5e-8)
 
     def test_inverse(self):
         """Test quaternion inverse"""
@@ -117,10 +172,7 @@ class TestQuaternion(unittest.TestCase):
         # q * q^-1 should give identity
         result = q * q_inv
 
-        self.assertAlmostEqual(result.w, 1.0, places=5)
-        self.assertAlmostEqual(result.x, 0.0, places=5)
-        self.assertAlmostEqual(result.y, 0.0, places=5)
-        self.assertAlmostEqual(result.z, 0.0, places=5)
+        np.testing.assert_allclose(result.as_array(), [1.0, 0.0, 0.0, 0.0], rtol=0, atol=5e-6)
 
     def test_multiplication(self):
         """Test quaternion multiplication"""
@@ -133,10 +185,22 @@ class TestQuaternion(unittest.TestCase):
         # Should equal 180° rotation around Z
         expected = Quaternion.from_axis_angle(np.array([[0], [0], [1]]), np.pi)
 
-        self.assertAlmostEqual(result.w, expected.w, places=5)
-        self.assertAlmostEqual(result.x, expected.x, places=5)
-        self.assertAlmostEqual(result.y, expected.y, places=5)
-        self.assertAlmostEqual(result.z, expected.z, places=5)
+        np.testing.assert_allclose(result.as_array(), expected.as_array(), rtol=0, atol=5e-6)
+
+    def test_mul_batch(self):
+        """Test batched Hamilton products match the scalar operator"""
+        rng = np.random.default_rng(3)
+        p = rng.normal(size=(5, 4))
+        q = rng.normal(size=(5, 4))
+
+        batch = Quaternion.mul_batch(p, q)
+        for row, p_row, q_row in zip(batch, p, q):
+            expected = Quaternion.from_array(p_row) * Quaternion.from_array(q_row)
+            np.testing.assert_array_almost_equal(row, expected.data.ravel())
+
+        # A single right factor is broadcast against every row
+        broadcast = Quaternion.mul_batch(p, q[0])
+        np.testing.assert_array_almost_equal(broadcast, Quaternion.mul_batch(p, np.tile(q[0], (5, 1))))
 
     def test_rotate_vector(self):
         """Test vector rotation"""
@@ -152,6 +216,16 @@ class TestQuaternion(unittest.TestCase):
 
         np.testing.assert_array_almost_equal(rotated, expected, decimal=5)
 
+    def test_rotate_vectors(self):
+        """Test batched vector rotation matches the rotation matrix"""
+        q = Quaternion.from_axis_angle(np.array([[1], [2], [3]]), 0.7)
+        vectors = np.array([[1, 0, 0], [0, 1, 0], [0.5, -2, 3]])
+
+        rotated = q.rotate_vectors(vectors)
+
+        np.testing.assert_array_almost_equal(rotated, vectors @ q.to_rotation_matrix().T)
+        np.testing.assert_array_almost_equal(rotated[2:].T, q.rotate_vector(vectors[2]))
+
     def test_dot_product(self):
         """Test quaternion dot product"""
         q1 = Quaternion(w=1.0, x=0.0, y=0.0, z=0.0)
@@ -171,10 +245,7 @@ class TestQuaternion(unittest.TestCase):
 
         result = slerp(q1, q2, 0.0)
 
-        self.assertAlmostEqual(result.w, q1.w, places=5)
-        self.assertAlmostEqual(result.x, q1.x, places=5)
-        self.assertAlmostEqual(result.y, q1.y, places=5)
-        self.assertAlmostEqual(result.z, q1.z, places=5)
+        np.testing.assert_allclose(result.as_array(), q1.as_array(), rtol=0, atol=5e-6)
 
     def test_slerp_end(self):
         """Test SLERP at t=1 returns end quaternion"""
@@ -183,10 +254,7 @@ class TestQuaternion(unittest.TestCase):
 
         result = slerp(q1, q2, 1.0)
 
-        self.assertAlmostEqual(result.w, q2.w, places=5)
-        self.assertAlmostEqual(result.x, q2.x, places=5)
-        self.assertAlmostEqual(result.y, q2.y, places=5)
-        self.assertAlmostEqual(result.z, q2.z, places=5)
+        np.testing.assert_allclose(result.as_array(), q2.as_array(), rtol=0, atol=5e-6)
 
     def test_slerp_middle(self):
         """Test SLERP at t=0.5 gives middle rotation"""
@@ -197,8 +265,20 @@ class TestQuaternion(unittest.TestCase):
         result = slerp(q1, q2, 0.5)
         expected = Quaternion.from_axis_angle(np.array([[0], [0], [1]]), np.pi/4)
 
-        self.assertAlmostEqual(result.w, expected.w, places=4)
-        self.assertAlmostEqual(result.z, expected.z, places=4)
+        np.testing.assert_allclose(result.as_array(), expected.as_array(), rtol=0, atol=5e-5)
+
+    def test_slerp_batch(self):
+        """Test batched SLERP matches SLERP at each parameter"""
+        q1 = Quaternion.from_axis_angle(np.array([[0], [0], [1]]), 0.3)
+        ts = np.array([-0.5, 0.0, 0.25, 0.5, 1.0, 1.5])
+
+        # Distant rotations (negative dot product) and nearly equal ones
+        for q2 in (Quaternion.from_axis_angle(np.array([[1], [1], [0]]), -2.5),
+                   Quaternion.from_axis_angle(np.array([[0], [0], [1]]), 0.3001)):
+            batch = slerp_batch(q1, q2, ts)
+            self.assertEqual(batch.shape, (len(ts), 4))
+            for row, t in zip(batch, ts):
+                np.testing.assert_array_almost_equal(row, slerp(q1, q2, t).data.ravel())
 
     def test_lerp(self):
         """Test linear interpolation"""
@@ -213,16 +293,12 @@ class TestQuaternion(unittest.TestCase):
         self.assertAlmostEqual(result_0.w, q1.w, places=4)
 
         # At t=1, should be close to q2
-        self.assertAlmostEqual(result_1.w, q2.w, places=4)
-        self.assertAlmostEqual(result_1.z, q2.z, places=4)
+        np.testing.assert_allclose(result_1.as_array(), q2.as_array(), rtol=0, atol=5e-5)
 
     def test_from_euler_identity(self):
         """Test Euler angles (0,0,0) gives identity"""
         q = Quaternion.from_euler(0.0, 0.0, 0.0)
-        self.assertAlmostEqual(q.w, 1.0, places=5)
-        self.assertAlmostEqual(q.x, 0.0, places=5)
-        self.assertAlmostEqual(q.y, 0.0, places=5)
-        self.assertAlmostEqual(q.z, 0.0, places=5)
+        np.testing.assert_allclose(q.as_array(), [1.0, 0.0, 0.0, 0.0], rtol=0, atol=5e-6)
 
     def test_euler_round_trip(self):
         """Test converting to/from Euler angles"""
@@ -237,6 +313,31 @@ class TestQuaternion(unittest.TestCase):
         self.assertAlmostEqual(pitch_out, pitch_in, places=5)
         self.assertAlmostEqual(yaw_out, yaw_in, places=5)
 
+    def test_from_axis_angle_batch(self):
+        """Test batched axis-angle conversion matches the scalar one"""
+        axes = np.array([[0, 0, 1], [1, 1, 0], [0, 0, 0], [2, 0, 0]], dtype=float)
+        angles = np.array([np.pi / 2, 0.3, 1.0, -0.7])
+
+        batch = Quaternion.from_axis_angle_batch(axes, angles)
+
+        self.assertEqual(batch.shape, (4, 4))
+        for row, axis, angle in zip(batch, axes, angles):
+            expected = Quaternion.from_axis_angle(axis, angle)
+            np.testing.assert_array_almost_equal(row, expected.data.ravel())
+
+    def test_from_euler_batch(self):
+        """Test batched Euler conversion matches the scalar one"""
+        roll = np.array([0.0, 0.3, -1.2])
+        pitch = np.array([0.0, 0.5, 0.4])
+        yaw = np.array([0.0, 0.7, 2.5])
+
+        batch = Quaternion.from_euler_batch(roll, pitch, yaw)
+
+        self.assertEqual(batch.shape, (3, 4))
+        for row, angles in zip(batch, zip(roll, pitch, yaw)):
+            expected = Quaternion.from_euler(*angles)
+            np.testing.assert_array_almost_equal(row, expected.data.ravel())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+"""
+Unit tests for scene redraw tracking.
+"""
+
+import unittest
+from unittest import mock
+import numpy as np
+
+from src.rendering.scene import Scene
+from src.primitives.opengl_primitives_wrapper import OpenGLPrimitivesWrapper
+from src.primitives.sphere import Sphere
+from src.datatypes.material import MaterialPresets
+from src.datatypes.pose import Pose
+
+
+class TestSceneRedraw(unittest.TestCase):
+
+    def setUp(self):
+        """Create a scene with one sphere; drawing is stubbed since there is no GL context"""
+        patcher = mock.patch.object(OpenGLPrimitivesWrapper, 'draw_instances')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.sphere = Sphere(pose=Pose(translation=np.zeros((3, 1)), rotation=np.zeros((3, 1))))
+        self.scene = Scene()
+        self.scene.add(self.sphere)
+        self.scene.render()
+
+    def test_no_redraw_without_changes(self):
+        """Test that an unchanged scene is not redrawn"""
+        self.assertFalse(self.scene.needs_redraw())
+
+    def test_redraw_after_pose_change(self):
+        """Test that moving an object triggers a redraw"""
+        self.sphere.set_pose(Pose(translation=np.array([[1.0], [0.0], [0.0]]),
+                                  rotation=np.zeros((3, 1))))
+        self.assertTrue(self.scene.needs_redraw())
+
+    def test_redraw_after_material_change(self):
+        """Test that the material setters trigger a redraw"""
+        self.sphere.set_color([0.0, 1.0, 0.0, 1.0])
+        self.assertTrue(self.scene.needs_redraw())
+        self.scene.render()
+        self.assertFalse(self.scene.needs_redraw())
+
+        self.sphere.set_material(MaterialPresets.gold())
+        self.assertTrue(self.scene.needs_redraw())
+
+
+if __name__ == '__main__':
+    unittest.main()
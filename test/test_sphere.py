@@ -0,0 +1,64 @@
+"""
+Unit tests for the icosphere mesh generation.
+"""
+
+import unittest
+import numpy as np
+
+from src.primitives import sphere as sphere_module
+from src.primitives.sphere import Sphere
+from src.datatypes.pose import Pose
+
+
+class TestSphere(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared pose once; no test modifies it"""
+        cls.pose = Pose(translation=np.zeros((3, 1)), rotation=np.zeros((3, 1)))
+
+    def test_mesh_size(self):
+        """Test vertex and face counts of a closed icosphere"""
+        for subdivision in range(4):
+            with self.subTest(subdivision=subdivision):
+                sphere = Sphere(pose=self.pose, radius=2.0, subdivision=subdivision)
+                vertex_array, normal_array, indices = sphere.get_indexed_mesh()
+
+                # Every level adds one vertex per edge and splits each face into four
+                n_vertices = 2 + 10 * 4 ** subdivision
+                n_faces = 20 * 4 ** subdivision
+                self.assertEqual(len(vertex_array), n_vertices)
+                self.assertEqual(len(normal_array), n_vertices)
+                self.assertEqual(len(indices[0]), 3 * n_faces)
+                self.assertEqual(len(sphere.get_vertices()[0]), 3 * n_faces)
+
+                # All indices refer to generated vertices, and every vertex is used
+                np.testing.assert_array_equal(np.unique(indices[0]), np.arange(n_vertices))
+
+    def test_mesh_cache_is_bounded(self):
+        """Test that the shared mesh cache evicts the least recently used mesh"""
+        Sphere._mesh_cache.clear()
+        self.addCleanup(Sphere._mesh_cache.clear)
+        first = Sphere(pose=self.pose, radius=1.0, subdivision=0)
+        for i in range(sphere_module._MESH_CACHE_SIZE - 1):
+            Sphere(pose=self.pose, radius=2.0 + i, subdivision=0)
+        # Using the first mesh again keeps it when the next one is added
+        Sphere(pose=self.pose, radius=1.0, subdivision=0)
+        Sphere(pose=self.pose, radius=100.0, subdivision=0)
+
+        self.assertEqual(len(Sphere._mesh_cache), sphere_module._MESH_CACHE_SIZE)
+        self.assertIn((0, 1.0), Sphere._mesh_cache)
+        self.assertNotIn((0, 2.0), Sphere._mesh_cache)
+        self.assertIs(Sphere(pose=self.pose, radius=1.0, subdivision=0).interleaved, first.interleaved)
+
+    def test_vertices_on_sphere(self):
+        """Test that vertices lie on the sphere and normals have unit length"""
+        sphere = Sphere(pose=self.pose, radius=2.0, subdivision=2)
+        vertex_array, normal_array, _ = sphere.get_indexed_mesh()
+
+        np.testing.assert_allclose(np.linalg.norm(normal_array, axis=1), 1.0, rtol=1e-6)
+        np.testing.assert_allclose(np.linalg.norm(vertex_array, axis=1), 2.0, rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
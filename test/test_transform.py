@@ -9,6 +9,13 @@ from src.datatypes import transform
 
 class TestTransform(unittest.TestCase):
 
+    def test_col3(self):
+        """Test building a float column vector from scalars"""
+        v = transform.col3(1, 2.5, -3)
+        self.assertEqual(v.shape, (3, 1))
+        self.assertEqual(v.dtype, np.float64)
+        np.testing.assert_array_equal(v, np.array([[1.0], [2.5], [-3.0]]))
+
     def test_axis_angle_to_rotation_matrix_identity(self):
         """Test that zero rotation gives identity matrix"""
         axis_angle = np.array([[0], [0], [0]])
@@ -159,6 +166,33 @@ class TestTransform(unittest.TestCase):
         expected = np.array([[3], [2], [3], [1]])
         np.testing.assert_array_almost_equal(result, expected)
 
+    def test_pose_to_matrix_out(self):
+        """Test that writing into a preallocated matrix matches the allocating path"""
+        pose = Pose(
+            translation=np.array([[1], [2], [3]]),
+            rotation=np.array([[0.3], [-0.2], [0.5]])
+        )
+        scaling = Scaling(x=2.0, y=0.5, z=3.0)
+        out = np.full((4, 4), np.nan)
+
+        result = transform.pose_to_matrix(pose, scaling, out=out)
+
+        self.assertIs(result, out)
+        np.testing.assert_array_almost_equal(out, transform.pose_to_matrix(pose, scaling))
+
+    def test_propagate_world_transforms(self):
+        """Test batched propagation against chained matrix products"""
+        rng = np.random.default_rng(0)
+        locals_ = rng.standard_normal((5, 4, 4))
+        parents = np.array([-1, 0, 0, 1, -1], dtype=np.int32)
+
+        worlds = transform.propagate_world_transforms(parents, locals_, np.empty_like(locals_))
+
+        np.testing.assert_array_almost_equal(worlds[0], locals_[0])
+        np.testing.assert_array_almost_equal(worlds[2], locals_[0] @ locals_[2])
+        np.testing.assert_array_almost_equal(worlds[3], locals_[0] @ locals_[1] @ locals_[3])
+        np.testing.assert_array_almost_equal(worlds[4], locals_[4])
+
     def test_decompose_matrix(self):
         """Test matrix decomposition"""
         translation = np.array([[1], [2], [3]])
@@ -181,6 +215,19 @@ class TestTransform(unittest.TestCase):
         # Check rotation is identity (within tolerance)
         np.testing.assert_array_almost_equal(r, np.eye(3))
 
+    def test_decompose_mirrored_matrix(self):
+        """Test that a mirroring scale decomposes into a proper rotation"""
+        translation = np.array([[1], [2], [3]])
+        rotation = np.array([[0.2], [-0.5], [0.9]])
+        scaling = Scaling(x=-2.0, y=3.0, z=0.5)
+        M = transform.compose_transform(translation, rotation, scaling)
+
+        t, r, s = transform.decompose_matrix(M)
+
+        np.testing.assert_array_almost_equal(s, np.array([[-2.0], [3.0], [0.5]]))
+        np.testing.assert_array_almost_equal(r, transform.axis_angle_to_rotation_matrix(rotation))
+        self.assertAlmostEqual(np.linalg.det(r), 1.0)
+
     def test_full_transform_chain(self):
         """Test complete transformation chain with known values"""
         # Create a transformation: translate (10, 0, 0), rotate 90° Z, scale 2x in Y